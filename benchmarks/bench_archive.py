@@ -0,0 +1,85 @@
+"""
+Times a month of nightly runs merged into a JobArchive against keeping the history
+as one CSV that is reloaded into pandas to find the jobs new since the last run.
+
+    python benchmarks/bench_archive.py --runs 30 --jobs-per-run 5000 --new-rate 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.archive import JobArchive
+from benchmarks.bench_frame_builder import make_rows
+
+
+def make_runs(runs: int, jobs_per_run: int, new_rate: float) -> list[pd.DataFrame]:
+    """
+    Nightly results: each run drops the oldest postings and adds new_rate new ones
+    """
+    new_per_run = int(jobs_per_run * new_rate)
+    rows = make_rows(jobs_per_run + new_per_run * (runs - 1))
+    return [
+        pd.DataFrame(rows[run * new_per_run : run * new_per_run + jobs_per_run])
+        for run in range(runs)
+    ]
+
+
+def csv_new_jobs(history_path: str, jobs: pd.DataFrame) -> pd.DataFrame:
+    history = pd.read_csv(history_path)
+    new = jobs[~jobs["id"].isin(history["id"])]
+    new.to_csv(
+        history_path, mode="a", header=False, index=False, quoting=csv.QUOTE_NONNUMERIC
+    )
+    return new
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--jobs-per-run", type=int, default=5_000)
+    parser.add_argument("--new-rate", type=float, default=0.2)
+    args = parser.parse_args()
+
+    runs = make_runs(args.runs, args.jobs_per_run, args.new_rate)
+    start = datetime(2024, 1, 1, 3, tzinfo=timezone.utc)
+    with tempfile.TemporaryDirectory() as directory:
+        archive = JobArchive(os.path.join(directory, "jobs.sqlite"))
+        history_path = os.path.join(directory, "history.csv")
+        runs[0].to_csv(history_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+        archive.add_run(runs[0], seen_at=start)
+
+        merge_seconds = query_seconds = csv_seconds = 0.0
+        for night, jobs in enumerate(runs[1:], start=1):
+            began = time.perf_counter()
+            run_id = archive.add_run(jobs, seen_at=start + timedelta(days=night))
+            merged = time.perf_counter()
+            new = archive.new_jobs(run_id)
+            queried = time.perf_counter()
+            expected = csv_new_jobs(history_path, jobs)
+            csv_seconds += time.perf_counter() - queried
+            merge_seconds += merged - began
+            query_seconds += queried - merged
+            if sorted(new["key"]) != sorted(expected["id"]):
+                raise AssertionError(f"run {run_id}: new jobs differ from the CSV diff")
+        nights = len(runs) - 1
+        print(f"{args.runs} runs of {args.jobs_per_run} jobs, {len(archive)} archived")
+        print(f"{'per night':>28} {'ms':>8}")
+        print(f"{'archive add_run':>28} {merge_seconds / nights * 1000:>8.1f}")
+        print(f"{'archive new_jobs':>28} {query_seconds / nights * 1000:>8.1f}")
+        print(f"{'CSV reload + diff + append':>28} {csv_seconds / nights * 1000:>8.1f}")
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
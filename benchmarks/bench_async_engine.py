@@ -0,0 +1,109 @@
+"""
+Times a batch of searches against the offline replay server: one scrape_jobs call
+per search (thread engine) against all searches gathered on one event loop with
+async_scrape_jobs.
+
+    python benchmarks/bench_async_engine.py --searches 10 --latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy import async_scrape_jobs, scrape_jobs
+from benchmarks.fixtures import synthetic_store
+from benchmarks.replay import ReplayServer
+
+
+class PeakThreads:
+    """
+    Samples the number of client threads in the background and keeps the maximum,
+    leaving out the replay server's per-connection threads
+    """
+
+    def __init__(self):
+        self.peak = self.count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    @staticmethod
+    def count() -> int:
+        return sum(
+            "process_request_thread" not in thread.name
+            for thread in threading.enumerate()
+        )
+
+    def _sample(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, self.count())
+
+    def __enter__(self) -> "PeakThreads":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_threaded(terms: list[str], **kwargs) -> int:
+    return sum(len(scrape_jobs(search_term=term, **kwargs)) for term in terms)
+
+
+async def run_async(terms: list[str], max_in_flight: int, **kwargs) -> int:
+    frames = await asyncio.gather(
+        *(
+            async_scrape_jobs(search_term=term, max_in_flight=max_in_flight, **kwargs)
+            for term in terms
+        )
+    )
+    return sum(len(frame) for frame in frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--searches", type=int, default=10)
+    parser.add_argument("--results-wanted", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--max-in-flight", type=int, default=100)
+    args = parser.parse_args()
+
+    terms = [f"pharmacist{i}" for i in range(args.searches)]
+    kwargs = dict(
+        site_name=["indeed", "zip_recruiter"],
+        results_wanted=args.results_wanted,
+        verbose=0,
+    )
+    store = synthetic_store(pages=10, sites=["indeed", "zip_recruiter"])
+    with ReplayServer(store, latency=args.latency) as board, board.redirect():
+        print(
+            f"{'engine':>8} {'jobs':>6} {'requests':>9} {'seconds':>8} {'threads':>8}"
+        )
+        for name, run in (
+            ("threads", lambda: run_threaded(terms, **kwargs)),
+            (
+                "asyncio",
+                lambda: asyncio.run(run_async(terms, args.max_in_flight, **kwargs)),
+            ),
+        ):
+            store.reset()
+            requests_before = board.requests
+            with PeakThreads() as threads:
+                start = time.perf_counter()
+                jobs = run()
+                elapsed = time.perf_counter() - start
+            print(
+                f"{name:>8} {jobs:>6} {board.requests - requests_before:>9}"
+                f" {elapsed:>8.2f} {threads.peak:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
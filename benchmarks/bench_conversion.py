@@ -0,0 +1,95 @@
+"""
+Times description conversion to markdown through the ConversionCache: every
+description converted (cold), a second pass over the same descriptions from memory,
+and a later run reading the on-disk store with an empty memory.
+
+    python benchmarks/bench_conversion.py --size 5000 --repeat-rate 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.cache import ConversionCache
+from jobspy.util import markdown_converter
+
+SECTIONS = [
+    "<p>We are looking for a licensed <strong>Pharmacist</strong> to join our"
+    " retail team in <em>{city}</em>.</p>",
+    "<h3>Responsibilities</h3><ul><li>Verify prescriptions</li>"
+    "<li>Counsel patients on <b>medication therapy</b></li>"
+    "<li>Supervise {count} technicians</li></ul>",
+    "<h3>Requirements</h3><ol><li>PharmD or BS Pharmacy</li>"
+    "<li>Active license in {city}</li></ol>",
+    "<p>Pay: ${low} - ${high} per hour. <a href='https://example.com/{count}'>"
+    "Apply here</a></p>",
+    "<p>Benefits include 401(k), PTO &amp; tuition reimbursement.<br>"
+    "Schedule: 4x10 shifts</p>",
+]
+CITIES = ["Austin, TX", "Denver, CO", "Tampa, FL", "Columbus, OH", "Fresno, CA"]
+
+
+def make_html_descriptions(
+    count: int, repeat_rate: float = 0.3, seed: int = 0
+) -> list[str]:
+    """
+    Synthetic description HTML; repeat_rate of them repeat an earlier one, as the
+    same posting does across sites, searches and nightly runs
+    """
+    rnd = random.Random(seed)
+    descriptions = []
+    for index in range(count):
+        if descriptions and rnd.random() < repeat_rate:
+            descriptions.append(rnd.choice(descriptions))
+            continue
+        low = rnd.randint(45, 70)
+        fields = dict(
+            city=rnd.choice(CITIES), count=index, low=low, high=low + rnd.randint(1, 20)
+        )
+        sections = [section.format(**fields) for section in SECTIONS]
+        descriptions.append("<div>" + "".join(sections * rnd.randint(1, 4)) + "</div>")
+    return descriptions
+
+
+def timed(descriptions: list[str], cache: ConversionCache) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [markdown_converter(description, cache) for description in descriptions]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=5_000)
+    parser.add_argument("--repeat-rate", type=float, default=0.3)
+    args = parser.parse_args()
+
+    descriptions = make_html_descriptions(args.size, args.repeat_rate)
+    print(f"{len(descriptions)} descriptions, {len(set(descriptions))} distinct")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "conversions.db")
+        cache = ConversionCache(path, maxsize=args.size)
+        cold, expected = timed(descriptions, cache)
+        warm, results = timed(descriptions, cache)
+        assert results == expected
+        cache.close()
+
+        cache = ConversionCache(path, maxsize=args.size)
+        disk, results = timed(descriptions, cache)
+        assert results == expected
+        cache.close()
+
+    print(f"{'pass':>14} {'seconds':>8} {'per description ms':>19}")
+    for name, seconds in (("cold", cold), ("memory", warm), ("disk, new run", disk)):
+        per_description = seconds / len(descriptions) * 1000
+        print(f"{name:>14} {seconds:>8.3f} {per_description:>19.3f}")
+
+
+if __name__ == "__main__":
+    main()
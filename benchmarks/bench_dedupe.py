@@ -0,0 +1,195 @@
+"""
+Times near-duplicate detection on generated postings syndicated across boards, each
+copy reformatted the way the sites do it (markdown vs plain text, truncated Google
+snippets, title and location suffixes, legal-form company names). Postings of one
+company share boilerplate paragraphs, so they look alike without being copies, and
+some postings are repeated on one site for other cities: separate requisitions with
+the same text, which must not merge. Reports pair precision / recall against the
+known clusters, same-site rows merged, and for small sizes the time of comparing
+every pair's shingle sets.
+
+    python benchmarks/bench_dedupe.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from itertools import combinations
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.dedupe import company_key, find_near_duplicates, _words
+
+SITES = ["indeed", "linkedin", "zip_recruiter", "google"]
+COMPANIES = [
+    "CVS Health",
+    "Walgreens",
+    "Optum",
+    "Kroger",
+    "Humana",
+    "Cardinal Health",
+    "Elevance Health",
+    "Centene",
+    "McKesson",
+    "Amazon Pharmacy",
+]
+TITLES = [
+    "Pharmacist",
+    "Clinical Pharmacist",
+    "Remote Clinical Pharmacist",
+    "Staff Pharmacist",
+    "Pharmacist in Charge",
+    "Oncology Pharmacist",
+    "Clinical Review Pharmacist",
+    "Utilization Management Pharmacist",
+]
+CITIES = ["Austin, TX", "Dallas, TX", "Chicago, IL", "Denver, CO", "Remote"]
+
+
+def make_vocabulary(size: int, rnd: random.Random) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rnd.choices(letters, k=rnd.randint(3, 9))) for _ in range(size)]
+
+
+def sentence(vocabulary: list[str], rnd: random.Random) -> str:
+    return " ".join(rnd.choices(vocabulary, k=rnd.randint(8, 20))).capitalize() + "."
+
+
+def make_postings(count: int, seed: int = 0) -> pd.DataFrame:
+    """
+    count rows: unique postings plus 1-3 extra copies of about half of them
+    :return: jobs with a "cluster" column naming the posting each row copies
+    """
+    rnd = random.Random(seed)
+    vocabulary = make_vocabulary(20_000, rnd)
+    boilerplate = {
+        company: " ".join(sentence(vocabulary, rnd) for _ in range(8))
+        for company in COMPANIES
+    }
+    rows = []
+    cluster = 0
+    requisitions = []
+    while len(rows) < count:
+        company = rnd.choice(COMPANIES)
+        title = rnd.choice(TITLES)
+        city = rnd.choice(CITIES)
+        duties = [sentence(vocabulary, rnd) for _ in range(rnd.randint(4, 12))]
+        copies = 1 if rnd.random() < 0.5 else rnd.randint(2, 4)
+        sites = rnd.sample(SITES, copies)
+        repeated = rnd.choice(requisitions) if requisitions else None
+        if repeated and len(repeated[4]) < len(CITIES) and rnd.random() < 0.1:
+            # the same requisition text, posted on one site for another city
+            company, title, duties, site, used = repeated
+            city = rnd.choice([other for other in CITIES if other not in used])
+            used.add(city)
+            sites = [site]
+        elif len(requisitions) < 1000:
+            requisitions.append((company, title, duties, sites[0], {city}))
+        for site in sites:
+            lines = duties
+            if site == "linkedin":
+                lines = [f"- **{line}**" for line in duties]
+            description = "\n".join(lines) + "\n\n" + boilerplate[company]
+            if site == "google":
+                words = description.split()
+                description = " ".join(words[: int(len(words) * 0.7)]) + " …"
+            rows.append(
+                {
+                    "site": site,
+                    "title": title + (" - Remote" if site == "zip_recruiter" else ""),
+                    "company": company + (", Inc." if site == "indeed" else ""),
+                    "location": city + (", US" if site != "google" else ""),
+                    "description": description,
+                    "min_amount": rnd.choice([None, 55.0]),
+                    "job_url_direct": rnd.choice(
+                        [None, f"https://ats.example/{cluster}"]
+                    ),
+                    "id": f"{site}-{len(rows)}",
+                    "cluster": cluster,
+                }
+            )
+        cluster += 1
+    return pd.DataFrame(rows[:count])
+
+
+def pair_scores(clusters: pd.Series, found: pd.Series) -> tuple[float, float]:
+    def pairs(labels: pd.Series) -> set:
+        groups = labels.groupby(labels).groups.values()
+        return {pair for group in groups for pair in combinations(sorted(group), 2)}
+
+    expected, predicted = pairs(clusters), pairs(found)
+    hits = len(expected & predicted)
+    return hits / max(len(predicted), 1), hits / max(len(expected), 1)
+
+
+def same_site_merged(jobs: pd.DataFrame, found: pd.Series) -> int:
+    """
+    Rows merged into a cluster that already holds a row of their site
+    """
+    return int(jobs.groupby([found, jobs["site"]]).size().sub(1).sum())
+
+
+def all_pairs(jobs: pd.DataFrame, threshold: float) -> int:
+    """
+    The quadratic baseline: exact Jaccard of every pair's shingle sets
+    """
+    shingles = []
+    for title, company, location, description in zip(
+        jobs["title"], jobs["company"], jobs["location"], jobs["description"]
+    ):
+        words = _words(title) + company_key(company).split() + _words(location)
+        words += _words(description, 200)
+        shingles.append({tuple(words[i : i + 3]) for i in range(len(words) - 2)})
+    matches = 0
+    for first, second in combinations(shingles, 2):
+        if len(first & second) / len(first | second) >= threshold:
+            matches += 1
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument(
+        "--all-pairs-max", type=int, default=2_000, help="largest size for all pairs"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>8} {'copies':>7} {'found':>7} {'precision':>10} {'recall':>7}"
+        f" {'same site':>10} {'minhash s':>10} {'all pairs s':>12}"
+    )
+    for size in args.sizes:
+        jobs = make_postings(size)
+        start = time.perf_counter()
+        canonical = find_near_duplicates(jobs, threshold=args.threshold)
+        seconds = time.perf_counter() - start
+        found = canonical.ne(jobs.index).sum()
+        copies = size - jobs["cluster"].nunique()
+        precision, recall = pair_scores(jobs["cluster"], canonical)
+        pairs_seconds = "-"
+        if size <= args.all_pairs_max:
+            start = time.perf_counter()
+            all_pairs(jobs, args.threshold)
+            pairs_seconds = f"{time.perf_counter() - start:.2f}"
+        print(
+            f"{size:>8} {copies:>7} {found:>7} {precision:>10.3f} {recall:>7.3f}"
+            f" {same_site_merged(jobs, canonical):>10} {seconds:>10.2f}"
+            f" {pairs_seconds:>12}"
+        )
+        sites = Counter(jobs.loc[canonical.eq(jobs.index), "site"])
+        print(f"{'':>8} canonical rows by site: {dict(sites)}")
+
+
+if __name__ == "__main__":
+    main()
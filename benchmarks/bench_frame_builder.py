@@ -0,0 +1,115 @@
+"""
+Times the scrape_jobs result assembly step: the previous one-DataFrame-per-job
+concat against JobFrameBuilder.
+
+    python benchmarks/bench_frame_builder.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+from jobspy.util import JobFrameBuilder, desired_order, flatten_job_post
+
+SITES = ["indeed", "linkedin", "zip_recruiter", "glassdoor", "google"]
+
+
+def make_rows(count: int, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        compensation = None
+        if rnd.random() < 0.4:
+            compensation = Compensation(
+                interval=rnd.choice(list(CompensationInterval)),
+                min_amount=rnd.randint(40, 90),
+                max_amount=rnd.randint(90, 160),
+            )
+        job = JobPost(
+            id=f"bm-{i}",
+            title=f"Remote Pharmacist {i}",
+            company_name=rnd.choice(["CVS Health", "Walgreens", None]),
+            job_url=f"https://example.com/jobs/{i}",
+            job_url_direct=rnd.choice([None, f"https://ats.example.com/{i}"]),
+            location=Location(city="Austin", state="TX", country=Country.USA),
+            description="Clinical pharmacist, full time. Pay $55 - $70 per hour.",
+            compensation=compensation,
+            date_posted=date(2024, 1, 1) + timedelta(days=rnd.randint(0, 30)),
+            is_remote=rnd.choice([True, False, None]),
+            job_type=[JobType.FULL_TIME],
+        )
+        rows.append(flatten_job_post(job, rnd.choice(SITES), Country.USA))
+    return rows
+
+
+def concat_per_job(rows: list[dict]) -> pd.DataFrame:
+    jobs_dfs = [pd.DataFrame([row]) for row in rows]
+    jobs_df = pd.concat(
+        [df.dropna(axis=1, how="all") for df in jobs_dfs], ignore_index=True
+    )
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def columnar(rows: list[dict]) -> pd.DataFrame:
+    builder = JobFrameBuilder()
+    builder.extend(rows)
+    return builder.to_dataframe()
+
+
+def timed(func, rows) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(rows)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--skip-concat-above",
+        type=int,
+        default=100000,
+        help="skip the per-job concat path for sizes above this (it is very slow)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'jobs':>8} {'concat (s)':>12} {'columnar (s)':>13} {'speedup':>9}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        columnar_time, columnar_df = timed(columnar, rows)
+        if size > args.skip_concat_above:
+            print(f"{size:>8} {'skipped':>12} {columnar_time:>13.3f} {'-':>9}")
+            continue
+        concat_time, concat_df = timed(concat_per_job, rows)
+        pd.testing.assert_frame_equal(concat_df, columnar_df)
+        print(
+            f"{size:>8} {concat_time:>12.3f} {columnar_time:>13.3f}"
+            f" {concat_time / columnar_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
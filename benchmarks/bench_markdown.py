@@ -0,0 +1,149 @@
+"""
+Compares the description converter backends on the Indeed and Glassdoor description
+payloads of the replay fixtures and on generated descriptions: checks that the
+fast backend gives the same markdown as markdownify (and the same plain text as
+BeautifulSoup) for every description, then times both.
+
+    python benchmarks/bench_markdown.py                       # synthetic fixtures
+    python benchmarks/bench_markdown.py --fixtures benchmarks/fixtures --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.converter import html_to_markdown, html_to_plain
+from jobspy.converter import _markdownify, _soup_text
+from benchmarks.bench_conversion import make_html_descriptions
+from benchmarks.fixtures import synthetic_store
+from benchmarks.replay import FixtureStore
+
+PAYLOAD_HOSTS = {"apis.indeed.com": "indeed", "www.glassdoor.com": "glassdoor"}
+
+# markup the fast backend renders itself or hands to markdownify
+EDGE_CASES = [
+    "",
+    "   ",
+    "<p>  leading and trailing  </p>\n\n<p>second</p>",
+    "<p>snake_case and 5 * 3</p>",
+    "<b> bold </b><i></i><em>em<strong>strong</strong></em>",
+    "<ul><li>one<ul><li>nested<ul><li>deep</li></ul></li></ul></li><li></li></ul>text",
+    '<ol start="3"><li>three</li><li>four</li></ol><ol start="x"><li>one</li></ol>',
+    "<h1>Title</h1><h2>  Sub  </h2><h3>a\nb</h3><h7>deep</h7><h2><p>para</p></h2>",
+    '<a href="https://x.com">https://x.com</a> <a href="">empty</a> <a>none</a>',
+    '<a href="/apply" title="Say &quot;hi&quot;">apply</a>',
+    "line<br>break<br/><h3>in<br>heading</h3>",
+    "&amp; &nbsp; &copy &#169; &#x41; &#150; &foo; &#12ab",
+    "<div>unclosed <span>tags<p>para",
+    "text</b> stray </p> end tags",
+    "<img src='a.png'>x</img> after",
+    "<table><tr><td>cell</td></tr></table>",
+    "<pre>  code\n  block</pre>",
+    "<!-- comment --><p>after comment</p>",
+    "<blockquote>quote</blockquote><hr><q>quoted</q>",
+    "<script>var x = '<p>';</script><style>p {}</style>text",
+    "<b>&#x41;<em>a*b&#xZZ;</h1>--><div>stray comment end",
+    "<![CDATA[x]]>&amp&foo;< p>&<em>text & more",
+    "<p<sup>broken start</P><!--unclosed comment <span>",
+]
+
+
+def find_descriptions(data) -> list[str]:
+    """
+    Description HTML anywhere in a JSON payload (Indeed nests it under "html")
+    """
+    found = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "description" and isinstance(value, dict):
+                value = value.get("html")
+            if key == "description" and isinstance(value, str):
+                found.append(value)
+            else:
+                found.extend(find_descriptions(value))
+    elif isinstance(data, list):
+        for value in data:
+            found.extend(find_descriptions(value))
+    return found
+
+
+def load_payloads(store: FixtureStore) -> dict[str, list[str]]:
+    payloads = {name: [] for name in PAYLOAD_HOSTS.values()}
+    for exchange in store.exchanges:
+        name = PAYLOAD_HOSTS.get(urlsplit(exchange.url).netloc)
+        if name and "json" in exchange.content_type and exchange.response:
+            payloads[name].extend(find_descriptions(json.loads(exchange.response)))
+    return payloads
+
+
+def check(corpus: list[str]) -> int:
+    for html in corpus:
+        if html_to_markdown(html) != _markdownify(html):
+            raise AssertionError(f"markdown differs from markdownify: {html[:200]!r}")
+        if html_to_plain(html) != _soup_text(html):
+            raise AssertionError(f"plain text differs from get_text: {html[:200]!r}")
+    return len(corpus)
+
+
+def timed(convert, corpus: list[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in corpus:
+            convert(html)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--fixtures",
+        help="recorded fixture file or directory (default: synthetic fixtures)",
+    )
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--generated", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    store = (
+        FixtureStore.load(args.fixtures)
+        if args.fixtures
+        else synthetic_store(pages=args.pages, sites=["indeed", "glassdoor"])
+    )
+    corpora = load_payloads(store)
+    corpora["generated"] = make_html_descriptions(args.generated, repeat_rate=0)
+    checked = check(EDGE_CASES) + sum(check(corpus) for corpus in corpora.values())
+    print(f"{checked} descriptions converted identically by both backends\n")
+
+    print(
+        f"{'payloads':>10} {'count':>6} {'MB':>6} {'format':>9}"
+        f" {'reference s':>12} {'fast s':>8} {'speedup':>8}"
+    )
+    for name, corpus in corpora.items():
+        if not corpus:
+            continue
+        megabytes = sum(len(html.encode("utf-8")) for html in corpus) / 1e6
+        for format, reference, fast in (
+            ("markdown", _markdownify, html_to_markdown),
+            ("plain", _soup_text, html_to_plain),
+        ):
+            reference_seconds = timed(reference, corpus, args.repeat)
+            fast_seconds = timed(fast, corpus, args.repeat)
+            print(
+                f"{name:>10} {len(corpus):>6} {megabytes:>6.2f} {format:>9}"
+                f" {reference_seconds:>12.3f} {fast_seconds:>8.3f}"
+                f" {reference_seconds / fast_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compares storing scrape results as CSV (to_csv with QUOTE_NONNUMERIC), JSON records
+and Parquet written by jobspy.write_parquet: file size, write time, full read time
+and the time to read three analytics columns back.
+
+    python benchmarks/bench_parquet.py --size 100000
+    python benchmarks/bench_parquet.py --corpus pharmacist_remote_jobs.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.arrow import frame_to_table, write_parquet
+from jobspy.util import JobFrameBuilder
+from benchmarks.bench_frame_builder import make_rows
+from benchmarks.bench_salary import make_descriptions
+
+ANALYTICS_COLUMNS = ["site", "company", "min_amount"]
+
+
+def load_jobs(path: str | None, size: int) -> pd.DataFrame:
+    if path:
+        return pd.read_json(path) if path.endswith(".json") else pd.read_csv(path)
+    builder = JobFrameBuilder()
+    for row, description in zip(make_rows(size), make_descriptions(size)):
+        row["description"] = description
+        builder.append(row)
+    return builder.to_dataframe()
+
+
+def timed(function, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--corpus", help="scrape_jobs output (.csv or .json) instead of generated jobs"
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.corpus, args.size)
+    table = frame_to_table(jobs)
+    print(f"{len(jobs)} jobs")
+    print(
+        f"{'format':>8} {'MB':>8} {'write s':>8} {'read s':>8}"
+        f" {'read 3 columns s':>17}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "jobs.csv")
+        json_path = os.path.join(directory, "jobs.json")
+        parquet_path = os.path.join(directory, "jobs.parquet")
+        formats = [
+            (
+                "csv",
+                csv_path,
+                lambda: jobs.to_csv(
+                    csv_path, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", index=False
+                ),
+                lambda: pd.read_csv(csv_path),
+                lambda: pd.read_csv(csv_path, usecols=ANALYTICS_COLUMNS),
+            ),
+            (
+                "json",
+                json_path,
+                lambda: jobs.to_json(json_path, orient="records", date_format="iso"),
+                lambda: pd.read_json(json_path),
+                lambda: pd.read_json(json_path)[ANALYTICS_COLUMNS],
+            ),
+            (
+                "parquet",
+                parquet_path,
+                lambda: write_parquet(table, parquet_path),
+                lambda: pd.read_parquet(parquet_path),
+                lambda: pd.read_parquet(parquet_path, columns=ANALYTICS_COLUMNS),
+            ),
+        ]
+        for name, path, write, read, read_columns in formats:
+            write_seconds, _ = timed(write)
+            read_seconds, _ = timed(read)
+            columns_seconds, _ = timed(read_columns)
+            megabytes = os.path.getsize(path) / 1e6
+            print(
+                f"{name:>8} {megabytes:>8.1f} {write_seconds:>8.3f} {read_seconds:>8.3f}"
+                f" {columns_seconds:>17.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures HTML parse throughput of every installed parser backend on the HTML pages
+of the replay fixtures: building the tree, then the search card lookup the
+scrapers do on it.
+
+    python benchmarks/bench_parse.py                          # synthetic fixtures
+    python benchmarks/bench_parse.py --fixtures benchmarks/fixtures --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.bdjobs.constant import job_selectors
+from jobspy.parser import HTML_PARSERS, parse_html
+from benchmarks.fixtures import synthetic_store
+from benchmarks.replay import FixtureStore
+
+CARD_SELECTORS = {
+    "www.linkedin.com": "div.base-search-card",
+    "www.bayt.com": "li[data-js-job]",
+    "jobs.bdjobs.com": ", ".join(job_selectors),
+}
+
+
+def installed_parsers() -> list[str]:
+    parsers = []
+    for parser in HTML_PARSERS:
+        try:
+            parse_html("<p></p>", parser)
+        except ImportError:
+            continue
+        parsers.append(parser)
+    return parsers
+
+
+def time_pages(pages: list[str], parser: str, selector: str | None, repeat: int):
+    parse_times, select_times = [], []
+    for _ in range(repeat):
+        parse_seconds = select_seconds = 0.0
+        for page in pages:
+            start = time.perf_counter()
+            soup = parse_html(page, parser)
+            parse_seconds += time.perf_counter() - start
+            if selector:
+                start = time.perf_counter()
+                soup.select(selector)
+                select_seconds += time.perf_counter() - start
+        parse_times.append(parse_seconds)
+        select_times.append(select_seconds)
+    return statistics.median(parse_times), statistics.median(select_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--fixtures",
+        help="recorded fixture file or directory (default: synthetic fixtures)",
+    )
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    store = (
+        FixtureStore.load(args.fixtures)
+        if args.fixtures
+        else synthetic_store(pages=args.pages)
+    )
+    pages_by_host = defaultdict(list)
+    for exchange in store.exchanges:
+        if "html" in exchange.content_type and exchange.response:
+            pages_by_host[urlsplit(exchange.url).netloc].append(exchange.response)
+
+    print(
+        f"{'host':>18} {'parser':>12} {'pages':>6} {'MB':>6}"
+        f" {'parse s':>8} {'MB/s':>7} {'cards s':>8}"
+    )
+    for host, pages in sorted(pages_by_host.items()):
+        megabytes = sum(len(page.encode("utf-8")) for page in pages) / 1e6
+        for backend in installed_parsers():
+            parse_seconds, select_seconds = time_pages(
+                pages, backend, CARD_SELECTORS.get(host), args.repeat
+            )
+            print(
+                f"{host:>18} {backend:>12} {len(pages):>6} {megabytes:>6.2f}"
+                f" {parse_seconds:>8.3f} {megabytes / parse_seconds:>7.2f}"
+                f" {select_seconds:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
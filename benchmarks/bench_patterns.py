@@ -0,0 +1,109 @@
+"""
+Times the description extractors (emails, job types, remote markers, salary range)
+on a corpus of descriptions: the previous per-call patterns, the compiled
+extractors, and scan_description collecting all four at once.
+
+    python benchmarks/bench_patterns.py                       # generated corpus
+    python benchmarks/bench_patterns.py --corpus pharmacist_remote_jobs.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.model import JobType
+from jobspy.patterns import REMOTE_KEYWORDS, SALARY_RANGE, scan_description
+from jobspy.util import extract_emails_from_text, extract_job_type
+from benchmarks.bench_salary import make_descriptions
+
+EXTRAS = [
+    " Send your resume to careers.rx@example-health.com.",
+    " This is a full time position with remote work options.",
+    " Part-time and contract roles available.",
+    " Paid internship for pharmacy students.",
+]
+
+
+def load_corpus(path: str | None, size: int) -> list[str]:
+    if path:
+        jobs = pd.read_json(path) if path.endswith(".json") else pd.read_csv(path)
+        return [d for d in jobs["description"] if isinstance(d, str) and d]
+    rnd = random.Random(0)
+    return [
+        description + "".join(rnd.sample(EXTRAS, rnd.randint(0, 2)))
+        for description in make_descriptions(size)
+        if description
+    ]
+
+
+def previous_extractors(description: str):
+    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+    emails = email_regex.findall(description)
+    keywords = {
+        JobType.FULL_TIME: r"full\s?time",
+        JobType.PART_TIME: r"part\s?time",
+        JobType.INTERNSHIP: r"internship",
+        JobType.CONTRACT: r"contract",
+    }
+    job_types = [
+        key
+        for key, pattern in keywords.items()
+        if re.search(pattern, description, re.IGNORECASE)
+    ]
+    is_remote = any(keyword in description.lower() for keyword in REMOTE_KEYWORDS)
+    salary_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+    salaries = [match.group() for match in re.finditer(salary_pattern, description)]
+    return emails, job_types, is_remote, salaries
+
+
+def compiled_extractors(description: str):
+    emails = extract_emails_from_text(description)
+    job_types = extract_job_type(description) or []
+    lowered = description.lower()
+    is_remote = any(keyword in lowered for keyword in REMOTE_KEYWORDS)
+    salaries = [match.group() for match in SALARY_RANGE.finditer(description)]
+    return emails, job_types, is_remote, salaries
+
+
+def scanner(description: str):
+    return tuple(scan_description(description))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--corpus", help="scrape_jobs output (.csv or .json) with a description column"
+    )
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    descriptions = load_corpus(args.corpus, args.size)
+    megabytes = sum(len(d) for d in descriptions) / 1e6
+    print(f"{len(descriptions)} descriptions, {megabytes:.1f} MB")
+    expected = None
+    for name, extract in (
+        ("previous", previous_extractors),
+        ("compiled", compiled_extractors),
+        ("scan", scanner),
+    ):
+        start = time.perf_counter()
+        results = [extract(description) for description in descriptions]
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected = results
+        elif results != expected:
+            raise AssertionError(f"{name} results differ from the previous extractors")
+        print(f"{name:>10} {seconds:>8.3f}s {megabytes / seconds:>8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Construction time, memory and flattening time of scraped postings: pydantic JobPost
+models (validated as they are built, then flattened through job.dict()) against the
+slotted JobRecord the scrapers build, flattened from its attributes and validated
+into a JobPost only on request.
+
+    python benchmarks/bench_records.py --size 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    CompensationRecord,
+    Country,
+    JobPost,
+    JobRecord,
+    JobType,
+    Location,
+    LocationRecord,
+    SalarySource,
+)
+from jobspy.util import flatten_job_post
+
+CITIES = [("Austin", "TX"), ("Denver", "CO"), ("Tampa", "FL"), ("Fresno", "CA")]
+
+
+def make_fields(count: int) -> list[dict]:
+    """
+    Keyword arguments of count postings, strings created up front so that only the
+    records themselves are measured
+    """
+    today = date.today()
+    postings = []
+    for index in range(count):
+        city, state = CITIES[index % len(CITIES)]
+        postings.append(
+            dict(
+                id=f"in-{index:08x}",
+                title=f"Staff Pharmacist {index}",
+                company_name=f"Pharmacy {index % 500}",
+                job_url=f"https://www.indeed.com/viewjob?jk={index:016x}",
+                location=dict(city=city, state=state, country=Country.USA),
+                description=f"Verify prescriptions and counsel patients. {index}",
+                company_url=f"https://www.indeed.com/cmp/pharmacy-{index % 500}",
+                job_type=[JobType.FULL_TIME],
+                compensation=dict(
+                    interval=CompensationInterval.HOURLY,
+                    min_amount=55 + index % 10,
+                    max_amount=70 + index % 10,
+                    currency="USD",
+                ),
+                date_posted=today - timedelta(days=index % 30),
+                emails=None,
+                is_remote=False,
+            )
+        )
+    return postings
+
+
+def build_models(postings: list[dict]) -> list[JobPost]:
+    return [
+        JobPost(
+            **{
+                **fields,
+                "location": Location(**fields["location"]),
+                "compensation": Compensation(**fields["compensation"]),
+            }
+        )
+        for fields in postings
+    ]
+
+
+def build_records(postings: list[dict]) -> list[JobRecord]:
+    return [
+        JobRecord(
+            **{
+                **fields,
+                "location": LocationRecord(**fields["location"]),
+                "compensation": CompensationRecord(**fields["compensation"]),
+            }
+        )
+        for fields in postings
+    ]
+
+
+def previous_flatten(job: JobPost) -> dict:
+    """
+    The dict-based flattening scrape_jobs did before JobRecord, without the salary
+    extraction both paths share
+    """
+    job_data = job.dict()
+    job_data["site"] = "indeed"
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj and isinstance(compensation_obj, dict):
+        job_data["interval"] = (
+            compensation_obj.get("interval").value
+            if compensation_obj.get("interval")
+            else None
+        )
+        job_data["min_amount"] = compensation_obj.get("min_amount")
+        job_data["max_amount"] = compensation_obj.get("max_amount")
+        job_data["currency"] = compensation_obj.get("currency", "USD")
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+    job_data["skills"] = ", ".join(job_data["skills"]) if job_data["skills"] else None
+    return job_data
+
+
+def measured(build, postings: list[dict]) -> tuple[float, int, list]:
+    """
+    :return: seconds, bytes allocated by the built list, the list
+    """
+    gc.collect()
+    start = time.perf_counter()
+    jobs = build(postings)
+    seconds = time.perf_counter() - start
+    del jobs
+    gc.collect()
+    tracemalloc.start()
+    jobs = build(postings)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return seconds, allocated, jobs
+
+
+def timed(function, jobs: list) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [function(job) for job in jobs]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    postings = make_fields(args.size)
+    model_seconds, model_bytes, models = measured(build_models, postings)
+    record_seconds, record_bytes, records = measured(build_records, postings)
+
+    def flatten(job):
+        return flatten_job_post(job, "indeed", Country.USA)
+
+    previous_seconds, expected = timed(previous_flatten, models)
+    flatten_seconds, rows = timed(flatten, records)
+    for row, previous in zip(rows, expected):
+        if row != previous:
+            raise AssertionError(f"flattened rows differ: {row} != {previous}")
+    validate_seconds, validated = timed(JobRecord.to_model, records)
+    if validated != models:
+        raise AssertionError("validated records differ from the JobPost models")
+
+    print(f"{args.size} postings")
+    print(f"{'':>22} {'JobPost':>10} {'JobRecord':>10}")
+    print(f"{'construction s':>22} {model_seconds:>10.3f} {record_seconds:>10.3f}")
+    print(f"{'memory MB':>22} {model_bytes / 1e6:>10.1f} {record_bytes / 1e6:>10.1f}")
+    print(f"{'flatten s':>22} {previous_seconds:>10.3f} {flatten_seconds:>10.3f}")
+    print(
+        f"{'build + flatten s':>22} {model_seconds + previous_seconds:>10.3f}"
+        f" {record_seconds + flatten_seconds:>10.3f}"
+    )
+    print(f"{'validate_jobs=True s':>22} {'':>10} {validate_seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
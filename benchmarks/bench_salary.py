@@ -0,0 +1,80 @@
+"""
+Times salary inference from descriptions: extract_salary once per description (as
+scrape_jobs does row by row) against extract_salaries over the whole column, and
+checks both give the same result for every description.
+
+    python benchmarks/bench_salary.py --sizes 10000 100000 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.util import extract_salaries, extract_salary
+
+FILLER = (
+    "We are looking for a licensed **Pharmacist** to join our retail team. "
+    "You will verify prescriptions, counsel patients and supervise technicians. "
+)
+
+
+def make_descriptions(count: int, seed: int = 0) -> list[str | None]:
+    rnd = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        roll = rnd.random()
+        if roll < 0.1:
+            descriptions.append(None)
+            continue
+        body = FILLER * rnd.randint(5, 30)
+        if roll < 0.3:
+            low = rnd.randint(40, 70)
+            salary = f"${low} - ${low + rnd.randint(1, 20)} per hour"
+        elif roll < 0.5:
+            low = rnd.randint(90, 150)
+            salary = f"${low}k–${low + rnd.randint(5, 40)}k a year"
+        elif roll < 0.55:
+            low = rnd.randint(90_000, 150_000)
+            salary = f"${low:,} - ${low + rnd.randint(5_000, 40_000):,}"
+        else:
+            salary = "Competitive pay and benefits."
+        descriptions.append(f"{body}\n\n{salary}\n\n{body}")
+    return descriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'descriptions':>12} {'per row s':>10} {'batch s':>8} {'speedup':>8}")
+    for size in args.sizes:
+        descriptions = make_descriptions(size)
+
+        start = time.perf_counter()
+        expected = [extract_salary(description) for description in descriptions]
+        per_row = time.perf_counter() - start
+
+        start = time.perf_counter()
+        salaries = extract_salaries(pd.Series(descriptions))
+        batch = time.perf_counter() - start
+
+        actual = [
+            tuple(None if pd.isna(value) else value for value in row)
+            for row in salaries.itertuples(index=False)
+        ]
+        if actual != expected:
+            raise AssertionError("extract_salaries disagrees with extract_salary")
+        print(f"{size:>12} {per_row:>10.3f} {batch:>8.3f} {per_row / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Times every scraper end to end against the offline replay server: Scraper.scrape()
+per site (requests, parsing, _process_job), then scrape_jobs() over all of them
+(adds the result assembly step).
+
+    python benchmarks/bench_scrapers.py                     # synthetic fixtures
+    python benchmarks/bench_scrapers.py --fixtures benchmarks/fixtures --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy import SCRAPER_MAPPING, scrape_jobs
+from jobspy.model import Country, ScraperInput, Site
+from jobspy.util import RateController, set_logger_level
+from benchmarks.fixtures import synthetic_store
+from benchmarks.replay import FixtureStore, ReplayServer
+
+
+def without_delays(scraper_class):
+    """
+    Wraps a scraper class so its instances skip the pacing between search pages and
+    the job page rate limit, which would dominate every timing offline
+    """
+
+    def create(**kwargs):
+        scraper = scraper_class(**kwargs)
+        if hasattr(scraper, "rate_controller"):
+            scraper.rate_controller = RateController(
+                initial_delay=0, min_delay=0, max_delay=0
+            )
+        if hasattr(scraper, "detail_rate"):
+            scraper.detail_rate = 0
+        return scraper
+
+    return create
+
+
+def time_scraper(site: Site, server: ReplayServer, args) -> tuple[int, int, float]:
+    timings = []
+    for _ in range(args.repeat):
+        server.store.reset()
+        requests_before = server.requests
+        scraper_input = ScraperInput(
+            site_type=[site],
+            search_term=args.search_term,
+            location="Austin, TX",
+            country=Country.USA,
+            results_wanted=args.results_wanted,
+            linkedin_fetch_description=True,
+        )
+        start = time.perf_counter()
+        jobs = without_delays(SCRAPER_MAPPING[site])().scrape(scraper_input).jobs
+        timings.append(time.perf_counter() - start)
+    return len(jobs), server.requests - requests_before, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--fixtures",
+        help="recorded fixture file or directory (default: synthetic fixtures)",
+    )
+    parser.add_argument("--sites", nargs="+", default=[site.value for site in Site])
+    parser.add_argument("--search-term", default="pharmacist")
+    parser.add_argument("--results-wanted", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every response"
+    )
+    args = parser.parse_args()
+
+    set_logger_level(0)
+    sites = [Site(site) for site in args.sites]
+    store = (
+        FixtureStore.load(args.fixtures)
+        if args.fixtures
+        else synthetic_store(pages=args.results_wanted // 10 + 2)
+    )
+    with ReplayServer(store, latency=args.latency) as server, server.redirect():
+        print(f"{'site':>14} {'jobs':>6} {'requests':>9} {'seconds':>8} {'jobs/s':>8}")
+        for site in sites:
+            jobs, requests, seconds = time_scraper(site, server, args)
+            print(
+                f"{site.value:>14} {jobs:>6} {requests:>9} {seconds:>8.3f}"
+                f" {jobs / seconds if seconds else 0:>8.0f}"
+            )
+
+        store.reset()
+        no_delay = {site: without_delays(SCRAPER_MAPPING[site]) for site in sites}
+        start = time.perf_counter()
+        with mock.patch.dict(SCRAPER_MAPPING, no_delay):
+            scrape_jobs(
+                site_name=sites,
+                search_term=args.search_term,
+                location="Austin, TX",
+                results_wanted=args.results_wanted,
+                linkedin_fetch_description=True,
+                verbose=0,
+            )
+        elapsed = time.perf_counter() - start
+        print(f"{'scrape_jobs':>14} {'':>6} {'':>9} {elapsed:>8.3f}")
+        if store.misses:
+            print(
+                f"\n{len(store.misses)} requests had no fixture,"
+                f" e.g. {store.misses[0]}"
+            )
+
+
+if __name__ == "__main__":
+    main()
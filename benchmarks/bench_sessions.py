@@ -0,0 +1,128 @@
+"""
+Times repeated scrape calls against a local HTTPS server with keep-alive: each call
+creates its scrapers' sessions and sends a few requests per session, as scrape_jobs
+does. Compares sessions with their own connection pools (the previous create_session)
+against create_session's shared pools, counting the TCP connections (and so TLS
+handshakes) the server accepts. Needs the openssl command for the test certificate.
+
+    python benchmarks/bench_sessions.py --calls 20 --sessions 3 --requests 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.util import close_connection_pools, create_session
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"jobs": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_certificate(directory: str) -> tuple[str, str]:
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def start_server(cert: str, key: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(make_session, url: str, cert: str, args) -> float:
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        sessions = [make_session() for _ in range(args.sessions)]
+        for session in sessions:
+            for _ in range(args.requests):
+                # per request, as REQUESTS_CA_BUNDLE overrides session.verify
+                session.get(url, verify=cert).raise_for_status()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--sessions", type=int, default=3, help="scrapers per call")
+    parser.add_argument("--requests", type=int, default=10, help="per session")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        server = start_server(cert, key)
+        url = f"https://localhost:{server.server_address[1]}/jobs"
+        total = args.calls * args.sessions * args.requests
+        print(f"{total} requests in {args.calls} calls")
+        print(f"{'sessions':>12} {'s':>7} {'connections':>12}")
+        for name, make_session in (
+            ("own pools", requests.Session),
+            ("shared pools", lambda: create_session(is_tls=False)),
+        ):
+            close_connection_pools()
+            before = server.connections
+            seconds = run(make_session, url, cert, args)
+            print(f"{name:>12} {seconds:>7.2f} {server.connections - before:>12}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Times turning scrape results into jobs table rows for the Supabase upload: the
+previous per-row loop over the JSON records (with pd.to_datetime per row in the sort
+key) against the column-wise to_table_rows() steps of search_pharmacist_jobs.py,
+checking both give the same rows.
+
+    python benchmarks/bench_transform.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import logging
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jobspy import transform
+from jobspy.transform import Constant, Text, to_table_rows
+from jobspy.util import JobFrameBuilder, annualize_salaries
+from benchmarks.bench_frame_builder import make_rows
+
+# defined in the script, which scrapes when imported
+SPEC_NAMES = (
+    "PLACEHOLDER_COMPANIES",
+    "JOB_TYPES",
+    "SALARY_TYPES",
+    "JOBS_TABLE_COLUMNS",
+    "JOBS_TABLE_STEPS",
+)
+
+
+def load_spec() -> dict:
+    with open(os.path.join(ROOT, "search_pharmacist_jobs.py")) as f:
+        tree = ast.parse(f.read())
+    assignments = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and any(getattr(target, "id", None) in SPEC_NAMES for target in node.targets)
+    ]
+    namespace = vars(transform).copy()
+    exec(compile(ast.Module(assignments, type_ignores=[]), "spec", "exec"), namespace)
+    return namespace
+
+
+def slug(title: str) -> str:
+    title = re.sub(r"[^\w\s-]", "", title.lower())
+    return re.sub(r"[-\s]+", "-", title)[:100]
+
+
+def row_loop(jobs: pd.DataFrame, scraped_at: str, spec: dict) -> list[dict]:
+    """
+    The previous transformation: one dict at a time over json.loads(to_json())
+    """
+    rows = []
+    for job in json.loads(jobs.to_json(orient="records", date_format="iso")):
+        job["scraped_at"] = scraped_at
+        company = str(job.get("company") or "").strip()
+        if company.lower() not in spec["PLACEHOLDER_COMPANIES"]:
+            job["company_name"] = company
+        interval = job.pop("interval", None)
+        if interval:
+            hourly = str(interval).lower() in ("hourly", "hour", "hr")
+            job["salary_type"] = "hourly" if hourly else "yearly"
+        url = job.get("job_url_direct") or job.get("job_url")
+        if url:
+            job["application_url"] = url
+        job["posted_at"] = job.pop("date_posted", None)
+        job["status"] = "approved"
+        job_type = job.pop("job_type", None)
+        if job_type:
+            job_type = spec["JOB_TYPES"].get(str(job_type).lower().strip())
+            if job_type:
+                job["job_type"] = job_type
+        if job.pop("is_remote", None):
+            job["is_featured"] = True
+        for prefix in ("min", "max"):
+            try:
+                job[f"salary_{prefix}"] = int(job.get(f"{prefix}_amount"))
+            except (TypeError, ValueError):
+                job[f"salary_{prefix}"] = None
+        job["description"] = job.get("description") or "No description available."
+        job["title"] = job.get("title") or "Untitled Job"
+        job["slug"] = slug(job["title"]) or "untitled-job"
+        rows.append({k: v for k, v in job.items() if k in spec["JOBS_TABLE_COLUMNS"]})
+
+    def posted_at(job):
+        parsed = pd.to_datetime(job.get("posted_at"), errors="coerce")
+        return datetime.min if pd.isna(parsed) else parsed.to_pydatetime()
+
+    rows.sort(key=posted_at, reverse=True)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    logging.getLogger("JobSpy:Transform").setLevel(logging.ERROR)
+    spec = load_spec()
+    steps = [
+        Constant("scraped_at", "2024-01-01T00:00:00"),
+        Text("company_name", ("company",), spec["PLACEHOLDER_COMPANIES"]),
+        *spec["JOBS_TABLE_STEPS"],
+    ]
+    print(f"{'rows':>8} {'row loop s':>11} {'columns s':>10} {'speedup':>8}")
+    for size in args.sizes:
+        builder = JobFrameBuilder()
+        for row in make_rows(size):
+            builder.append(row)
+        jobs = builder.to_dataframe()
+        jobs["date_posted"] = pd.to_datetime(jobs["date_posted"], errors="coerce")
+        jobs = annualize_salaries(jobs, keep_intervals=("hourly",))
+
+        start = time.perf_counter()
+        expected = row_loop(jobs, "2024-01-01T00:00:00", spec)
+        loop_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        rows = to_table_rows(jobs, steps, sort_by=("posted_at",))
+        column_seconds = time.perf_counter() - start
+        if rows != expected:
+            raise AssertionError(f"{size} rows: column-wise rows differ")
+        print(
+            f"{size:>8} {loop_seconds:>11.2f} {column_seconds:>10.2f}"
+            f" {loop_seconds / column_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Times uploading scrape results through the supabase client to a local PostgREST
+stand-in: the previous single upsert of every row against upload_batches at a few
+batch sizes, with a share of rows the table rejects and of requests failing with a
+503. Checks that exactly the bad rows are left out.
+
+    python benchmarks/bench_upload.py --size 20000 --bad-rate 0.001 --fail-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from supabase import create_client
+from postgrest import ReturnMethod
+
+from jobspy.upload import upload_batches
+from benchmarks.bench_frame_builder import make_rows
+from benchmarks.bench_salary import make_descriptions
+from benchmarks.postgrest_standin import PostgrestStandin
+
+JOB_TYPES = {"fulltime", "parttime", "contract", "internship", "temporary"}
+
+
+def make_upload_rows(size: int, bad_rate: float, seed: int = 0) -> tuple[list, set]:
+    """
+    JSON-ready rows as the script sends them; bad_rate of them break a constraint
+    :return: rows, job_urls of the bad rows
+    """
+    jobs = pd.DataFrame(make_rows(size, seed))
+    jobs["description"] = make_descriptions(size)
+    rows = json.loads(jobs.to_json(orient="records", date_format="iso"))
+    rnd = random.Random(seed)
+    bad = set()
+    for row in rnd.sample(rows, int(size * bad_rate)):
+        if rnd.random() < 0.5:
+            row["title"] = None
+        else:
+            row["job_type"] = "gig"
+        bad.add(row["job_url"])
+    return rows, bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--bad-rate", type=float, default=0.001)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    parser.add_argument("--max-body", type=int, default=2_000_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="per request")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--in-flight", type=int, default=4)
+    args = parser.parse_args()
+
+    rows, bad = make_upload_rows(args.size, args.bad_rate)
+    print(f"{len(rows)} rows, {len(bad)} bad, {args.fail_rate:.0%} of requests 503")
+    print(
+        f"{'upload':>16} {'s':>7} {'stored':>7} {'failed':>7} {'requests':>9}"
+        f" {'retries':>8} {'splits':>7}"
+    )
+    runs = [("single upsert", None)] + [
+        (f"batches of {size}", size) for size in args.batch_sizes
+    ]
+    for name, batch_size in runs:
+        standin = PostgrestStandin(
+            unique=("job_url",),
+            not_null=("title",),
+            checks={"job_type": JOB_TYPES},
+            max_body=args.max_body,
+            fail_rate=args.fail_rate,
+            latency=args.latency,
+        )
+        with standin:
+            table = create_client(standin.url, "anon-key").table("jobs")
+
+            def send(batch):
+                return table.upsert(
+                    batch, on_conflict="job_url", returning=ReturnMethod.minimal
+                ).execute()
+
+            start = time.perf_counter()
+            if batch_size is None:
+                try:
+                    send(rows)
+                    failed = 0
+                except Exception:
+                    failed = len(rows)
+                retries = splits = 0
+            else:
+                report = upload_batches(
+                    rows,
+                    send,
+                    batch_size=batch_size,
+                    max_bytes=args.max_body,
+                    max_in_flight=args.in_flight,
+                    backoff=0.05,
+                )
+                failed, retries, splits = (
+                    len(report.failed),
+                    report.retries,
+                    report.splits,
+                )
+                if {row["job_url"] for row, _ in report.failed} != bad:
+                    raise AssertionError(f"{name}: failed rows are not the bad rows")
+            seconds = time.perf_counter() - start
+            stored = len(standin.rows("jobs"))
+        print(
+            f"{name:>16} {seconds:>7.2f} {stored:>7} {failed:>7}"
+            f" {standin.requests:>9} {retries:>8} {splits:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Counts how many copies of a posting exact URL comparison misses: generated Workday,
+Greenhouse, iCIMS, Lever and plain careers-site postings, each reached through 1-4
+board rows whose direct URLs vary the way the boards hand them out (tracking
+parameters, www. hosts, percent-encoded apply URLs, ATS apply / embed paths). A
+share of the careers-site rows only link a search page common to every posting of
+the company, which must not merge them. Compares unique direct URLs by exact
+string against drop_url_duplicates(), checking that no posting is lost.
+
+    python benchmarks/bench_urls.py --sizes 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from urllib.parse import quote
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy.dedupe import drop_url_duplicates
+from jobspy.urls import canonical_url, url_identity
+
+TRACKING = [
+    "utm_source=linkedin&utm_medium=jobboard",
+    "utm_campaign=google_jobs_apply&utm_source=google_jobs_apply",
+    "source=Indeed&src=JB-10020",
+    "trk=public_jobs&refId=abc123",
+    "gh_src=8f2b1c&lever-source=LinkedIn",
+    "iis=Job+Board&iisn=LinkedIn",
+]
+
+
+def posting_variants(number: int, rnd: random.Random) -> list[str]:
+    """
+    URL variants of one posting
+    """
+    tenant = f"company{number % 500}"
+    kind = rnd.choice(["workday", "greenhouse", "icims", "lever", "site"])
+    if kind == "workday":
+        base = (
+            f"https://{tenant}.wd{rnd.randint(1, 5)}.myworkdayjobs.com/External/job/"
+            f"Remote-US/Pharmacist_R{number:07d}"
+        )
+        shapes = [base, base + "/apply", base.replace("/External/", "/en-US/External/")]
+    elif kind == "greenhouse":
+        shapes = [
+            f"https://boards.greenhouse.io/{tenant}/jobs/{number}",
+            f"https://job-boards.greenhouse.io/{tenant}/jobs/{number}",
+            f"https://www.{tenant}.com/careers/job?gh_jid={number}",
+            f"https://boards.greenhouse.io/embed/job_app?for={tenant}&token={number}",
+        ]
+    elif kind == "icims":
+        base = f"https://careers-{tenant}.icims.com/jobs/{number}/pharmacist"
+        shapes = [base + "/job", base + "/job?mode=job&in_iframe=1", base + "/login"]
+    elif kind == "lever":
+        uid = f"{number:08x}-0000-4000-8000-{rnd.getrandbits(48):012x}"
+        base = f"https://jobs.lever.co/{tenant}/{uid}"
+        shapes = [base, base + "/apply"]
+    else:
+        base = f"https://www.{tenant}.com/careers/jobs/{number}"
+        shapes = [base, base.replace("https://www.", "https://"), base + "/"]
+    if kind == "site" and rnd.random() < 0.3:
+        # a careers search page, the same for every posting of the company
+        shapes = [f"https://jobs.{tenant}.com/us/en/search-results"]
+    urls = []
+    for _ in range(rnd.randint(1, 4)):
+        url = rnd.choice(shapes)
+        if rnd.random() < 0.7:
+            url += ("&" if "?" in url else "?") + rnd.choice(TRACKING)
+        if rnd.random() < 0.1:
+            # LinkedIn's applyUrl before unquoting
+            url = quote(url, safe="")
+        urls.append(url)
+    return urls
+
+
+def board_url(posting: int, rnd: random.Random) -> str:
+    board = rnd.choice(["linkedin", "indeed", "zip_recruiter"])
+    if board == "linkedin":
+        return f"https://www.linkedin.com/jobs/view/{posting}?trk=public_jobs"
+    if board == "indeed":
+        return f"https://www.indeed.com/viewjob?jk={posting:016x}"
+    return f"https://www.ziprecruiter.com/jobs//j?lvk={posting}&utm_source=zr"
+
+
+def make_jobs(count: int, seed: int = 0) -> pd.DataFrame:
+    rnd = random.Random(seed)
+    rows = []
+    posting = 0
+    while len(rows) < count:
+        for url in posting_variants(posting, rnd):
+            rows.append(
+                {
+                    "job_url_direct": url,
+                    "job_url": board_url(posting, rnd),
+                    "posting": posting,
+                }
+            )
+        posting += 1
+    return pd.DataFrame(rows[:count])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>8} {'postings':>9} {'exact':>8} {'kept':>8}"
+        f" {'postings lost':>14} {'dedupe s':>9}"
+    )
+    for size in args.sizes:
+        jobs = make_jobs(size)
+        canonical_url.cache_clear()
+        url_identity.cache_clear()
+        start = time.perf_counter()
+        kept = drop_url_duplicates(jobs)
+        seconds = time.perf_counter() - start
+        postings = jobs["posting"].nunique()
+        lost = postings - kept["posting"].nunique()
+        print(
+            f"{size:>8} {postings:>9} {jobs['job_url_direct'].nunique():>8}"
+            f" {len(kept):>8} {lost:>14} {seconds:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+Synthetic fixtures for the replay harness, shaped like the responses each job board
+returns. Used when no recorded fixtures are given, so the benchmarks run anywhere;
+record real ones with benchmarks/record_fixtures.py for representative numbers.
+"""
+
+from __future__ import annotations
+
+import json
+from urllib.parse import quote
+
+from benchmarks.replay import Exchange, FixtureStore
+
+DESCRIPTION = (
+    "<div><h2>About the role</h2>"
+    "<p>We are hiring a <strong>Clinical Pharmacist</strong> to join our remote "
+    "team. You will work closely with physicians, nurses and patients.</p>"
+    "<h3>Responsibilities</h3><ul>"
+    "<li>Verify prescriptions and review drug interactions</li>"
+    "<li>Counsel patients on medication therapy</li>"
+    "<li>Maintain accurate records in the pharmacy system</li></ul>"
+    "<h3>Requirements</h3><ul>"
+    "<li>PharmD or BS Pharmacy, active license</li>"
+    "<li>2+ years of retail or hospital experience</li></ul>"
+    "<p>Full time. Pay $55 - $70 per hour. Questions: careers@example.com</p>"
+    '<p>Apply at <a href="https://ats.example.com/apply">our careers page</a>.</p>'
+    "</div>"
+)
+
+JSON = "application/json"
+
+
+def json_exchange(method: str, url: str, data, **kwargs) -> Exchange:
+    return Exchange(method, url, content_type=JSON, response=json.dumps(data), **kwargs)
+
+
+def linkedin(pages: int, per_page: int = 25) -> list[Exchange]:
+    exchanges = []
+    search_url = (
+        "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    )
+    for page in range(pages):
+        cards = []
+        for i in range(per_page):
+            job_id = 3900000000 + page * per_page + i
+            cards.append(
+                f"""<li><div class="base-card base-search-card job-search-card">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/clinical-pharmacist-{job_id}?position=1&trk=public_jobs">
+<span class="sr-only">Clinical Pharmacist {job_id}</span></a>
+<div class="base-search-card__info">
+<h4 class="base-search-card__subtitle"><a href="https://www.linkedin.com/company/example-health?trk=public_jobs">Example Health</a></h4>
+<div class="base-search-card__metadata">
+<span class="job-search-card__location">Austin, TX</span>
+<span class="job-search-card__salary-info">$120,000.00 - $150,000.00</span>
+<time class="job-search-card__listdate" datetime="2024-01-03">2 days ago</time>
+</div></div></div></li>"""
+            )
+            exchanges.append(
+                Exchange(
+                    "GET",
+                    f"https://www.linkedin.com/jobs/view/{job_id}",
+                    response=linkedin_job_page(job_id),
+                )
+            )
+        exchanges.append(Exchange("GET", search_url, response="\n".join(cards)))
+    exchanges.append(Exchange("GET", search_url, response=""))
+    return exchanges
+
+
+def linkedin_job_page(job_id: int) -> str:
+    apply_url = quote(f"https://ats.example.com/jobs/{job_id}?source=linkedin", safe="")
+    criteria = "".join(
+        f"""<li><h3 class="description__job-criteria-subheader">{name}</h3>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">{value}</span></li>"""
+        for name, value in (
+            ("Seniority level", "Mid-Senior level"),
+            ("Employment type", "Full-time"),
+            ("Job function", "Health Care Provider"),
+            ("Industries", "Hospitals and Health Care"),
+        )
+    )
+    return f"""<html><body>
+<img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/logo.png">
+<code id="applyUrl"><!--"https://www.linkedin.com/jobs/view/externalApply/{job_id}?url={apply_url}&urlHash=x"--></code>
+<div class="show-more-less-html__markup relative">{DESCRIPTION}</div>
+<ul class="description__job-criteria-list">{criteria}</ul>
+</body></html>"""
+
+
+def indeed_job(key: str) -> dict:
+    return {
+        "key": key,
+        "title": f"Clinical Pharmacist {key}",
+        "datePublished": 1704067200000,
+        "description": {"html": DESCRIPTION},
+        "location": {
+            "countryCode": "US",
+            "admin1Code": "TX",
+            "city": "Austin",
+            "formatted": {"short": "Austin, TX", "long": "Austin, TX"},
+        },
+        "compensation": {
+            "estimated": None,
+            "baseSalary": {"unitOfWork": "HOUR", "range": {"min": 55, "max": 70}},
+            "currencyCode": "USD",
+        },
+        "attributes": [{"key": "CF3CP", "label": "Full-time"}],
+        "employer": {
+            "relativeCompanyPageUrl": "/cmp/Example-Health",
+            "name": "Example Health",
+            "dossier": {
+                "employerDetails": {
+                    "addresses": ["1 Main St, Austin, TX"],
+                    "industry": "Healthcare_Iv1",
+                    "employeesLocalizedLabel": "10,000+",
+                    "revenueLocalizedLabel": "$1B+",
+                    "briefDescription": "Example Health runs pharmacies.",
+                },
+                "images": {"squareLogoUrl": "https://example.com/logo.png"},
+                "links": {"corporateWebsite": "https://example.com"},
+            },
+        },
+        "recruit": {"viewJobUrl": f"https://ats.example.com/jobs/{key}?src=indeed"},
+    }
+
+
+def indeed(pages: int, per_page: int = 100) -> list[Exchange]:
+    exchanges = []
+    for page in range(pages):
+        results = [{"job": indeed_job(f"{page:03d}{i:04d}")} for i in range(per_page)]
+        cursor = f"cursor{page + 1}" if page + 1 < pages else None
+        data = {
+            "data": {
+                "jobSearch": {"results": results, "pageInfo": {"nextCursor": cursor}}
+            }
+        }
+        exchanges.append(json_exchange("POST", "https://apis.indeed.com/graphql", data))
+    return exchanges
+
+
+def glassdoor_listing(listing_id: int) -> dict:
+    return {
+        "jobview": {
+            "job": {"listingId": listing_id, "jobTitleText": "Clinical Pharmacist"},
+            "header": {
+                "employerNameFromSearch": "Example Health",
+                "employer": {"id": 12345},
+                "locationName": "Austin, TX",
+                "locationType": "C",
+                "ageInDays": 2,
+                "payPeriod": "ANNUAL",
+                "payPeriodAdjustedPay": {"p10": 120000.0, "p90": 150000.0},
+                "payCurrency": "USD",
+                "adOrderSponsorshipLevel": "STANDARD",
+            },
+            "overview": {"squareLogoUrl": "https://example.com/logo.png"},
+        }
+    }
+
+
+def glassdoor(pages: int, per_page: int = 30) -> list[Exchange]:
+    base = "https://www.glassdoor.com/"
+    exchanges = [
+        Exchange(
+            "GET",
+            f"{base}/Job/computer-science-jobs.htm",
+            response='<script>window.gdGlobals={"token": "csrf-token"}</script>',
+        ),
+        json_exchange(
+            "GET",
+            f"{base}/findPopularLocationAjax.htm",
+            [{"locationType": "C", "locationId": 1139761, "label": "Austin, TX"}],
+        ),
+    ]
+    for page in range(pages):
+        listings = [
+            glassdoor_listing(1009000000 + page * per_page + i) for i in range(per_page)
+        ]
+        cursors = [
+            {"pageNumber": number + 1, "cursor": f"cursor{number + 1}"}
+            for number in range(pages)
+        ]
+        data = [
+            {
+                "data": {
+                    "jobListings": {
+                        "jobListings": listings,
+                        "paginationCursors": cursors,
+                    }
+                }
+            }
+        ]
+        exchanges.append(
+            json_exchange(
+                "POST",
+                f"{base}/graph",
+                data,
+                body='[{"operationName": "JobSearchResultsQuery"}]',
+            )
+        )
+    exchanges.append(
+        json_exchange(
+            "POST",
+            f"{base}/graph",
+            [{"data": {"jobview": {"job": {"description": DESCRIPTION}}}}],
+            body='[{"operationName": "JobDetailQuery"}]',
+        )
+    )
+    return exchanges
+
+
+def google_job_info(job_id: int) -> list:
+    info = [None] * 30
+    info[0] = f"Clinical Pharmacist {job_id}"
+    info[1] = "Example Health"
+    info[2] = "Austin, TX, United States"
+    info[3] = [[f"https://ats.example.com/jobs/{job_id}?utm_source=google"]]
+    info[12] = "3 days ago"
+    info[19] = (
+        "Clinical pharmacist, full time. Verify prescriptions and counsel patients. "
+        "Pay $55 - $70 per hour. Questions: careers@example.com"
+    )
+    info[28] = f"go{job_id}"
+    info[29] = []
+    return info
+
+
+def google(pages: int, per_page: int = 10) -> list[Exchange]:
+    def compact(data) -> str:
+        return json.dumps(data, separators=(",", ":"))
+
+    initial_jobs = "".join(
+        "<script>AF_initDataCallback([[[[["
+        f"{compact({'520084652': google_job_info(i)})}]]]]]);</script>"
+        for i in range(per_page)
+    )
+    exchanges = [
+        Exchange(
+            "GET",
+            "https://www.google.com/search",
+            response=(
+                '<html><body><div jsname="Yust4d" class="x" data-async-fc="cursor1">'
+                f"</div>{initial_jobs}</body></html>"
+            ),
+        )
+    ]
+    for page in range(1, pages):
+        arrays = [
+            ["0", compact([[[{"520084652": google_job_info(page * per_page + i)}]]])]
+            for i in range(per_page)
+        ]
+        cursor = (
+            f'<div data-async-fc="cursor{page + 1}"></div>' if page + 1 < pages else ""
+        )
+        exchanges.append(
+            Exchange(
+                "GET",
+                "https://www.google.com/async/callback:550",
+                response=f")]}}'\n{cursor}{compact([arrays])}",
+            )
+        )
+    return exchanges
+
+
+def ziprecruiter_job(key: str) -> dict:
+    return {
+        "listing_key": key,
+        "name": f"Clinical Pharmacist {key}",
+        "job_description": DESCRIPTION,
+        "buyer_type": "organic",
+        "hiring_company": {"name": "Example Health"},
+        "job_country": "US",
+        "job_city": "Austin",
+        "job_state": "TX",
+        "employment_type": "full_time",
+        "posted_time": "2024-01-01T00:00:00Z",
+        "compensation_interval": "hourly",
+        "compensation_min": 55,
+        "compensation_max": 70,
+        "compensation_currency": "USD",
+    }
+
+
+def ziprecruiter(pages: int, per_page: int = 20) -> list[Exchange]:
+    exchanges = [
+        json_exchange("POST", "https://api.ziprecruiter.com/jobs-app/event", {})
+    ]
+    for page in range(pages):
+        jobs = [ziprecruiter_job(f"zr{page:03d}{i:03d}") for i in range(per_page)]
+        next_page = f"page{page + 1}" if page + 1 < pages else None
+        exchanges.append(
+            json_exchange(
+                "GET",
+                "https://api.ziprecruiter.com/jobs-app/jobs",
+                {"jobs": jobs, "continue": next_page},
+            )
+        )
+        for job in jobs:
+            apply_url = f"https://ats.example.com/jobs/{job['listing_key']}"
+            model = {"model": {"saveJobURL": f"/save?job_url={apply_url}"}}
+            exchanges.append(
+                Exchange(
+                    "GET",
+                    f"https://www.ziprecruiter.com/jobs//j?lvk={job['listing_key']}",
+                    response=(
+                        f'<html><body><div class="job_description">{DESCRIPTION}</div>'
+                        '<section class="company_description"><p>Example Health '
+                        "runs pharmacies across Texas.</p></section>"
+                        f'<script type="application/json">{json.dumps(model)}</script>'
+                        "</body></html>"
+                    ),
+                )
+            )
+    return exchanges
+
+
+def naukri_job(job_id: str) -> dict:
+    return {
+        "jobId": job_id,
+        "title": "Clinical Pharmacist",
+        "companyName": "Example Health",
+        "staticUrl": "example-health-jobs-careers-123",
+        "jdURL": f"/job-listings-clinical-pharmacist-{job_id}",
+        "placeholders": [
+            {"type": "experience", "label": "2-5 Yrs"},
+            {"type": "salary", "label": "6-9 Lacs P.A."},
+            {"type": "location", "label": "Bengaluru, Karnataka"},
+        ],
+        "footerPlaceholderLabel": "3 Days Ago",
+        "createdDate": 1704067200000,
+        "jobDescription": DESCRIPTION
+        + '<span class="job-type">Full-time</span><span class="industry">Pharma</span>',
+        "tagsAndSkills": "pharmacy,clinical research,patient counselling",
+        "experienceText": "2-5 Yrs",
+        "ambitionBoxData": {"AggregateRating": "4.1", "ReviewsCount": 1520},
+        "vacancy": 3,
+        "logoPathV3": "https://img.naukimg.com/logo.gif",
+    }
+
+
+def naukri(pages: int, per_page: int = 20) -> list[Exchange]:
+    exchanges = []
+    for page in range(pages):
+        jobs = [naukri_job(f"nk{page:03d}{i:03d}") for i in range(per_page)]
+        exchanges.append(
+            json_exchange(
+                "GET", "https://www.naukri.com/jobapi/v3/search", {"jobDetails": jobs}
+            )
+        )
+    exchanges.append(
+        json_exchange(
+            "GET", "https://www.naukri.com/jobapi/v3/search", {"jobDetails": []}
+        )
+    )
+    return exchanges
+
+
+def bdjobs(pages: int, per_page: int = 20) -> list[Exchange]:
+    exchanges = []
+    search_url = "https://jobs.bdjobs.com/jobsearch.asp"
+    for page in range(pages):
+        cards = []
+        for i in range(per_page):
+            job_id = 1300000 + page * per_page + i
+            detail_path = f"jobdetails.asp?id={job_id}&jobid={job_id}"
+            cards.append(
+                f"""<div class="job-item"><div class="job-title-text">
+<a href="{detail_path}">Pharmacist {job_id}</a></div>
+<div class="comp-name-text">Example Pharma Ltd.</div>
+<div class="locon-text-d">Dhaka, Bangladesh</div>
+<div class="dead-text-d">Deadline: 15 Feb 2024</div></div>"""
+            )
+            exchanges.append(
+                Exchange(
+                    "GET",
+                    f"https://jobs.bdjobs.com/{detail_path}",
+                    response=(
+                        '<html><body><div class="jobcontent">'
+                        '<h4 id="job_resp">Job Responsibilities</h4>'
+                        "<ul><li>Dispense medicines accurately</li>"
+                        "<li>Counsel patients on dosage</li>"
+                        "<li>Maintain pharmacy inventory</li></ul><hr></div>"
+                        "<div><span>Employment Status</span>"
+                        "<span>Full-time</span></div>"
+                        "</body></html>"
+                    ),
+                )
+            )
+        exchanges.append(
+            Exchange(
+                "GET",
+                search_url,
+                response=f"<html><body>{''.join(cards)}</body></html>",
+            )
+        )
+    exchanges.append(Exchange("GET", search_url, response="<html><body></body></html>"))
+    return exchanges
+
+
+def bayt(pages: int, per_page: int = 20) -> list[Exchange]:
+    exchanges = []
+    search_url = "https://www.bayt.com/en/international/jobs/pharmacist-jobs/"
+    for page in range(1, pages + 1):
+        items = "".join(
+            f"""<li data-js-job="">
+<h2><a href="/en/uae/jobs/clinical-pharmacist-{page * 1000 + i}/">Clinical Pharmacist</a></h2>
+<div class="t-nowrap p10l"><span>Example Health</span></div>
+<div class="t-mute t-small">Dubai, UAE</div></li>"""
+            for i in range(per_page)
+        )
+        exchanges.append(
+            Exchange(
+                "GET",
+                f"{search_url}?page={page}",
+                response=f"<html><body><ul>{items}</ul></body></html>",
+            )
+        )
+    exchanges.append(
+        Exchange(
+            "GET",
+            f"{search_url}?page={pages + 1}",
+            response="<html><body><ul></ul></body></html>",
+        )
+    )
+    return exchanges
+
+
+SYNTHETIC = {
+    "linkedin": linkedin,
+    "indeed": indeed,
+    "glassdoor": glassdoor,
+    "google": google,
+    "zip_recruiter": ziprecruiter,
+    "naukri": naukri,
+    "bdjobs": bdjobs,
+    "bayt": bayt,
+}
+
+
+def synthetic_store(pages: int = 5, sites: list[str] | None = None) -> FixtureStore:
+    """
+    Fixtures for every site (or just sites), each with pages search pages
+    """
+    store = FixtureStore()
+    for site in sites or SYNTHETIC:
+        store.extend(SYNTHETIC[site](pages))
+    return store
@@ -0,0 +1,185 @@
+"""
+Local PostgREST stand-in for timing uploads: answers the bulk insert / upsert POSTs
+the supabase client sends to /rest/v1/<table> with PostgREST's status codes and
+error bodies, so batching, retries and bad-row isolation can be exercised offline.
+
+Each request is one transaction: the first bad row rejects the whole request, as
+Postgres does. Rejections modelled:
+
+- 413 (plain text, like the gateway) for a body over max_body bytes
+- 503 (plain text) for a random fail_rate share of requests
+- 400 42P10 for an on_conflict column without a unique constraint
+- 400 21000 for a batch upserting the same conflict key twice
+- 400 23502 / 23514 for not-null and check constraint violations
+- 409 23505 for an insert of a key that is already stored
+
+    with PostgrestStandin(unique=("job_url",), not_null=("title",)) as server:
+        client = create_client(server.url, "anon-key")
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class Rejected(Exception):
+    def __init__(self, status: int, code: str, message: str, details: str = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {"code": code, "message": message, "details": details, "hint": None}
+
+
+class PostgrestStandin:
+    """
+    In-memory tables behind a PostgREST-like endpoint. latency seconds plus
+    row_latency per row are slept before each answer.
+    """
+
+    def __init__(
+        self,
+        unique: tuple[str, ...] = ("job_url",),
+        not_null: tuple[str, ...] = (),
+        checks: dict[str, set] | None = None,
+        max_body: int = 2_000_000,
+        fail_rate: float = 0.0,
+        latency: float = 0.0,
+        row_latency: float = 0.0,
+        seed: int = 0,
+    ):
+        self.unique = set(unique)
+        self.not_null = not_null
+        self.checks = checks or {}
+        self.max_body = max_body
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.row_latency = row_latency
+        self.tables: dict[str, dict] = {}
+        self.requests = 0
+        self.bytes = 0
+        self.statuses: dict[int, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "PostgrestStandin":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def rows(self, table: str) -> list[dict]:
+        with self._lock:
+            return list(self.tables.get(table, {}).values())
+
+    def write(self, table: str, rows: list[dict], on_conflict: str | None):
+        """
+        Applies one request's rows to a table, all or nothing
+        """
+        if on_conflict and on_conflict not in self.unique:
+            raise Rejected(
+                400,
+                "42P10",
+                "there is no unique or exclusion constraint matching the ON CONFLICT"
+                " specification",
+            )
+        key_column = on_conflict or next(iter(sorted(self.unique)))
+        for row in rows:
+            for column in self.not_null:
+                if row.get(column) is None:
+                    raise Rejected(
+                        400,
+                        "23502",
+                        f'null value in column "{column}" of relation "{table}"'
+                        " violates not-null constraint",
+                    )
+            for column, allowed in self.checks.items():
+                if row.get(column) is not None and row[column] not in allowed:
+                    raise Rejected(
+                        400,
+                        "23514",
+                        f'new row for relation "{table}" violates check constraint'
+                        f' "{table}_{column}_check"',
+                    )
+        keys = [row.get(key_column) for row in rows]
+        with self._lock:
+            stored = self.tables.setdefault(table, {})
+            if on_conflict:
+                if len(set(keys)) < len(keys):
+                    raise Rejected(
+                        400,
+                        "21000",
+                        "ON CONFLICT DO UPDATE command cannot affect row a second time",
+                    )
+                for key, row in zip(keys, rows):
+                    stored[key] = {**stored.get(key, {}), **row}
+            else:
+                seen = set()
+                for key in keys:
+                    if key in stored or key in seen:
+                        raise Rejected(
+                            409,
+                            "23505",
+                            "duplicate key value violates unique constraint"
+                            f' "{table}_{key_column}_key"',
+                            f"Key ({key_column})=({key}) already exists.",
+                        )
+                    seen.add(key)
+                for key, row in zip(keys, rows):
+                    stored[key] = row
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: bytes, content_type: str):
+                with standin._lock:
+                    standin.statuses[status] = standin.statuses.get(status, 0) + 1
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                with standin._lock:
+                    standin.requests += 1
+                    standin.bytes += length
+                    unavailable = standin._random.random() < standin.fail_rate
+                url = urlsplit(self.path)
+                table = url.path.rsplit("/", 1)[-1]
+                on_conflict = parse_qs(url.query).get("on_conflict", [None])[0]
+                if length > standin.max_body:
+                    return self._send(413, b"Payload Too Large", "text/plain")
+                rows = json.loads(body)
+                rows = rows if isinstance(rows, list) else [rows]
+                time.sleep(standin.latency + standin.row_latency * len(rows))
+                if unavailable:
+                    return self._send(503, b"upstream connect error", "text/plain")
+                try:
+                    standin.write(table, rows, on_conflict)
+                except Rejected as rejected:
+                    payload = json.dumps(rejected.body).encode("utf-8")
+                    return self._send(rejected.status, payload, "application/json")
+                if "return=minimal" in (self.headers.get("Prefer") or ""):
+                    return self._send(201, b"", "application/json")
+                self._send(201, json.dumps(rows).encode("utf-8"), "application/json")
+
+        return Handler
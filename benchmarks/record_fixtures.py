@@ -0,0 +1,54 @@
+"""
+Records live responses from the job boards into replay fixtures, one file per site,
+for benchmarks/bench_scrapers.py --fixtures.
+
+    python benchmarks/record_fixtures.py --out benchmarks/fixtures --results-wanted 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jobspy import SCRAPER_MAPPING
+from jobspy.model import Country, ScraperInput, Site
+from benchmarks.replay import FixtureStore, recording
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default="benchmarks/fixtures")
+    parser.add_argument("--sites", nargs="+", default=[site.value for site in Site])
+    parser.add_argument("--search-term", default="pharmacist")
+    parser.add_argument("--location", default="Austin, TX")
+    parser.add_argument("--results-wanted", type=int, default=50)
+    parser.add_argument("--proxies", nargs="*")
+    args = parser.parse_args()
+
+    for site in map(Site, args.sites):
+        store = FixtureStore()
+        with recording(store):
+            scraper = SCRAPER_MAPPING[site](proxies=args.proxies)
+            jobs = scraper.scrape(
+                ScraperInput(
+                    site_type=[site],
+                    search_term=args.search_term,
+                    location=args.location,
+                    country=Country.USA,
+                    results_wanted=args.results_wanted,
+                    linkedin_fetch_description=True,
+                )
+            ).jobs
+        path = os.path.join(args.out, f"{site.value}.json")
+        store.save(path)
+        print(
+            f"{site.value}: {len(jobs)} jobs,"
+            f" {len(store.exchanges)} exchanges -> {path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Offline replay harness: records the HTTP exchanges a scraper makes and serves them
+back from a local stand-in server, so parsers and the result pipeline can be timed
+without touching the live job boards.
+
+Every request made through requests, tls_client or the async httpx client is
+rewritten to ``http://127.0.0.1:<port>/<original host><original path>``; the server
+answers it from a FixtureStore.
+
+    store = FixtureStore.load("benchmarks/fixtures")
+    with ReplayServer(store) as server, server.redirect():
+        LinkedIn().scrape(scraper_input)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+import tls_client
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+OPERATION_NAME = re.compile(r'"operationName"\s*:\s*"([^"]+)"')
+
+
+@dataclass
+class Exchange:
+    """
+    One recorded request and the response the job board gave to it. body is the
+    request body; a GET fixture leaves it empty.
+    """
+
+    method: str
+    url: str
+    status: int = 200
+    content_type: str = "text/html; charset=utf-8"
+    response: str = ""
+    body: str = ""
+
+    @property
+    def exact_key(self) -> tuple:
+        return self.method.upper(), normalize_url(self.url), digest(self.body)
+
+    @property
+    def loose_key(self) -> tuple:
+        parts = urlsplit(self.url)
+        return self.method.upper(), parts.netloc, parts.path, operation(self.body)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Drops the scheme and sorts the query so equal requests compare equal
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.netloc}{parts.path}?{query}"
+
+
+def digest(body: str | bytes | None) -> str:
+    """
+    Hashes a request body, ignoring JSON key order and whitespace
+    """
+    if not body:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        pass
+    return hashlib.sha1(body.encode()).hexdigest()
+
+
+def operation(body: str | bytes | None) -> str | None:
+    """
+    GraphQL operation name of a request body, used to tell apart requests that
+    share a url (Glassdoor search and job detail both POST to /graph)
+    """
+    if not body:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    match = OPERATION_NAME.search(body)
+    return match.group(1) if match else None
+
+
+def batched_operations(body: str) -> list[dict] | None:
+    """
+    The operations of a request body batching several GraphQL operations, else None
+    """
+    if not body.startswith("[") or body.count('"operationName"') < 2:
+        return None
+    try:
+        operations = json.loads(body)
+    except ValueError:
+        return None
+    return operations if all(isinstance(op, dict) for op in operations) else None
+
+
+@dataclass
+class FixtureStore:
+    """
+    Recorded exchanges, answered by exact request match first. Requests that were
+    not recorded verbatim (other search term, paging cursor) fall back to the
+    exchanges sharing their method, host, path and GraphQL operation, served in
+    recorded order and repeating the last one once exhausted.
+    """
+
+    exchanges: list[Exchange] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add(self, exchange: Exchange):
+        with self._lock:
+            self.exchanges.append(exchange)
+            self._index(exchange)
+
+    def extend(self, exchanges: list[Exchange]):
+        for exchange in exchanges:
+            self.add(exchange)
+
+    def reset(self):
+        """
+        Rewinds the in-order fallback, call before replaying a scrape again
+        """
+        self._exact: dict[tuple, Exchange] = {}
+        self._loose: dict[tuple, list[Exchange]] = {}
+        self._served: dict[tuple, int] = {}
+        self.misses: list[str] = []
+        for exchange in self.exchanges:
+            self._index(exchange)
+
+    def _index(self, exchange: Exchange):
+        self._exact.setdefault(exchange.exact_key, exchange)
+        self._loose.setdefault(exchange.loose_key, []).append(exchange)
+
+    def match(self, method: str, url: str, body: bytes = b"") -> Exchange | None:
+        body = body.decode("utf-8", "replace")
+        operations = batched_operations(body)
+        if operations is None:
+            return self._match(method, url, body)
+        # a GraphQL batch (Glassdoor's JobDetailQuery): each operation is answered
+        # like a request of its own and the results concatenated in order
+        exchanges = [
+            self._match(method, url, json.dumps([operation]))
+            for operation in operations
+        ]
+        if any(exchange is None for exchange in exchanges):
+            return None
+        results = [result for e in exchanges for result in json.loads(e.response)]
+        return Exchange(
+            method,
+            url,
+            status=exchanges[0].status,
+            content_type=exchanges[0].content_type,
+            response=json.dumps(results),
+            body=body,
+        )
+
+    def _match(self, method: str, url: str, body: str) -> Exchange | None:
+        request = Exchange(method, url, body=body)
+        with self._lock:
+            exchange = self._exact.get(request.exact_key)
+            if exchange:
+                return exchange
+            candidates = self._loose.get(request.loose_key)
+            if not candidates:
+                self.misses.append(f"{method} {url}")
+                return None
+            served = self._served.get(request.loose_key, 0)
+            self._served[request.loose_key] = served + 1
+            return candidates[min(served, len(candidates) - 1)]
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureStore":
+        """
+        Loads a fixture file, or every *.json file of a directory
+        """
+        paths = [path]
+        if os.path.isdir(path):
+            paths = [
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(".json")
+            ]
+        exchanges = []
+        for file_path in paths:
+            with open(file_path, encoding="utf-8") as f:
+                exchanges.extend(Exchange(**exchange) for exchange in json.load(f))
+        return cls(exchanges)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([asdict(exchange) for exchange in self.exchanges], f, indent=1)
+
+
+class ReplayServer:
+    """
+    Serves a FixtureStore on localhost. latency seconds are slept before each answer
+    to stand in for the network round trip.
+    """
+
+    def __init__(self, store: FixtureStore, latency: float = 0.0):
+        self.store = store
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "ReplayServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _answer(self):
+                with replay._lock:
+                    replay.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                exchange = replay.store.match(
+                    self.command, replay.original_url(self.path), body
+                )
+                if replay.latency:
+                    time.sleep(replay.latency)
+                if exchange is None:
+                    status, content_type, payload = 404, "text/plain", b"no fixture"
+                else:
+                    status = exchange.status
+                    content_type = exchange.content_type
+                    payload = exchange.response.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _answer
+
+        return Handler
+
+    def rewrite(self, url: str) -> str:
+        """
+        Points an absolute job board url at this server, keeping host, path and query
+        """
+        target = urlsplit(self.url)
+        parts = urlsplit(requests.utils.requote_uri(url))
+        return urlunsplit(
+            (
+                target.scheme,
+                target.netloc,
+                f"/{parts.netloc}{parts.path}",
+                parts.query,
+                "",
+            )
+        )
+
+    @staticmethod
+    def original_url(path: str) -> str:
+        host, _, rest = path.lstrip("/").partition("/")
+        return f"https://{host}/{rest}"
+
+    @contextmanager
+    def redirect(self):
+        """
+        Sends every request made through requests, tls_client and httpx to this
+        server for the duration of the block
+        """
+        with ExitStack() as stack:
+            for target, name, url_index in _transports():
+                original = getattr(target, name)
+                stack.enter_context(
+                    mock.patch.object(
+                        target,
+                        name,
+                        _with_url(original, url_index, self.rewrite),
+                    )
+                )
+            yield self
+
+
+@contextmanager
+def recording(store: FixtureStore):
+    """
+    Lets requests go out to the live sites and adds every exchange to store
+    """
+
+    with ExitStack() as stack:
+        for target, name, url_index in _transports():
+            original = getattr(target, name)
+            stack.enter_context(
+                mock.patch.object(target, name, _recorded(original, url_index, store))
+            )
+        yield store
+
+
+def _transports() -> list[tuple]:
+    """
+    The request entry points of every HTTP client jobspy uses, with the position
+    of the url argument. The rotating sessions and module-level requests calls
+    all end up in one of these.
+    """
+    transports = [
+        (requests.Session, "request", 2),
+        (tls_client.Session, "execute_request", 2),
+    ]
+    if httpx is not None:
+        transports.append((httpx.AsyncClient, "request", 2))
+    return transports
+
+
+def _with_url(func, url_index: int, rewrite):
+    def replace(args, kwargs):
+        if len(args) > url_index:
+            url = rewrite(args[url_index])
+            return (*args[:url_index], url, *args[url_index + 1 :]), kwargs
+        return args, {**kwargs, "url": rewrite(kwargs["url"])}
+
+    if inspect.iscoroutinefunction(func):
+
+        async def wrapper(*args, **kwargs):
+            args, kwargs = replace(args, kwargs)
+            return await func(*args, **kwargs)
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            args, kwargs = replace(args, kwargs)
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _recorded(func, url_index: int, store: FixtureStore):
+    def save(args, kwargs, response):
+        method = args[url_index - 1] if len(args) >= url_index else kwargs["method"]
+        url = args[url_index] if len(args) > url_index else kwargs["url"]
+        full_url = requests.models.PreparedRequest()
+        full_url.prepare_url(url, kwargs.get("params"))
+        store.add(
+            Exchange(
+                method=method.upper(),
+                url=full_url.url,
+                status=response.status_code,
+                content_type=response.headers.get("content-type", ""),
+                response=response.text,
+                body=_request_body(kwargs),
+            )
+        )
+
+    if inspect.iscoroutinefunction(func):
+
+        async def wrapper(*args, **kwargs):
+            response = await func(*args, **kwargs)
+            save(args, kwargs, response)
+            return response
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            response = func(*args, **kwargs)
+            save(args, kwargs, response)
+            return response
+
+    return wrapper
+
+
+def _request_body(kwargs: dict) -> str:
+    if kwargs.get("json") is not None:
+        return json.dumps(kwargs["json"])
+    data = kwargs.get("data", kwargs.get("content"))
+    if data is None:
+        return ""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", "replace")
+    if isinstance(data, (dict, list, tuple)):
+        return urlencode(data)
+    return str(data)
@@ -1,32 +1,73 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
 
 import pandas as pd
 
+from jobspy.archive import JobArchive
+from jobspy.arrow import annualize_table, import_pyarrow, write_parquet
 from jobspy.bayt import BaytScraper
 from jobspy.bdjobs import BDJobs
+from jobspy.dedupe import (
+    drop_near_duplicates,
+    drop_url_duplicates,
+    find_near_duplicates,
+)
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
+from jobspy.upload import UploadReport, upload_batches
+from jobspy.urls import UrlIndex, canonical_url, url_identity
+from jobspy.cache import ConversionCache, ResponseCache
+from jobspy.converter import markdown_converter, plain_converter
+from jobspy.known import BloomFilter, KnownIds
 from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.model import SalarySource, ScraperInput, Site, Scraper, JobPost
+from jobspy.model import DescriptionFormat, JobRecord
 from jobspy.util import (
     set_logger_level,
-    extract_salary,
     create_logger,
     get_enum_from_value,
     map_str_to_site,
-    convert_to_annual,
-    desired_order,
+    flatten_job_post,
+    annualize_salaries,
+    JobFrameBuilder,
+    AsyncClient,
+    configure_connection_pools,
+    close_connection_pools,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,
+}
+
+# rows buffered between the site workers and the consumer of iter_jobs
+ROW_QUEUE_SIZE = 1000
+
+# scrape_jobs(output=...) result types
+OUTPUT_FORMATS = ("pandas", "arrow")
+
+_SITE_DONE = object()
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -49,22 +90,453 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    response_cache: ResponseCache | str | None = None,
+    conversion_cache: ConversionCache | str | None = None,
+    known_ids: set[str] | Callable[[str], bool] | BloomFilter | str | None = None,
+    skip_known: bool = False,
+    html_parser: str | None = None,
+    description_converter: str | None = None,
+    validate_jobs: bool = False,
+    dedupe_urls: bool = False,
+    output: str = "pandas",
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | pa.Table:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
-    """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-    }
+    :param output: pandas for a DataFrame, arrow for a pyarrow Table with the fixed
+        jobspy.arrow.job_schema() (pip install python-jobspy[arrow])
+    :param dedupe_urls: leave out jobs whose job_url, or ATS job_url_direct, names a
+        posting an earlier job of the run already had (UrlIndex.claim_job)
+    :return: Pandas DataFrame (or pyarrow Table) containing job data
+    """
+    _check_output(output)
+    # salaries are annualized column-wise on the finished frame instead of per row
+    builder = JobFrameBuilder()
+    builder.extend(
+        iter_jobs(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            offset=offset,
+            hours_old=hours_old,
+            enforce_annual_salary=False,
+            verbose=verbose,
+            user_agent=user_agent,
+            response_cache=response_cache,
+            conversion_cache=conversion_cache,
+            known_ids=known_ids,
+            skip_known=skip_known,
+            html_parser=html_parser,
+            description_converter=description_converter,
+            validate_jobs=validate_jobs,
+            dedupe_urls=dedupe_urls,
+            **kwargs,
+        )
+    )
+    return _build_output(builder, output, enforce_annual_salary)
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    response_cache: ResponseCache | str | None = None,
+    conversion_cache: ConversionCache | str | None = None,
+    known_ids: set[str] | Callable[[str], bool] | BloomFilter | str | None = None,
+    skip_known: bool = False,
+    html_parser: str | None = None,
+    description_converter: str | None = None,
+    validate_jobs: bool = False,
+    dedupe_urls: bool = False,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Scrapes job boards concurrently and yields each job as a flattened row (the
+    same columns as the scrape_jobs DataFrame) as soon as its search page is parsed.
+    Closing the generator early stops the remaining site workers.
+    :return: iterator of job rows
+    """
+    run = _prepare_run(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        proxies=proxies,
+        ca_cert=ca_cert,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        enforce_annual_salary=enforce_annual_salary,
+        verbose=verbose,
+        user_agent=user_agent,
+        response_cache=response_cache,
+        conversion_cache=conversion_cache,
+        known_ids=known_ids,
+        skip_known=skip_known,
+        html_parser=html_parser,
+        description_converter=description_converter,
+        validate_jobs=validate_jobs,
+        dedupe_urls=dedupe_urls,
+        **kwargs,
+    )
+    rows: queue.Queue = queue.Queue(maxsize=ROW_QUEUE_SIZE)
+    stop_event = threading.Event()
+
+    def put(item) -> bool:
+        return _put_until_stopped(rows, item, stop_event)
+
+    def scrape_site(site: Site):
+        try:
+            scraper = run.create_scraper(site)
+            pages = scraper.scrape_pages(run.scraper_input)
+            try:
+                for jobs in pages:
+                    for job in jobs:
+                        if not put(run.flatten(job, site)):
+                            return
+            finally:
+                pages.close()
+            _log_finished(site)
+        except Exception as e:
+            put(e)
+        finally:
+            put(_SITE_DONE)
+
+    executor = ThreadPoolExecutor()
+    try:
+        for site in run.scraper_input.site_type:
+            executor.submit(scrape_site, site)
+        pending = len(run.scraper_input.site_type)
+        while pending:
+            item = rows.get()
+            if item is _SITE_DONE:
+                pending -= 1
+            elif isinstance(item, Exception):
+                raise item
+            elif run.is_new(item):
+                yield item
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_scrape_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    response_cache: ResponseCache | str | None = None,
+    conversion_cache: ConversionCache | str | None = None,
+    known_ids: set[str] | Callable[[str], bool] | BloomFilter | str | None = None,
+    skip_known: bool = False,
+    html_parser: str | None = None,
+    description_converter: str | None = None,
+    validate_jobs: bool = False,
+    dedupe_urls: bool = False,
+    output: str = "pandas",
+    max_in_flight: int = 100,
+    **kwargs,
+) -> pd.DataFrame | pa.Table:
+    """
+    Scrapes job data from job boards concurrently on the running event loop, with
+    the same arguments as scrape_jobs
+    :param max_in_flight: cap on concurrent HTTP requests across all sites
+    :return: Pandas DataFrame (or pyarrow Table) containing job data
+    """
+    _check_output(output)
+    builder = JobFrameBuilder()
+    rows = async_iter_jobs(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        proxies=proxies,
+        ca_cert=ca_cert,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        enforce_annual_salary=False,
+        verbose=verbose,
+        user_agent=user_agent,
+        response_cache=response_cache,
+        conversion_cache=conversion_cache,
+        known_ids=known_ids,
+        skip_known=skip_known,
+        html_parser=html_parser,
+        description_converter=description_converter,
+        validate_jobs=validate_jobs,
+        dedupe_urls=dedupe_urls,
+        max_in_flight=max_in_flight,
+        **kwargs,
+    )
+    async for row in rows:
+        builder.append(row)
+    return _build_output(builder, output, enforce_annual_salary)
+
+
+async def async_iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    response_cache: ResponseCache | str | None = None,
+    conversion_cache: ConversionCache | str | None = None,
+    known_ids: set[str] | Callable[[str], bool] | BloomFilter | str | None = None,
+    skip_known: bool = False,
+    html_parser: str | None = None,
+    description_converter: str | None = None,
+    validate_jobs: bool = False,
+    dedupe_urls: bool = False,
+    max_in_flight: int = 100,
+    **kwargs,
+) -> AsyncIterator[dict]:
+    """
+    Async variant of iter_jobs taking the same arguments. Every site runs as a task
+    on the running event loop and sends its requests through one shared AsyncClient;
+    scrapers without a native async implementation run page by page in worker threads.
+    :param max_in_flight: cap on concurrent HTTP requests across all sites
+    :return: async iterator of job rows
+    """
+    run = _prepare_run(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        proxies=proxies,
+        ca_cert=ca_cert,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        enforce_annual_salary=enforce_annual_salary,
+        verbose=verbose,
+        user_agent=user_agent,
+        response_cache=response_cache,
+        conversion_cache=conversion_cache,
+        known_ids=known_ids,
+        skip_known=skip_known,
+        html_parser=html_parser,
+        description_converter=description_converter,
+        validate_jobs=validate_jobs,
+        dedupe_urls=dedupe_urls,
+        **kwargs,
+    )
+    rows: asyncio.Queue = asyncio.Queue(maxsize=ROW_QUEUE_SIZE)
+
+    async with AsyncClient(
+        proxies=run.proxies, ca_cert=run.ca_cert, max_in_flight=max_in_flight
+    ) as client:
+
+        async def scrape_site(site: Site):
+            try:
+                scraper = await asyncio.to_thread(run.create_scraper, site)
+                pages = scraper.scrape_pages_async(run.scraper_input, client)
+                try:
+                    async for jobs in pages:
+                        for job in jobs:
+                            await rows.put(run.flatten(job, site))
+                finally:
+                    await pages.aclose()
+                _log_finished(site)
+            except Exception as e:
+                await rows.put(e)
+            await rows.put(_SITE_DONE)
+
+        tasks = [
+            asyncio.create_task(scrape_site(site))
+            for site in run.scraper_input.site_type
+        ]
+        try:
+            pending = len(tasks)
+            while pending:
+                item = await rows.get()
+                if item is _SITE_DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif run.is_new(item):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _check_output(output: str):
+    """
+    Rejects an unknown output before any site is scraped
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"output must be one of {', '.join(OUTPUT_FORMATS)}")
+    if output == "arrow":
+        import_pyarrow()
+
+
+def _build_output(
+    builder: JobFrameBuilder, output: str, enforce_annual_salary: bool
+) -> pd.DataFrame | pa.Table:
+    if output == "arrow":
+        table = builder.to_arrow()
+        return annualize_table(table) if enforce_annual_salary else table
+    jobs_df = builder.to_dataframe()
+    return annualize_salaries(jobs_df) if enforce_annual_salary else jobs_df
+
+
+@dataclass
+class _ScrapeRun:
+    scraper_input: ScraperInput
+    country: Country
+    proxies: list[str] | str | None
+    ca_cert: str | None
+    user_agent: str | None
+    enforce_annual_salary: bool
+    validate_jobs: bool = False
+    url_index: UrlIndex | None = None
+
+    def create_scraper(self, site: Site) -> Scraper:
+        scraper_class = SCRAPER_MAPPING[site]
+        return scraper_class(
+            proxies=self.proxies, ca_cert=self.ca_cert, user_agent=self.user_agent
+        )
+
+    def flatten(self, job: JobRecord | JobPost, site: Site) -> dict:
+        if self.validate_jobs and isinstance(job, JobRecord):
+            job = job.to_model()
+        return flatten_job_post(
+            job,
+            site.value,
+            self.country,
+            enforce_annual_salary=self.enforce_annual_salary,
+        )
+
+    def is_new(self, row: dict) -> bool:
+        """
+        Whether a row is the first of its posting in the run, when deduplicating URLs;
+        rows are checked on the consumer's side, one at a time
+        """
+        if self.url_index is None:
+            return True
+        return self.url_index.claim_job(row.get("job_url"), row.get("job_url_direct"))
+
+
+def _prepare_run(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    response_cache: ResponseCache | str | None = None,
+    conversion_cache: ConversionCache | str | None = None,
+    known_ids: set[str] | Callable[[str], bool] | BloomFilter | str | None = None,
+    skip_known: bool = False,
+    html_parser: str | None = None,
+    description_converter: str | None = None,
+    validate_jobs: bool = False,
+    dedupe_urls: bool = False,
+    **kwargs,
+) -> _ScrapeRun:
+    """
+    Validates the scrape_jobs arguments into the ScraperInput shared by every site
+    """
     set_logger_level(verbose)
     job_type = get_enum_from_value(job_type) if job_type else None
 
@@ -99,129 +571,117 @@ def scrape_jobs(
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
+        response_cache=(
+            ResponseCache(response_cache)
+            if isinstance(response_cache, str)
+            else response_cache
+        ),
+        conversion_cache=(
+            ConversionCache(conversion_cache)
+            if isinstance(conversion_cache, str)
+            else conversion_cache
+        ),
+        known_ids=KnownIds(known_ids) if known_ids is not None else None,
+        skip_known=skip_known,
+        html_parser=html_parser,
+        description_converter=description_converter,
+    )
+    return _ScrapeRun(
+        scraper_input=scraper_input,
+        country=country_enum,
+        proxies=proxies,
+        ca_cert=ca_cert,
+        user_agent=user_agent,
+        enforce_annual_salary=enforce_annual_salary,
+        validate_jobs=validate_jobs,
+        url_index=UrlIndex() if dedupe_urls else None,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
-
-    site_to_jobs_dict = {}
-
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
-
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
-        return pd.DataFrame()
+
+def convert_descriptions(
+    jobs: pd.DataFrame,
+    description_format: str = "markdown",
+    conversion_cache: ConversionCache | str | None = None,
+    description_converter: str | None = None,
+) -> pd.DataFrame:
+    """
+    Converts the raw HTML descriptions of a description_format="lazy" scrape, meant
+    to run once the jobs are filtered down to the ones worth keeping. Each distinct
+    description is converted once; boards returning text are left as they are.
+    :param jobs: scrape_jobs result, or a DataFrame of iter_jobs rows
+    :param description_format: markdown or plain
+    :return: copy of jobs with converted descriptions, jobs itself when it has no
+        descriptions (e.g. the empty DataFrame of a scrape that found nothing)
+    """
+    description_format = DescriptionFormat(description_format)
+    if description_format not in (DescriptionFormat.MARKDOWN, DescriptionFormat.PLAIN):
+        raise ValueError("description_format must be markdown or plain")
+    if jobs.empty or not {"site", "description"}.issubset(jobs.columns):
+        return jobs
+    convert = (
+        markdown_converter
+        if description_format == DescriptionFormat.MARKDOWN
+        else plain_converter
+    )
+    if isinstance(conversion_cache, str):
+        conversion_cache = ConversionCache(conversion_cache)
+    html_sites = [
+        site.value
+        for site, scraper_class in SCRAPER_MAPPING.items()
+        if scraper_class.html_descriptions
+    ]
+    jobs = jobs.copy()
+    rows = jobs["site"].isin(html_sites) & jobs["description"].notna()
+    descriptions = jobs.loc[rows, "description"]
+    converted = {
+        html: convert(html, conversion_cache, description_converter)
+        for html in descriptions.unique()
+    }
+    jobs.loc[rows, "description"] = descriptions.map(converted)
+    return jobs
+
+
+def _log_finished(site: Site):
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
+    create_logger(site_name).info(f"finished scraping")
+
+
+def _put_until_stopped(rows: queue.Queue, item, stop_event: threading.Event) -> bool:
+    """
+    Blocks until the item fits in the queue, giving up once the consumer has stopped
+    """
+    while not stop_event.is_set():
+        try:
+            rows.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
-]
\ No newline at end of file
+    "scrape_jobs",
+    "iter_jobs",
+    "convert_descriptions",
+    "async_iter_jobs",
+    "async_scrape_jobs",
+    "ResponseCache",
+    "ConversionCache",
+    "BloomFilter",
+    "write_parquet",
+    "JobArchive",
+    "upload_batches",
+    "UploadReport",
+    "find_near_duplicates",
+    "drop_near_duplicates",
+    "drop_url_duplicates",
+    "canonical_url",
+    "url_identity",
+    "UrlIndex",
+    "configure_connection_pools",
+    "close_connection_pools",
+]
@@ -0,0 +1,290 @@
+"""
+jobspy.archive
+~~~~~~~~~~~~~~
+
+Local archive of scrape results across runs: every run is merged into one SQLite
+table keyed by job, tracking when each job was first and last seen, so a nightly
+job can ask for the postings that are new since the previous run without loading
+the history.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Iterable
+
+import pandas as pd
+
+from jobspy.util import desired_order
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# SQLite type of the desired_order columns that are not TEXT
+COLUMN_TYPES = {
+    "min_amount": "REAL",
+    "max_amount": "REAL",
+    "is_remote": "INTEGER",
+    "company_rating": "REAL",
+    "company_reviews_count": "INTEGER",
+    "vacancy_count": "INTEGER",
+}
+
+# bookkeeping columns of the jobs table, ahead of the desired_order columns
+TRACKING_COLUMNS = ["key", "first_seen", "last_seen", "first_run", "last_run"]
+
+
+def _key(job_id, job_url) -> str | None:
+    """
+    Archive key of a job: its id, else its job_url
+    """
+    for value in (job_id, job_url):
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _sql_value(value):
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        # numpy scalar
+        return _sql_value(value.item())
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _frame(jobs) -> pd.DataFrame:
+    if isinstance(jobs, pd.DataFrame):
+        return jobs
+    if hasattr(jobs, "to_pandas"):
+        # pyarrow Table
+        return jobs.to_pandas()
+    return pd.DataFrame(list(jobs))
+
+
+def _column(jobs: pd.DataFrame, column: str) -> list:
+    return jobs[column].tolist() if column in jobs.columns else [None] * len(jobs)
+
+
+def _sql_columns(jobs: pd.DataFrame) -> list[list]:
+    """
+    The desired_order columns of a DataFrame as lists of SQLite values; text columns
+    only need their missing values replaced
+    """
+    columns = []
+    for column in desired_order:
+        if column in COLUMN_TYPES or column == "date_posted":
+            columns.append([_sql_value(value) for value in _column(jobs, column)])
+        elif column not in jobs.columns:
+            columns.append([None] * len(jobs))
+        else:
+            values = jobs[column].astype(object)
+            columns.append(values.where(values.notna(), None).tolist())
+    return columns
+
+
+class JobArchive:
+    """
+    SQLite archive of scrape results. add_run() merges a run's jobs on their key
+    (id, else job_url): new jobs are inserted with first_seen set, known jobs get
+    last_seen bumped and their columns updated where the run has a value. Runs are
+    numbered, and first_run / last_run are indexed, so new_jobs() reads only the
+    rows it returns. Safe to share between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                seen_at TEXT NOT NULL,
+                jobs INTEGER NOT NULL,
+                new_jobs INTEGER NOT NULL
+            )
+            """
+        )
+        columns = ", ".join(
+            f"{column} {COLUMN_TYPES.get(column, 'TEXT')}" for column in desired_order
+        )
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS jobs (
+                key TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                first_run INTEGER NOT NULL,
+                last_run INTEGER NOT NULL,
+                {columns}
+            )
+            """
+        )
+        # archives created before a column was added to desired_order
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column in desired_order:
+            if column not in existing:
+                self._conn.execute(
+                    f"ALTER TABLE jobs ADD COLUMN {column}"
+                    f" {COLUMN_TYPES.get(column, 'TEXT')}"
+                )
+        for column in ("first_run", "last_run", "first_seen"):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS jobs_{column} ON jobs ({column})"
+            )
+        self._conn.commit()
+        assignments = ", ".join(
+            f"{column} = COALESCE(excluded.{column}, jobs.{column})"
+            for column in desired_order
+        )
+        inserted = TRACKING_COLUMNS + desired_order
+        self._upsert = (
+            f"INSERT INTO jobs ({', '.join(inserted)})"
+            f" VALUES ({', '.join('?' * len(inserted))})"
+            " ON CONFLICT (key) DO UPDATE SET last_seen = excluded.last_seen,"
+            f" last_run = excluded.last_run, {assignments}"
+        )
+
+    def add_run(
+        self,
+        jobs: pd.DataFrame | pa.Table | Iterable[dict],
+        seen_at: datetime | None = None,
+    ) -> int:
+        """
+        Merges one run's results into the archive
+        :param jobs: scrape_jobs DataFrame, output="arrow" Table or iter_jobs rows
+        :param seen_at: time of the run (default now; naive values are taken as UTC)
+        :return: run id
+        """
+        seen_at = _utc(seen_at or datetime.now(timezone.utc)).isoformat()
+        jobs = _frame(jobs)
+        keys = [
+            _key(job_id, job_url)
+            for job_id, job_url in zip(_column(jobs, "id"), _column(jobs, "job_url"))
+        ]
+        rows = [
+            (key, values)
+            for key, values in zip(keys, zip(*_sql_columns(jobs)))
+            if key is not None
+        ]
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (seen_at, jobs, new_jobs) VALUES (?, 0, 0)",
+                (seen_at,),
+            )
+            run_id = cursor.lastrowid
+            tracking = (seen_at, seen_at, run_id, run_id)
+            self._conn.executemany(
+                self._upsert, ((key, *tracking, *values) for key, values in rows)
+            )
+            new_jobs = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE first_run = ?", (run_id,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "UPDATE runs SET jobs = ?, new_jobs = ? WHERE run_id = ?",
+                (len({key for key, _ in rows}), new_jobs, run_id),
+            )
+            self._conn.commit()
+        return run_id
+
+    def latest_run(self) -> int | None:
+        with self._lock:
+            return self._conn.execute("SELECT MAX(run_id) FROM runs").fetchone()[0]
+
+    def runs(self) -> pd.DataFrame:
+        """
+        :return: DataFrame of run_id, seen_at, jobs and new_jobs per run
+        """
+        return self._query("SELECT * FROM runs ORDER BY run_id")
+
+    def new_jobs(
+        self, run_id: int | None = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Jobs first seen in a run, i.e. new since the run before it
+        :param run_id: run to query (default the latest)
+        :param columns: columns to read (default all)
+        :return: DataFrame of the new jobs
+        """
+        if run_id is None:
+            run_id = self.latest_run()
+        return self._select("first_run = ?", (run_id,), columns)
+
+    def new_since(
+        self, since: datetime | str, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Jobs first seen at or after a point in time
+        :param since: datetime (naive values are taken as UTC) or ISO string
+        :param columns: columns to read (default all)
+        :return: DataFrame of the new jobs
+        """
+        if isinstance(since, datetime):
+            since = _utc(since).isoformat()
+        return self._select("first_seen >= ?", (since,), columns)
+
+    def seen_in(
+        self, run_id: int | None = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Jobs whose latest sighting is the run, new or not
+        :param run_id: run to query (default the latest)
+        :param columns: columns to read (default all)
+        :return: DataFrame of the jobs
+        """
+        if run_id is None:
+            run_id = self.latest_run()
+        return self._select("last_run = ?", (run_id,), columns)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def _select(
+        self, where: str, parameters: tuple, columns: list[str] | None
+    ) -> pd.DataFrame:
+        selected = ", ".join(columns or TRACKING_COLUMNS + desired_order)
+        jobs = self._query(
+            f"SELECT {selected} FROM jobs WHERE {where} ORDER BY first_seen, key",
+            parameters,
+        )
+        if "date_posted" in jobs.columns:
+            jobs["date_posted"] = [
+                date.fromisoformat(value) if isinstance(value, str) else None
+                for value in jobs["date_posted"]
+            ]
+        if "is_remote" in jobs.columns:
+            jobs["is_remote"] = jobs["is_remote"].map({1: True, 0: False})
+        return jobs
+
+    def _query(self, sql: str, parameters: tuple = ()) -> pd.DataFrame:
+        with self._lock:
+            cursor = self._conn.execute(sql, parameters)
+            names = [description[0] for description in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=names)
@@ -0,0 +1,165 @@
+"""
+Arrow / Parquet output of scrape results (pip install python-jobspy[arrow])
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from jobspy.model import CompensationInterval
+from jobspy.util import ANNUAL_MULTIPLIERS, desired_order
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# arrow type of the desired_order columns that are not strings
+COLUMN_TYPES = {
+    "date_posted": "date32",
+    "min_amount": "float64",
+    "max_amount": "float64",
+    "is_remote": "bool_",
+    "company_rating": "float64",
+    "company_reviews_count": "int64",
+    "vacancy_count": "int64",
+}
+
+# low-cardinality columns stored dictionary-encoded in Parquet files
+DICTIONARY_COLUMNS = (
+    "site",
+    "company",
+    "location",
+    "job_type",
+    "salary_source",
+    "interval",
+    "currency",
+)
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "arrow output requires pyarrow, install it with: pip install pyarrow"
+        )
+    return pyarrow
+
+
+def job_schema() -> pa.Schema:
+    """
+    Fixed schema of a scrape result: the desired_order columns, strings unless
+    COLUMN_TYPES says otherwise
+    """
+    pa = import_pyarrow()
+    return pa.schema(
+        [
+            pa.field(column, getattr(pa, COLUMN_TYPES.get(column, "string"))())
+            for column in desired_order
+        ]
+    )
+
+
+def table_from_columns(columns: dict[str, list]) -> pa.Table:
+    """
+    Builds the job_schema() table from per-column value lists (None for missing),
+    sorted by site and most recent date like the scrape_jobs DataFrame
+    :param columns: desired_order column name to values
+    :return: pyarrow Table
+    """
+    pa = import_pyarrow()
+    table = pa.Table.from_pydict(
+        {column: columns[column] for column in desired_order}, schema=job_schema()
+    )
+    return table.sort_by([("site", "ascending"), ("date_posted", "descending")])
+
+
+def annualize_table(table: pa.Table) -> pa.Table:
+    """
+    annualize_salaries for a job_schema() table: rows with a non-yearly interval and
+    both amounts set get yearly amounts from ANNUAL_MULTIPLIERS
+    :param table: jobs table
+    :return: converted table
+    """
+    pa = import_pyarrow()
+    import pyarrow.compute as pc
+
+    yearly = CompensationInterval.YEARLY.value
+    intervals = table["interval"]
+    multipliers = pc.take(
+        pa.array(list(ANNUAL_MULTIPLIERS.values()), pa.float64()),
+        pc.index_in(intervals, value_set=pa.array(list(ANNUAL_MULTIPLIERS))),
+    )
+    min_amount, max_amount = table["min_amount"], table["max_amount"]
+    convert = pc.and_(
+        pc.and_(pc.is_valid(multipliers), pc.not_equal(intervals, yearly)),
+        pc.and_(
+            pc.not_equal(pc.fill_null(min_amount, 0), 0),
+            pc.not_equal(pc.fill_null(max_amount, 0), 0),
+        ),
+    )
+    convert = pc.fill_null(convert, False)
+    for column in ("min_amount", "max_amount"):
+        values = table[column]
+        table = table.set_column(
+            table.schema.get_field_index(column),
+            column,
+            pc.if_else(convert, pc.multiply(values, multipliers), values),
+        )
+    return table.set_column(
+        table.schema.get_field_index("interval"),
+        "interval",
+        pc.if_else(convert, yearly, intervals),
+    )
+
+
+def frame_to_table(jobs: pd.DataFrame) -> pa.Table:
+    """
+    Converts a scrape_jobs DataFrame with job_schema() types; columns outside
+    desired_order keep the type arrow infers for them
+    :param jobs: jobs DataFrame
+    :return: pyarrow Table
+    """
+    pa = import_pyarrow()
+    schema = job_schema()
+    if jobs.columns.empty:
+        return schema.empty_table()
+    fields = [
+        (
+            schema.field(column)
+            if column in schema.names
+            else pa.Schema.from_pandas(jobs[[column]], preserve_index=False).field(
+                column
+            )
+        )
+        for column in jobs.columns
+    ]
+    return pa.Table.from_pandas(jobs, schema=pa.schema(fields), preserve_index=False)
+
+
+def write_parquet(
+    jobs: pa.Table | pd.DataFrame,
+    path: str | os.PathLike,
+    compression: str = "zstd",
+):
+    """
+    Writes scrape results to a Parquet file, dictionary-encoding the
+    DICTIONARY_COLUMNS; pd.read_parquet / pyarrow.parquet read it back
+    :param jobs: scrape_jobs result, as a pyarrow Table or a DataFrame
+    :param path: file to write
+    :param compression: Parquet codec (zstd, snappy, gzip, none)
+    """
+    pa = import_pyarrow()
+    import pyarrow.parquet as pq
+
+    table = jobs if isinstance(jobs, pa.Table) else frame_to_table(jobs)
+    pq.write_table(
+        table,
+        path,
+        compression=compression,
+        use_dictionary=[
+            column for column in DICTIONARY_COLUMNS if column in table.column_names
+        ],
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import random
-import time
+from typing import Iterator
+from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
@@ -9,12 +9,11 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
-    JobPost,
-    JobResponse,
-    Location,
+    JobRecord,
+    LocationRecord,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, create_session, get_rate_controller
 
 log = create_logger("Bayt")
 
@@ -22,7 +21,6 @@ log = create_logger("Bayt")
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
     delay = 2
-    band_delay = 3
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -31,19 +29,27 @@ class BaytScraper(Scraper):
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
+        self.rate_controller = get_rate_controller(
+            urlparse(self.base_url).netloc, initial_delay=self.delay
+        )
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
+        """
+        Scrapes Bayt for jobs with scraper_input criteria, one page at a time
+        :param scraper_input:
+        :return: iterator of the jobs on each page
+        """
         self.scraper_input = scraper_input
         self.session = create_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
-        job_list: list[JobPost] = []
+        job_count = 0
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while job_count < results_wanted:
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -54,13 +60,14 @@ class BaytScraper(Scraper):
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
-            initial_count = len(job_list)
+            page_jobs: list[JobRecord] = []
             for job in job_elements:
                 try:
                     job_post = self._extract_job_info(job)
                     if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
+                        page_jobs.append(job_post)
+                        job_count += 1
+                        if job_count >= results_wanted:
                             break
                     else:
                         log.debug(
@@ -71,15 +78,12 @@ class BaytScraper(Scraper):
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
 
-            if len(job_list) == initial_count:
+            if not page_jobs:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
+            yield page_jobs
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
 
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
@@ -87,17 +91,19 @@ class BaytScraper(Scraper):
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
+            self.rate_controller.wait()
             response = self.session.get(url)
+            self.rate_controller.record(response)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_listings = soup.find_all("li", attrs={"data-js-job": ""})
+            soup = self._parse_html(response.text)
+            job_listings = soup.select("li[data-js-job]")
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
             return None
 
-    def _extract_job_info(self, job: BeautifulSoup) -> JobPost | None:
+    def _extract_job_info(self, job: BeautifulSoup) -> JobRecord | None:
         """
         Extracts the job information from a single job listing.
         """
@@ -112,23 +118,19 @@ class BaytScraper(Scraper):
             return
 
         # Extract company name using the original approach:
-        company_tag = job.find("div", class_="t-nowrap p10l")
-        company_name = (
-            company_tag.find("span").get_text(strip=True)
-            if company_tag and company_tag.find("span")
-            else None
-        )
+        company_tag = job.select_one('div[class="t-nowrap p10l"] span')
+        company_name = company_tag.get_text(strip=True) if company_tag else None
 
         # Extract location using the original approach:
-        location_tag = job.find("div", class_="t-mute t-small")
+        location_tag = job.select_one('div[class="t-mute t-small"]')
         location = location_tag.get_text(strip=True) if location_tag else None
 
         job_id = f"bayt-{abs(hash(job_url))}"
-        location_obj = Location(
+        location_obj = LocationRecord(
             city=location,
             country=Country.from_string(self.country),
         )
-        return JobPost(
+        return JobRecord(
             id=job_id,
             title=job_title,
             company_name=company_name,
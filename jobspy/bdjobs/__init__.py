@@ -1,13 +1,10 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from urllib.parse import urljoin
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
 from bs4.element import Tag
 
 from jobspy.exception import BDJobsException
@@ -19,9 +16,8 @@ from jobspy.bdjobs.util import (
     is_job_remote,
 )
 from jobspy.model import (
-    JobPost,
-    Location,
-    JobResponse,
+    JobRecord,
+    LocationRecord,
     Country,
     Scraper,
     ScraperInput,
@@ -33,7 +29,7 @@ from jobspy.util import (
     create_session,
     create_logger,
     remove_attributes,
-    markdown_converter,
+    get_rate_controller,
 )
 
 log = create_logger("BDJobs")
@@ -43,10 +39,12 @@ class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
     delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
@@ -61,17 +59,20 @@ class BDJobs(Scraper):
             clear_cookies=True,
         )
         self.session.headers.update(headers)
+        self.rate_controller = get_rate_controller(
+            urlparse(self.base_url).netloc, initial_delay=self.delay
+        )
         self.scraper_input = None
         self.country = "bangladesh"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes BDJobs for jobs with scraper_input criteria
+        Scrapes BDJobs for jobs with scraper_input criteria, one page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         page = 1
         request_count = 0
@@ -80,7 +81,7 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
+        continue_search = lambda: job_count < scraper_input.results_wanted
 
         while continue_search():
             request_count += 1
@@ -91,17 +92,19 @@ class BDJobs(Scraper):
                 if page > 1:
                     params["pg"] = page
 
+                self.rate_controller.wait()
                 response = self.session.get(
                     self.search_url,
                     params=params,
                     timeout=getattr(scraper_input, "request_timeout", 60),
                 )
+                self.rate_controller.record(response)
 
                 if response.status_code != 200:
                     log.error(f"BDJobs response status code {response.status_code}")
                     break
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = self._parse_html(response.text)
                 job_cards = find_job_listings(soup)
 
                 if not job_cards or len(job_cards) == 0:
@@ -110,38 +113,36 @@ class BDJobs(Scraper):
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
 
+                page_jobs: list[JobRecord] = []
                 for job_card in job_cards:
                     try:
                         job_post = self._process_job(job_card)
                         if job_post and job_post.id not in seen_ids:
                             seen_ids.add(job_post.id)
-                            job_list.append(job_post)
+                            page_jobs.append(job_post)
+                            job_count += 1
 
                             if not continue_search():
                                 break
                     except Exception as e:
                         log.error(f"Error processing job card: {str(e)}")
+                yield page_jobs
 
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
                 break
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
-
-    def _process_job(self, job_card: Tag) -> Optional[JobPost]:
+    def _process_job(self, job_card: Tag) -> Optional[JobRecord]:
         """
-        Processes a job card element into a JobPost object
+        Processes a job card element into a JobRecord object
         :param job_card: Job card element
-        :return: JobPost object
+        :return: JobRecord object
         """
         try:
             # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+            job_link = job_card.select_one('a[href*="jobdetail" i]')
             if not job_link:
                 return None
 
@@ -206,7 +207,7 @@ class BDJobs(Scraper):
                 else "Dhaka, Bangladesh"
             )
 
-            # Create Location object
+            # Create LocationRecord
             location = parse_location(location_text, self.country)
 
             # Extract date posted
@@ -221,13 +222,14 @@ class BDJobs(Scraper):
             date_posted = None
             if date_elem:
                 date_text = date_elem.get_text(strip=True)
-                date_posted = parse_date(date_text)
+                parsed_date = parse_date(date_text)
+                date_posted = parsed_date.date() if parsed_date else None
 
             # Check if job is remote
             is_remote = is_job_remote(title, location=location)
 
             # Create job post object
-            job_post = JobPost(
+            job_post = JobRecord(
                 id=job_id,
                 title=title,
                 company_name=company_name,  # Use company_name instead of company
@@ -235,9 +237,11 @@ class BDJobs(Scraper):
                 date_posted=date_posted,
                 job_url=job_url,
                 is_remote=is_remote,
-                site=self.site,
             )
 
+            if self._is_known(job_id):
+                return None if self.scraper_input.skip_known else job_post
+
             # Always fetch description for BDJobs
             job_details = self._get_job_details(job_url)
             job_post.description = job_details.get("description", "")
@@ -255,11 +259,13 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            response = self._fetch_detail(
+                job_url, lambda: self.session.get(job_url, timeout=60)
+            )
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self._parse_html(response.text)
 
             # Find job description - IMPROVED based on correct.py
             description = ""
@@ -313,7 +319,7 @@ class BDJobs(Scraper):
                         and self.scraper_input.description_format
                         == DescriptionFormat.MARKDOWN
                     ):
-                        description = markdown_converter(description)
+                        description = self._markdown(description)
 
             # Extract job type
             job_type_elem = soup.find(
@@ -1,29 +1,29 @@
-#util.py
+# util.py
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from jobspy.model import Location, Country
+from jobspy.model import LocationRecord, Country
 
 
-def parse_location(location_text: str, country: str = "bangladesh") -> Location:
+def parse_location(location_text: str, country: str = "bangladesh") -> LocationRecord:
     """
-    Parses location text into a Location object
+    Parses location text into a LocationRecord
     :param location_text: Location text from job listing
     :param country: Default country
-    :return: Location object
+    :return: LocationRecord
     """
     parts = location_text.split(",")
     if len(parts) >= 2:
         city = parts[0].strip()
         state = parts[1].strip()
-        return Location(
+        return LocationRecord(
             city=city,
             state=state,
             country=Country.from_string(country)
         )
     else:
-        return Location(
+        return LocationRecord(
             city=location_text.strip(),
             country=Country.from_string(country)
         )
@@ -61,25 +61,23 @@ def find_job_listings(soup: BeautifulSoup) -> List[Any]:
     :return: List of job card elements
     """
     from .constant import job_selectors
-    
+
     # Try different selectors
     for selector in job_selectors:
-        if "." in selector:
-            tag_name, class_name = selector.split(".", 1)
-            elements = soup.find_all(tag_name, class_=class_name)
-            if elements and len(elements) > 0:
-                return elements
-    
+        elements = soup.select(selector)
+        if elements:
+            return elements
+
     # If no selectors match, look for job detail links
-    job_links = soup.find_all("a", href=lambda h: h and "jobdetail" in h.lower())
+    job_links = soup.select('a[href*="jobdetail" i]')
     if job_links:
         # Return parent elements of job links
         return [link.parent for link in job_links]
-    
+
     return []
 
 
-def is_job_remote(title: str, description: str = None, location: Location = None) -> bool:
+def is_job_remote(title: str, description: str = None, location: LocationRecord = None) -> bool:
     """
     Determines if a job is remote based on title, description, and location
     :param title: Job title
@@ -97,4 +95,4 @@ def is_job_remote(title: str, description: str = None, location: Location = None
         full_text += " " + location.display_location().lower()
     
     # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
+    return any(keyword in full_text for keyword in remote_keywords)
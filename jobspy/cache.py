@@ -0,0 +1,325 @@
+"""
+jobspy.cache
+~~~~~~~~~~~~
+
+On-disk cache for job detail responses, so repeated scrapes of the same postings
+(a nightly cron over a 30 day window) skip the per-job detail requests, and a
+content-addressed cache for description conversions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Callable
+
+
+class CachedResponse:
+    """
+    Stand-in for a requests/tls_client/httpx response read back from the cache
+    """
+
+    def __init__(self, status_code: int, text: str, url: str):
+        self.status_code = status_code
+        self.text = text
+        self.url = url
+        self.ok = status_code in range(200, 400)
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise RuntimeError(f"cached response status code {self.status_code}")
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache keyed by site and job id. Entries older than ttl
+    seconds are treated as missing; once the stored bodies exceed max_bytes the
+    least recently read entries are evicted. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                site TEXT NOT NULL,
+                key TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                url TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (site, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        self._size = self._stored_bytes()
+
+    def get(self, site: str, key: str) -> CachedResponse | None:
+        """
+        Returns the cached response for the job, or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, url, body, fetched_at FROM responses"
+                " WHERE site = ? AND key = ?",
+                (site, str(key)),
+            ).fetchone()
+            if row is None or now - row[3] > self.ttl:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE site = ? AND key = ?",
+                (now, site, str(key)),
+            )
+            self._conn.commit()
+            self.hits += 1
+        status, url, body, _ = row
+        return CachedResponse(status, zlib.decompress(body).decode("utf-8"), url)
+
+    def set(self, site: str, key: str, response):
+        """
+        Stores a response (anything with status_code, text and url)
+        """
+        body = zlib.compress(response.text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE site = ? AND key = ?",
+                (site, str(key)),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    site,
+                    str(key),
+                    response.status_code,
+                    str(response.url),
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Deletes the expired entries
+        :return: number of entries removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            self._size = self._stored_bytes()
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        """
+        Drops expired entries, then the least recently read ones until the cache is
+        back under 90% of max_bytes
+        """
+        self._conn.execute(
+            "DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.ttl,)
+        )
+        self._size = self._stored_bytes()
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute(
+            "SELECT site, key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for site, key, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((site, key))
+            self._size -= size
+        self._conn.executemany(
+            "DELETE FROM responses WHERE site = ? AND key = ?", evicted
+        )
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+
+class ConversionCache:
+    """
+    Results of converting description HTML to a DescriptionFormat, keyed by a hash
+    of the HTML and the format. Keeps the maxsize most recently used results in
+    memory and, given a path, every result in SQLite across runs, dropping the
+    oldest once the stored results exceed max_bytes. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        maxsize: int = 4096,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = path
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversions (
+                    key TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (key, format)
+                )
+                """
+            )
+            self._conn.commit()
+            self._size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM conversions"
+            ).fetchone()[0]
+
+    @staticmethod
+    def key(html: str) -> str:
+        return hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+
+    def convert(self, html: str, format: str, converter: Callable[[str], str]) -> str:
+        """
+        Returns the cached conversion of html, running converter on a miss
+        :param html:
+        :param format: DescriptionFormat value the converter produces
+        :param converter:
+        :return: converted text
+        """
+        memory_key = (self.key(html), format)
+        with self._lock:
+            result = self._memory.get(memory_key)
+            if result is not None:
+                self._memory.move_to_end(memory_key)
+                self.hits += 1
+                return result
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT body FROM conversions WHERE key = ? AND format = ?",
+                    memory_key,
+                ).fetchone()
+                if row is not None:
+                    result = zlib.decompress(row[0]).decode("utf-8")
+                    self._remember(memory_key, result)
+                    self.hits += 1
+                    return result
+            self.misses += 1
+        result = converter(html)
+        with self._lock:
+            self._remember(memory_key, result)
+            if self._conn is not None:
+                self._store(memory_key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM conversions")
+                self._conn.commit()
+                self._size = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return len(self._memory)
+            return self._conn.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+    def _remember(self, memory_key: tuple[str, str], result: str):
+        self._memory[memory_key] = result
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _store(self, memory_key: tuple[str, str], result: str):
+        body = zlib.compress(result.encode("utf-8"))
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO conversions VALUES (?, ?, ?, ?, ?)",
+            (*memory_key, body, len(body), time.time()),
+        )
+        self._size += len(body) if cursor.rowcount else 0
+        if self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, format, size FROM conversions ORDER BY created_at"
+            ).fetchall()
+            evicted = []
+            for key, format, size in rows:
+                if self._size <= self.max_bytes * 0.9:
+                    break
+                evicted.append((key, format))
+                self._size -= size
+            self._conn.executemany(
+                "DELETE FROM conversions WHERE key = ? AND format = ?", evicted
+            )
+        self._conn.commit()
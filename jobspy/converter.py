@@ -0,0 +1,457 @@
+"""
+jobspy.converter
+~~~~~~~~~~~~~~~~
+
+Description HTML to markdown / plain text. The "fast" backend tokenizes with the
+stdlib HTMLParser (the tokenizer behind BeautifulSoup's html.parser, which
+markdownify uses), builds a bare node tree with the same rules as BeautifulSoup
+and renders the tags job descriptions use (p, div, lists, headings, links, emphasis,
+br) the way markdownify does. Descriptions with anything else markdownify has a
+rule for (tables, pre, images, comments...) go to markdownify, so both backends
+give the same output. Plain text is collected from the same tree, matching
+BeautifulSoup(html, "html.parser").get_text(" ") whatever the html_parser.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Callable
+
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+from markdownify import MarkdownConverter, markdownify as md
+
+from jobspy.cache import ConversionCache
+from jobspy.parser import parse_html
+
+DESCRIPTION_CONVERTERS = ("fast", "markdownify")
+
+# descriptions converted in this process, shared by runs without a conversion_cache
+CONVERSION_CACHE = ConversionCache()
+
+
+def markdown_converter(
+    description_html: str,
+    cache: ConversionCache | None = None,
+    converter: str | None = None,
+):
+    """
+    Converts description HTML to markdown
+    :param description_html:
+    :param cache: conversion cache, the process-wide in-memory one if None
+    :param converter: one of DESCRIPTION_CONVERTERS, default "fast"
+    :return: markdown
+    """
+    if description_html is None:
+        return None
+    convert = _backend(converter, html_to_markdown, _markdownify)
+    cache = CONVERSION_CACHE if cache is None else cache
+    return cache.convert(description_html, f"markdown/{converter or 'fast'}", convert)
+
+
+def plain_converter(
+    decription_html: str,
+    cache: ConversionCache | None = None,
+    converter: str | None = None,
+):
+    """
+    Converts description HTML to whitespace-collapsed plain text
+    :param decription_html:
+    :param cache: conversion cache, the process-wide in-memory one if None
+    :param converter: one of DESCRIPTION_CONVERTERS, default "fast"
+    :return: text
+    """
+    if decription_html is None:
+        return None
+    convert = _backend(converter, html_to_plain, _soup_text)
+    cache = CONVERSION_CACHE if cache is None else cache
+    return cache.convert(decription_html, f"plain/{converter or 'fast'}", convert)
+
+
+def html_to_markdown(html: str) -> str:
+    """
+    Same result as markdownify(html).strip(), several times faster on job
+    descriptions
+    """
+    try:
+        root = _TreeBuilder(_leave_to_markdownify).build(html)
+    except _Unsupported:
+        return _markdownify(html)
+    return _render(root, False, False, 0).strip("\n").strip()
+
+
+def html_to_plain(html: str) -> str:
+    """
+    Same result as BeautifulSoup(html, "html.parser").get_text(" ") with whitespace
+    collapsed, collecting the strings of the html.parser tree without building soup
+    """
+    if _SOUP_TEXT_ONLY.search(html):
+        return _soup_text(html)
+    try:
+        root = _TreeBuilder(_STRING_CONTAINERS.__contains__).build(html)
+    except _Unsupported:
+        return _soup_text(html)
+    strings = []
+    _collect_text(root, strings)
+    return _WHITESPACE.sub(" ", " ".join(strings)).strip()
+
+
+def _backend(converter: str | None, fast, reference):
+    if converter in (None, "fast"):
+        return fast
+    if converter == "markdownify":
+        return reference
+    raise ValueError(
+        f"Invalid description_converter {converter!r}, must be one of"
+        f" {', '.join(DESCRIPTION_CONVERTERS)}"
+    )
+
+
+def _markdownify(html: str) -> str:
+    return md(html).strip()
+
+
+def _soup_text(html: str) -> str:
+    text = parse_html(html, "html.parser").get_text(separator=" ")
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class _Unsupported(Exception):
+    """Markup the fast backend leaves to the reference one"""
+
+
+class _Node:
+    __slots__ = ("name", "attrs", "children", "parent")
+
+    def __init__(self, name: str, attrs: dict, parent: _Node | None):
+        self.name = name
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+
+
+# BeautifulSoup's empty-element tags (closed as soon as they open)
+_VOID_TAGS = frozenset(
+    "area base br col embed hr img input keygen link menuitem meta param source"
+    " track wbr basefont bgsound command frame image isindex nextid spacer".split()
+)
+_ASCII_SPACES = frozenset(" \n\t\x0c\r")
+_NUMERIC_REFERENCE = {
+    10: re.compile("^([0-9]+)(.*)"),
+    16: re.compile("^([0-9a-f]+)(.*)"),
+}
+# markdownify's block elements, whose inner and outer whitespace is trimmed
+_HEADING = re.compile(r"h(\d+)")
+_BLOCKS = frozenset(
+    "p blockquote article div section ol ul li dl dt dd table thead tbody tfoot tr"
+    " td th".split()
+)
+_RENDERED = frozenset(
+    "a b strong em i del s sub sup q br hr div article section p ul ol li".split()
+)
+_PRESERVED = frozenset(("pre", "textarea", "script", "style"))
+# tags whose strings BeautifulSoup keeps out of get_text(), and declarations, which
+# split the surrounding text into separate strings
+_STRING_CONTAINERS = frozenset(("script", "style", "template", "rt", "rp"))
+_SOUP_TEXT_ONLY = re.compile(
+    r"<(?:script|style|template|rt|rp)\b|<!(?!--)", re.IGNORECASE
+)
+_EXTRACT_NEWLINES = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", flags=re.DOTALL)
+_NEWLINE_WHITESPACE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_INLINE_WHITESPACE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE = re.compile(r"[\t \r\n]+")
+_LINE_WITH_CONTENT = re.compile(r"^(.*)", flags=re.MULTILINE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def _leave_to_markdownify(name: str) -> bool:
+    """
+    Whether markdownify treats this tag in a way the fast backend does not render:
+    its own conversion rule, block whitespace trimming or preserved whitespace
+    """
+    if name in _RENDERED or _HEADING.match(name):
+        return False
+    if name in _BLOCKS or name in _PRESERVED:
+        return True
+    return hasattr(MarkdownConverter, "convert_" + re.sub(r"[\[\]:-]", "_", name))
+
+
+class _TreeBuilder(HTMLParser):
+    """
+    Builds the tree BeautifulSoup's html.parser builder would: end tags close up to
+    the most recent open tag of that name (ignored if none is open), empty-element
+    tags close immediately (swallowing a later end tag) and whitespace-only strings
+    collapse to " " or "\\n".
+    """
+
+    def __init__(self, unsupported: Callable[[str], bool]):
+        """
+        :param unsupported: tags that abort the build
+        """
+        super().__init__(convert_charrefs=False)
+        self.unsupported = unsupported
+        self.root = _Node("[document]", {}, None)
+        self.current = self.root
+        self.data = []
+        self.open_tags = {}
+        self.closed_void_tags = []
+
+    def build(self, html: str) -> _Node:
+        self.feed(html)
+        self.close()
+        self.end_data()
+        return self.root
+
+    def handle_starttag(self, tag, attrs):
+        self.start(tag, attrs)
+        if tag in _VOID_TAGS:
+            self.end(tag)
+            # an explicit end tag for it later is dropped without ending the string
+            self.closed_void_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.start(tag, attrs)
+        self.end(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self.closed_void_tags:
+            self.closed_void_tags.remove(tag)
+        else:
+            self.end(tag)
+
+    def handle_data(self, data):
+        self.data.append(data)
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        if character is None:
+            character = f"&{name}"
+        self.data.append(character)
+
+    def handle_charref(self, name):
+        base = 16 if name[:1] in ("x", "X") else 10
+        digits = name[1:] if base == 16 else name
+        extra = ""
+        try:
+            number = int(digits, base)
+        except ValueError:
+            match = _NUMERIC_REFERENCE[base].search(digits)
+            if match is None:
+                self.data.append(digits)
+                return
+            number, extra = int(match.group(1), base), match.group(2)
+        self.data.append(UnicodeDammit.numeric_character_reference(number)[0] + extra)
+
+    def handle_comment(self, data):
+        raise _Unsupported("comment")
+
+    def handle_decl(self, decl):
+        raise _Unsupported("declaration")
+
+    def handle_pi(self, data):
+        raise _Unsupported("processing instruction")
+
+    def unknown_decl(self, data):
+        raise _Unsupported("declaration")
+
+    def start(self, tag: str, attrs: list):
+        if self.unsupported(tag):
+            raise _Unsupported(tag)
+        self.end_data()
+        attrs = {key: "" if value is None else value for key, value in attrs}
+        node = _Node(tag, attrs, self.current)
+        self.current.children.append(node)
+        self.current = node
+        self.open_tags[tag] = self.open_tags.get(tag, 0) + 1
+
+    def end(self, tag: str):
+        self.end_data()
+        if not self.open_tags.get(tag):
+            return
+        while True:
+            node = self.current
+            self.current = node.parent
+            self.open_tags[node.name] -= 1
+            if node.name == tag:
+                return
+
+    def end_data(self):
+        if not self.data:
+            return
+        data = "".join(self.data)
+        self.data = []
+        if _ASCII_SPACES.issuperset(data):
+            data = "\n" if "\n" in data else " "
+        self.current.children.append(data)
+
+
+def _collect_text(node: _Node, strings: list):
+    for child in node.children:
+        if isinstance(child, str):
+            strings.append(child)
+        else:
+            _collect_text(child, strings)
+
+
+def _is_block(element) -> bool:
+    if element is None or isinstance(element, str):
+        return False
+    return element.name in _BLOCKS or _HEADING.match(element.name) is not None
+
+
+def _render(node: _Node, in_heading: bool, in_li: bool, ul_depth: int) -> str:
+    """
+    markdownify's process_tag for the rendered subset
+    :param in_heading: inside a heading (markdownify's "_inline" context)
+    :param in_li: inside a list item
+    :param ul_depth: number of enclosing ul elements
+    """
+    name = node.name
+    heading = _HEADING.match(name)
+    children = node.children
+    block = _is_block(node)
+    child_heading = in_heading or heading is not None
+    child_li = in_li or name == "li"
+    child_depth = ul_depth + (name == "ul")
+
+    strings = [""]
+    li_count = 0
+    last = len(children) - 1
+    for index, child in enumerate(children):
+        previous = children[index - 1] if index else None
+        following = children[index + 1] if index < last else None
+        if isinstance(child, str):
+            if not child.strip():
+                if block and (previous is None or following is None):
+                    continue
+                if _is_block(previous) or _is_block(following):
+                    continue
+            text = _NEWLINE_WHITESPACE.sub("\n", child)
+            text = _INLINE_WHITESPACE.sub(" ", text)
+            text = text.replace("*", r"\*").replace("_", r"\_")
+            if _is_block(previous) or (block and previous is None):
+                text = text.lstrip(" \t\r\n")
+            if _is_block(following) or (block and following is None):
+                text = text.rstrip()
+        elif child.name == "li":
+            text = _render_li(
+                child, node, li_count, child_heading, child_li, child_depth
+            )
+            li_count += 1
+        else:
+            text = _render(child, child_heading, child_li, child_depth)
+            if child.name in ("ul", "ol"):
+                text = _convert_list(text, node, index, child_li)
+        if not text:
+            continue
+        leading, content, trailing = _EXTRACT_NEWLINES.match(text).groups()
+        if strings[-1] and leading:
+            leading = "\n" * min(2, max(len(strings.pop()), len(leading)))
+        strings.extend((leading, content, trailing))
+    text = "".join(strings)
+
+    if heading:
+        return _convert_heading(int(heading.group(1)), text, in_heading)
+    if name in ("b", "strong"):
+        return _inline(text, "**")
+    if name in ("em", "i"):
+        return _inline(text, "*")
+    if name in ("del", "s"):
+        return _inline(text, "~~")
+    if name in ("sub", "sup"):
+        return _inline(text, "")
+    if name in ("p",):
+        if in_heading:
+            return " " + text.strip(" \t\r\n") + " "
+        text = text.strip(" \t\r\n")
+        return f"\n\n{text}\n\n" if text else ""
+    if name in ("div", "article", "section"):
+        if in_heading:
+            return " " + text.strip() + " "
+        text = text.strip()
+        return f"\n\n{text}\n\n" if text else ""
+    if name == "a":
+        return _convert_link(node, text)
+    if name == "br":
+        return " " if in_heading else "  \n"
+    if name == "hr":
+        return "\n\n---\n\n"
+    if name == "q":
+        return '"' + text + '"'
+    return text
+
+
+def _render_li(
+    node: _Node,
+    parent: _Node,
+    position: int,
+    in_heading: bool,
+    in_li: bool,
+    ul_depth: int,
+) -> str:
+    text = _render(node, in_heading, in_li, ul_depth).strip()
+    if not text:
+        return "\n"
+    if parent.name == "ol":
+        start = parent.attrs.get("start")
+        start = int(start) if start and start.isnumeric() else 1
+        bullet = f"{start + position}. "
+    else:
+        bullet = "*+-"[(ul_depth - 1) % 3] + " "
+    indent = " " * len(bullet)
+    text = _LINE_WITH_CONTENT.sub(
+        lambda match: indent + match.group(1) if match.group(1) else "", text
+    )
+    return f"{bullet}{text[len(bullet):]}\n"
+
+
+def _convert_list(text: str, parent: _Node, index: int, in_li: bool) -> str:
+    if in_li:
+        return "\n" + text.rstrip()
+    before_paragraph = False
+    for sibling in parent.children[index + 1 :]:
+        if isinstance(sibling, str) and not sibling.strip():
+            continue
+        before_paragraph = isinstance(sibling, str) or sibling.name not in ("ul", "ol")
+        break
+    return "\n\n" + text + ("\n" if before_paragraph else "")
+
+
+def _convert_heading(level: int, text: str, in_heading: bool) -> str:
+    if in_heading:
+        return text
+    level = max(1, min(6, level))
+    text = text.strip()
+    if level <= 2:
+        text = text.rstrip()
+        line = ("=" if level == 1 else "-") * len(text)
+        return f"\n\n{text}\n{line}\n\n" if text else ""
+    text = _ALL_WHITESPACE.sub(" ", text)
+    return f"\n\n{'#' * level} {text}\n\n"
+
+
+def _convert_link(node: _Node, text: str) -> str:
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = node.attrs.get("href")
+    title = node.attrs.get("title")
+    if text.replace(r"\_", "_") == href and not title:
+        return f"<{href}>"
+    title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+    return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+
+def _inline(text: str, markup: str) -> str:
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    return f"{prefix}{markup}{text}{markup}{suffix}"
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
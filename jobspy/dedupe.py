@@ -0,0 +1,366 @@
+"""
+jobspy.dedupe
+~~~~~~~~~~~~~
+
+Near-duplicate detection across sites: the same posting syndicated on Indeed,
+LinkedIn, ZipRecruiter and Google has a different URL on each board, so exact
+deduplication keeps every copy. Each job gets a MinHash signature over word
+shingles of its title, company, location and description; LSH banding over the
+signatures finds candidate pairs without comparing every pair, and candidates
+similar enough that also agree on company and title are merged into clusters with
+one canonical row each. drop_url_duplicates() is the cheap exact pass: rows whose
+board URL, or ATS apply URL, names the same posting once tracking parameters and
+ATS path variants are normalized (jobspy.urls).
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from jobspy.urls import UrlIndex
+
+WORD = re.compile(r"\w+")
+
+# legal-form words left out when comparing company names
+COMPANY_SUFFIXES = frozenset(
+    {"the", "inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "lp"}
+)
+
+_EMPTY = np.iinfo(np.uint64).max
+# splitmix64 constants
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 finalizer over a uint64 array
+    """
+    values = values + _GOLDEN
+    values = (values ^ (values >> np.uint64(30))) * _MIX1
+    values ^= values >> np.uint64(27)
+    values *= _MIX2
+    return values ^ (values >> np.uint64(31))
+
+
+def _column(jobs: pd.DataFrame, column: str) -> list:
+    if column not in jobs.columns:
+        return [None] * len(jobs)
+    values = jobs[column].astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def _words(text, limit: int | None = None) -> list[str]:
+    if not isinstance(text, str) or not text:
+        return []
+    return WORD.findall(text.lower())[:limit]
+
+
+def company_key(company) -> str:
+    """
+    Company name compared across sites: lowercased words without legal forms
+    """
+    return " ".join(word for word in _words(company) if word not in COMPANY_SUFFIXES)
+
+
+def _document_codes(
+    jobs: pd.DataFrame, shingle_size: int, max_words: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Word hashes of each job's title, company, location and first max_words words of
+    description, concatenated; jobs shorter than a shingle are padded
+    :return: codes, words per job
+    """
+    all_words, lengths = [], []
+    padding = [""] * shingle_size
+    rows = zip(
+        _column(jobs, "title"),
+        _column(jobs, "company"),
+        _column(jobs, "location"),
+        _column(jobs, "description"),
+    )
+    for title, company, location, description in rows:
+        words = _words(title) + company_key(company).split() + _words(location)
+        words += _words(description, max_words)
+        if len(words) < shingle_size:
+            words += padding[: shingle_size - len(words)]
+        all_words.extend(words)
+        lengths.append(len(words))
+    codes = pd.util.hash_array(np.array(all_words, dtype=object))
+    return codes, np.array(lengths, dtype=np.int64)
+
+
+def _signatures(
+    codes: np.ndarray, lengths: np.ndarray, num_perm: int, shingle_size: int
+) -> np.ndarray:
+    """
+    One-permutation MinHash: every shingle is hashed once, its hash picks one of
+    num_perm bins and each bin keeps its minimum. Bins a short job leaves empty
+    borrow the next filled bin's value (rotation densification), so signatures of
+    any length compare like classic num_perm-permutation MinHash
+    """
+    count = len(codes) - shingle_size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(shingle_size):
+        hashes = _mix(hashes ^ codes[offset : offset + count])
+    job = np.repeat(np.arange(len(lengths)), lengths)
+    within = job[:count] == job[shingle_size - 1 :]
+    hashes, job = hashes[within], job[:count][within]
+
+    signatures = np.full(len(lengths) * num_perm, _EMPTY, dtype=np.uint64)
+    bins = (hashes % np.uint64(num_perm)).astype(np.int64)
+    np.minimum.at(signatures, job * num_perm + bins, hashes)
+    signatures = signatures.reshape(len(lengths), num_perm)
+
+    sparse = np.flatnonzero((signatures == _EMPTY).any(axis=1))
+    if len(sparse):
+        rows = signatures[sparse]
+        filled = rows.copy()
+        pending = rows == _EMPTY
+        shift = 1
+        while pending.any():
+            rotated = np.roll(rows, -shift, axis=1)
+            take = pending & (rotated != _EMPTY)
+            filled[take] = _mix(rotated[take] + np.uint64(shift))
+            pending &= ~take
+            shift += 1
+        signatures[sparse] = filled
+    return signatures
+
+
+def _sketches(
+    jobs: pd.DataFrame,
+    num_perm: int,
+    shingle_size: int,
+    max_words: int,
+    chunk_size: int = 10_000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :return: signatures, shingles per job
+    """
+    blocks = [np.empty((0, num_perm), dtype=np.uint64)]
+    sizes = [np.empty(0, dtype=np.int64)]
+    for start in range(0, len(jobs), chunk_size):
+        codes, lengths = _document_codes(
+            jobs.iloc[start : start + chunk_size], shingle_size, max_words
+        )
+        blocks.append(_signatures(codes, lengths, num_perm, shingle_size))
+        sizes.append(lengths - shingle_size + 1)
+    return np.concatenate(blocks), np.concatenate(sizes)
+
+
+def minhash_signatures(
+    jobs: pd.DataFrame,
+    num_perm: int = 128,
+    shingle_size: int = 3,
+    max_words: int = 200,
+) -> np.ndarray:
+    """
+    MinHash signatures of jobs over word shingles of title, company, location and
+    the start of the description (only the first max_words words count). The share
+    of equal positions between two signatures estimates the Jaccard similarity of
+    their shingle sets
+    :param jobs: jobs DataFrame
+    :param num_perm: signature length
+    :param shingle_size: words per shingle
+    :param max_words: description words used
+    :return: uint64 array of shape (len(jobs), num_perm)
+    """
+    return _sketches(jobs, num_perm, shingle_size, max_words)[0]
+
+
+def _candidate_pairs(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """
+    LSH banding: jobs whose signatures agree on every row of some band share a
+    bucket. Each bucket member is paired with the bucket's first job, so a band adds
+    at most one pair per job
+    :return: unique (i, j) pairs with i < j
+    """
+    count, num_perm = signatures.shape
+    rows = num_perm // bands
+    positions = np.arange(count)
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    for band in range(bands):
+        block = signatures[:, band * rows : (band + 1) * rows]
+        keys = block[:, 0].copy()
+        for column in range(1, rows):
+            keys = _mix(keys ^ block[:, column])
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.r_[True, keys[1:] != keys[:-1]]
+        heads = order[np.maximum.accumulate(np.where(starts, positions, 0))]
+        members = ~starts
+        pairs.append(np.column_stack([heads[members], order[members]]))
+    pairs = np.sort(np.concatenate(pairs), axis=1)
+    return np.unique(pairs, axis=0)
+
+
+def _sites(jobs: pd.DataFrame) -> list[str | None]:
+    """
+    Site of each job: its site column, else the prefix of its id ("li-4012345")
+    """
+    sites = _column(jobs, "site")
+    ids = _column(jobs, "id")
+    return [
+        str(site) if site else id_.split("-", 1)[0] if isinstance(id_, str) else None
+        for site, id_ in zip(sites, ids)
+    ]
+
+
+def _similar_titles(first, second, threshold: float = 0.5) -> bool:
+    first, second = set(_words(first)), set(_words(second))
+    if not first or not second:
+        return not first and not second
+    return len(first & second) / len(first | second) >= threshold
+
+
+def _canonical_positions(
+    jobs: pd.DataFrame,
+    threshold: float,
+    num_perm: int,
+    bands: int,
+    shingle_size: int,
+    max_words: int,
+) -> np.ndarray:
+    count = len(jobs)
+    if count < 2:
+        return np.arange(count)
+    signatures, sizes = _sketches(jobs, num_perm, shingle_size, max_words)
+    pairs = _candidate_pairs(signatures, bands)
+    similarity = np.empty(len(pairs))
+    for start in range(0, len(pairs), 10_000):
+        first, second = pairs[start : start + 10_000].T
+        jaccard = (signatures[first] == signatures[second]).mean(axis=1)
+        shorter = np.minimum(sizes[first], sizes[second])
+        longer = np.maximum(sizes[first], sizes[second])
+        # |A & B| = J / (1 + J) * (|A| + |B|), as a share of the shorter copy
+        containment = jaccard / (1 + jaccard) * (shorter + longer) / shorter
+        similarity[start : start + 10_000] = np.where(
+            2 * shorter >= longer, containment, jaccard
+        )
+    # most similar pairs first, so a copy joins the cluster it matches best
+    order = np.argsort(-similarity, kind="stable")
+    similar = order[similarity[order] >= threshold]
+
+    companies = [company_key(company) for company in _column(jobs, "company")]
+    titles = _column(jobs, "title")
+    parent = list(range(count))
+    # sites in each cluster, keyed by root: a site lists a posting once, so two of
+    # its rows are different requisitions however alike their text
+    sites = {node: {site} for node, site in enumerate(_sites(jobs)) if site}
+
+    def root(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for first, second in pairs[similar].tolist():
+        company, other = companies[first], companies[second]
+        if company and other and company != other:
+            continue
+        if not _similar_titles(titles[first], titles[second]):
+            continue
+        first, second = root(first), root(second)
+        if first == second:
+            continue
+        first_sites, second_sites = sites.get(first, set()), sites.get(second, set())
+        if first_sites & second_sites:
+            continue
+        parent[first] = second
+        if first_sites:
+            sites[second] = first_sites | second_sites
+
+    roots = np.array([root(node) for node in range(count)])
+    description_length = np.array(
+        [len(text) if text else 0 for text in _column(jobs, "description")]
+    )
+    has_salary = np.array([value is not None for value in _column(jobs, "min_amount")])
+    has_direct = np.array([bool(url) for url in _column(jobs, "job_url_direct")])
+    ranking = np.lexsort(
+        (
+            np.arange(count),
+            -description_length,
+            ~has_direct,
+            ~has_salary,
+            description_length == 0,
+        )
+    )
+    cluster_roots, first_ranked = np.unique(roots[ranking], return_index=True)
+    canonical = np.empty(count, dtype=np.int64)
+    canonical[cluster_roots] = ranking[first_ranked]
+    return canonical[roots]
+
+
+def find_near_duplicates(
+    jobs: pd.DataFrame,
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    bands: int = 32,
+    shingle_size: int = 3,
+    max_words: int = 200,
+) -> pd.Series:
+    """
+    Clusters postings that are the same job on different sites: MinHash similarity
+    of at least threshold, the same company (when both have one) and similar titles;
+    a cluster holds at most one row per site (the site column, else the id prefix),
+    as alike rows of one site are separate requisitions. For two
+    copies at least half as long as each other, similarity is the estimated share of
+    the shorter one's shingles found in the other, so a truncated copy (Google
+    carries a cut-off description) matches the full one; otherwise it is the Jaccard
+    similarity. The canonical row of a cluster is the most complete one: with a
+    description, then with a salary, then with a direct URL, then the longest
+    description, then the first in order
+    :param jobs: jobs DataFrame
+    :param threshold: min similarity of two copies
+    :param num_perm: MinHash signature length
+    :param bands: LSH bands (num_perm / bands rows each); more bands find pairs of
+        lower similarity at the cost of more candidates to check
+    :param shingle_size: words per shingle
+    :param max_words: description words used
+    :return: index label of each row's canonical row (its own for unique rows)
+    """
+    canonical = _canonical_positions(
+        jobs, threshold, num_perm, bands, shingle_size, max_words
+    )
+    return pd.Series(jobs.index[canonical], index=jobs.index)
+
+
+def drop_near_duplicates(
+    jobs: pd.DataFrame,
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    bands: int = 32,
+    shingle_size: int = 3,
+    max_words: int = 200,
+) -> pd.DataFrame:
+    """
+    Keeps the canonical row of each find_near_duplicates() cluster, in the jobs'
+    order; parameters as for find_near_duplicates()
+    :return: deduplicated DataFrame
+    """
+    canonical = _canonical_positions(
+        jobs, threshold, num_perm, bands, shingle_size, max_words
+    )
+    return jobs[canonical == np.arange(len(jobs))]
+
+
+def drop_url_duplicates(jobs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keeps the first row of each posting, a row being a copy of an earlier one when
+    its job_url has the same url_identity() as the earlier row's, or its
+    job_url_direct names the same ATS posting (e.g. LinkedIn's and Indeed's rows
+    applying through one Workday requisition); see UrlIndex.claim_job()
+    :param jobs: jobs DataFrame
+    :return: deduplicated DataFrame
+    """
+    if "job_url" not in jobs.columns and "job_url_direct" not in jobs.columns:
+        return jobs
+    index = UrlIndex()
+    rows = zip(_column(jobs, "job_url"), _column(jobs, "job_url_direct"))
+    keep = np.array([index.claim_job(*urls) for urls in rows], dtype=bool)
+    return jobs[keep]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import re
+import asyncio
 import json
 import requests
-from typing import Tuple
+from typing import AsyncIterator, Iterator, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
+from jobspy.cache import CachedResponse
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
     get_cursor_for_page,
@@ -17,12 +18,13 @@ from jobspy.util import (
     extract_emails_from_text,
     create_logger,
     create_session,
-    markdown_converter,
+    trim_page,
+    AsyncClient,
 )
 from jobspy.exception import GlassdoorException
+from jobspy.patterns import GLASSDOOR_CSRF_TOKEN
 from jobspy.model import (
-    JobPost,
-    JobResponse,
+    JobRecord,
     DescriptionFormat,
     Scraper,
     ScraperInput,
@@ -33,6 +35,10 @@ log = create_logger("Glassdoor")
 
 
 class Glassdoor(Scraper):
+    # JobDetailQuery operations per /graph request, and batch requests in flight
+    description_batch_size = 10
+    description_workers = 3
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -50,32 +56,55 @@ class Glassdoor(Scraper):
         self.max_pages = 30
         self.seen_urls = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes Glassdoor for jobs with scraper_input criteria.
+        Scrapes Glassdoor for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page
         """
-        self.scraper_input = scraper_input
-        self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-        self.base_url = self.scraper_input.country.get_glassdoor_url()
+        location_id, location_type = self._prepare(scraper_input)
+        if location_type is None:
+            log.error("Glassdoor: location not parsed")
+            return
+        job_count = 0
+        cursor = None
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        if self.user_agent:
-            headers["user-agent"] = self.user_agent
-        self.session.headers.update(headers)
+        range_start = 1 + (scraper_input.offset // self.jobs_per_page)
+        tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
+        range_end = min(tot_pages, self.max_pages + 1)
+        for page in range(range_start, range_end):
+            log.info(f"search page: {page} / {range_end - 1}")
+            try:
+                jobs, cursor = self._fetch_jobs_page(
+                    scraper_input, location_id, location_type, page, cursor
+                )
+            except Exception as e:
+                log.error(f"Glassdoor: {str(e)}")
+                break
+            page_jobs = trim_page(jobs, job_count, 0, scraper_input.results_wanted)
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
+            if not jobs or job_count >= scraper_input.results_wanted:
+                break
 
-        location_id, location_type = self._get_location(
-            scraper_input.location, scraper_input.is_remote
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput, client: AsyncClient
+    ) -> AsyncIterator[list[JobRecord]]:
+        """
+        Async variant of scrape_pages fetching the descriptions of a page concurrently
+        through client instead of a thread pool.
+        :param scraper_input: Information about job search criteria.
+        :param client: shared async HTTP client
+        :return: async iterator of the jobs on each page
+        """
+        location_id, location_type = await asyncio.to_thread(
+            self._prepare, scraper_input
         )
         if location_type is None:
             log.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+            return
+        job_count = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
@@ -84,17 +113,38 @@ class Glassdoor(Scraper):
         for page in range(range_start, range_end):
             log.info(f"search page: {page} / {range_end - 1}")
             try:
-                jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
+                jobs, cursor = await self._fetch_jobs_page_async(
+                    client, scraper_input, location_id, location_type, page, cursor
                 )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
             except Exception as e:
                 log.error(f"Glassdoor: {str(e)}")
                 break
-        return JobResponse(jobs=job_list)
+            page_jobs = trim_page(jobs, job_count, 0, scraper_input.results_wanted)
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
+            if not jobs or job_count >= scraper_input.results_wanted:
+                break
+
+    def _prepare(self, scraper_input: ScraperInput) -> tuple[int | None, str | None]:
+        """
+        Opens the session, fetches the csrf token and resolves the search location
+        :return: location id and location type
+        """
+        self.scraper_input = scraper_input
+        self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
+        self.base_url = self.scraper_input.country.get_glassdoor_url()
+
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+        )
+        token = self._get_csrf_token()
+        headers["gd-csrf-token"] = token if token else fallback_token
+        if self.user_agent:
+            headers["user-agent"] = self.user_agent
+        self.session.headers.update(headers)
+
+        return self._get_location(scraper_input.location, scraper_input.is_remote)
 
     def _fetch_jobs_page(
         self,
@@ -103,7 +153,7 @@ class Glassdoor(Scraper):
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> Tuple[list[JobPost], str | None]:
+    ) -> Tuple[list[JobRecord], str | None]:
         """
         Scrapes a page of Glassdoor for jobs with scraper_input criteria
         """
@@ -116,12 +166,7 @@ class Glassdoor(Scraper):
                 timeout_seconds=15,
                 data=payload,
             )
-            if response.status_code != 200:
-                exc_msg = f"bad response status code: {response.status_code}"
-                raise GlassdoorException(exc_msg)
-            res_json = response.json()[0]
-            if "errors" in res_json:
-                raise ValueError("Error encountered in API response")
+            res_json = self._parse_jobs_response(response)
         except (
             requests.exceptions.ReadTimeout,
             GlassdoorException,
@@ -131,45 +176,119 @@ class Glassdoor(Scraper):
             log.error(f"Glassdoor: {str(e)}")
             return jobs, None
 
-        jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        jobs_data, job_ids = self._claim_page(
+            res_json["data"]["jobListings"]["jobListings"]
+        )
+        descriptions = self._fetch_descriptions(job_ids)
+        jobs = self._parse_page(jobs_data, descriptions)
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        return jobs, get_cursor_for_page(
+            res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
+        )
+
+    async def _fetch_jobs_page_async(
+        self,
+        client: AsyncClient,
+        scraper_input: ScraperInput,
+        location_id: int,
+        location_type: str,
+        page_num: int,
+        cursor: str | None,
+    ) -> Tuple[list[JobRecord], str | None]:
+        """
+        Async variant of _fetch_jobs_page
+        """
+        jobs = []
+        self.scraper_input = scraper_input
+        try:
+            payload = self._add_payload(location_id, location_type, page_num, cursor)
+            response = await client.post(
+                f"{self.base_url}/graph", content=payload, headers=headers, timeout=15
+            )
+            res_json = self._parse_jobs_response(response)
+        except Exception as e:
+            log.error(f"Glassdoor: {str(e)}")
+            return jobs, None
+
+        jobs_data, job_ids = self._claim_page(
+            res_json["data"]["jobListings"]["jobListings"]
+        )
+        descriptions = await self._fetch_descriptions_async(client, job_ids)
+        jobs = self._parse_page(jobs_data, descriptions)
 
         return jobs, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
         )
 
+    @staticmethod
+    def _parse_jobs_response(response) -> dict:
+        if response.status_code != 200:
+            exc_msg = f"bad response status code: {response.status_code}"
+            raise GlassdoorException(exc_msg)
+        res_json = response.json()[0]
+        if "errors" in res_json:
+            raise ValueError("Error encountered in API response")
+        return res_json
+
     def _get_csrf_token(self):
         """
         Fetches csrf token needed for API by visiting a generic page
         """
         res = self.session.get(f"{self.base_url}/Job/computer-science-jobs.htm")
-        pattern = r'"token":\s*"([^"]+)"'
-        matches = re.findall(pattern, res.text)
+        matches = GLASSDOOR_CSRF_TOKEN.findall(res.text)
         token = None
         if matches:
             token = matches[0]
         return token
 
-    def _process_job(self, job_data):
+    def _claim_page(self, jobs_data: list) -> tuple[list, list[int]]:
+        """
+        The search results not seen before, without known jobs when skipping those
+        :return: job results, listing ids whose description is fetched
+        """
+        claimed, job_ids = [], []
+        for job_data in jobs_data:
+            job_id = self._claim_job(job_data)
+            if job_id is None:
+                continue
+            if not self._is_known(f"gd-{job_id}"):
+                job_ids.append(job_id)
+            elif self.scraper_input.skip_known:
+                continue
+            claimed.append(job_data)
+        return claimed, job_ids
+
+    def _parse_page(self, jobs_data: list, descriptions: dict) -> list[JobRecord]:
+        """
+        JobRecords of the claimed results; known jobs keep their search-card data
+        """
+        try:
+            return [
+                self._parse_job(
+                    job_data, descriptions.get(job_data["jobview"]["job"]["listingId"])
+                )
+                for job_data in jobs_data
+            ]
+        except Exception as exc:
+            raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+
+    def _claim_job(self, job_data) -> int | None:
         """
-        Processes a single job and fetches its description.
+        Returns the listing id, or None if the job was already seen
         """
         job_id = job_data["jobview"]["job"]["listingId"]
         job_url = f"{self.base_url}job-listing/j?jl={job_id}"
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
+        return job_id
+
+    def _parse_job(self, job_data, description: str | None) -> JobRecord:
+        """
+        Builds the JobRecord from a search result and its description
+        """
+        job_id = job_data["jobview"]["job"]["listingId"]
+        job_url = f"{self.base_url}job-listing/j?jl={job_id}"
         job = job_data["jobview"]
         title = job["job"]["jobTitleText"]
         company_name = job["header"]["employerNameFromSearch"]
@@ -187,10 +306,6 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -201,7 +316,7 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
+        return JobRecord(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -217,12 +332,112 @@ class Glassdoor(Scraper):
             listing_type=listing_type,
         )
 
-    def _fetch_job_description(self, job_id):
+    def _fetch_descriptions(self, job_ids: list[int]) -> dict[int, str | None]:
+        """
+        Fetches the descriptions of listings not in the response cache,
+        description_batch_size JobDetailQuery operations per request over the search
+        session's connections (its headers carry the csrf token)
+        :return: description (None where it could not be fetched) by listing id
+        """
+        descriptions, batches = self._cached_descriptions(job_ids)
+        if batches:
+            workers = min(len(batches), self.description_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = executor.map(self._post_descriptions, batches)
+                for batch, res in zip(batches, responses):
+                    descriptions.update(self._parse_descriptions(batch, res))
+        return descriptions
+
+    async def _fetch_descriptions_async(
+        self, client: AsyncClient, job_ids: list[int]
+    ) -> dict[int, str | None]:
+        """
+        Async variant of _fetch_descriptions
+        """
+        descriptions, batches = self._cached_descriptions(job_ids)
+        responses = await asyncio.gather(
+            *(self._post_descriptions_async(client, batch) for batch in batches)
+        )
+        for batch, res in zip(batches, responses):
+            descriptions.update(self._parse_descriptions(batch, res))
+        return descriptions
+
+    def _cached_descriptions(
+        self, job_ids: list[int]
+    ) -> tuple[dict[int, str | None], list[list[int]]]:
+        """
+        :return: descriptions found in the response cache, batches of the other ids
+        """
+        cache = self.scraper_input.response_cache
+        descriptions, missing = {}, []
+        for job_id in job_ids:
+            cached = cache.get(self.site.value, job_id) if cache is not None else None
+            if cached is None:
+                missing.append(job_id)
+            else:
+                descriptions[job_id] = self._description_or_none(cached)
+        size = max(self.description_batch_size, 1)
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+        return descriptions, batches
+
+    def _post_descriptions(self, batch: list[int]):
+        try:
+            return self.session.post(
+                f"{self.base_url}/graph",
+                json=self._job_description_body(*batch),
+                timeout_seconds=15,
+            )
+        except Exception as e:
+            log.error(f"Glassdoor: {str(e)}")
+            return None
+
+    async def _post_descriptions_async(self, client: AsyncClient, batch: list[int]):
+        try:
+            return await client.post(
+                f"{self.base_url}/graph",
+                json=self._job_description_body(*batch),
+                headers=headers,
+                timeout=15,
+            )
+        except Exception as e:
+            log.error(f"Glassdoor: {str(e)}")
+            return None
+
+    def _parse_descriptions(self, batch: list[int], res) -> dict[int, str | None]:
         """
-        Fetches the job description for a single job ID.
+        Splits a batch response into one response per listing, each cached under its
+        listing id like a single JobDetailQuery response
         """
-        url = f"{self.base_url}/graph"
-        body = [
+        descriptions = dict.fromkeys(batch)
+        if res is None or res.status_code != 200:
+            return descriptions
+        try:
+            results = res.json()
+        except ValueError:
+            return descriptions
+        cache = self.scraper_input.response_cache
+        url = str(res.url)
+        for job_id, result in zip(batch, results):
+            job_res = CachedResponse(res.status_code, json.dumps([result]), url)
+            if cache is not None:
+                cacheable = self._is_description_response
+                self._store_detail(cache, job_id, job_res, cacheable)
+            descriptions[job_id] = self._description_or_none(job_res)
+        return descriptions
+
+    def _description_or_none(self, res) -> str | None:
+        try:
+            return self._parse_job_description(res)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _job_description_body(*job_ids) -> list[dict]:
+        """
+        One JobDetailQuery operation per listing; /graph answers with the results
+        in the same order
+        """
+        return [
             {
                 "operationName": "JobDetailQuery",
                 "variables": {
@@ -245,14 +460,20 @@ class Glassdoor(Scraper):
                 }
                 """,
             }
+            for job_id in job_ids
         ]
-        res = requests.post(url, json=body, headers=headers)
+
+    @staticmethod
+    def _is_description_response(res) -> bool:
+        return '"errors"' not in res.text
+
+    def _parse_job_description(self, res) -> str | None:
         if res.status_code != 200:
             return None
         data = res.json()[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
+            desc = self._markdown(desc)
         return desc
 
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
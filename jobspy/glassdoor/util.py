@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from jobspy.model import Compensation, CompensationInterval, Location, JobType
+from jobspy.model import (
+    CompensationRecord,
+    CompensationInterval,
+    LocationRecord,
+    JobType,
+)
 
 
-def parse_compensation(data: dict) -> Compensation | None:
+def parse_compensation(data: dict) -> CompensationRecord | None:
     pay_period = data.get("payPeriod")
     adjusted_pay = data.get("payPeriodAdjustedPay")
     currency = data.get("payCurrency", "USD")
@@ -17,7 +22,7 @@ def parse_compensation(data: dict) -> Compensation | None:
         interval = CompensationInterval.get_interval(pay_period)
     min_amount = int(adjusted_pay.get("p10") // 1)
     max_amount = int(adjusted_pay.get("p90") // 1)
-    return Compensation(
+    return CompensationRecord(
         interval=interval,
         min_amount=min_amount,
         max_amount=max_amount,
@@ -31,11 +36,11 @@ def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
             return [job_type]
 
 
-def parse_location(location_name: str) -> Location | None:
+def parse_location(location_name: str) -> LocationRecord | None:
     if not location_name or location_name == "Remote":
         return
     city, _, state = location_name.partition(", ")
-    return Location(city=city, state=state)
+    return LocationRecord(city=city, state=state)
 
 
 def get_cursor_for_page(pagination_cursors, page_num):
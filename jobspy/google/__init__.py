@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import math
-import re
 import json
-from typing import Tuple
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
 
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
@@ -11,16 +10,28 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
-    JobPost,
-    JobResponse,
-    Location,
+    JobRecord,
+    LocationRecord,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.patterns import (
+    DIGITS,
+    GOOGLE_CURSOR,
+    GOOGLE_INITIAL_CURSOR,
+    GOOGLE_REMOTE_KEYWORDS,
+    scan_description,
+)
+from jobspy.util import (
+    create_session,
+    trim_page,
+)
+from jobspy.urls import url_identity
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
 class Google(Scraper):
+    html_descriptions = False
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -38,11 +49,11 @@ class Google(Scraper):
         self.url = "https://www.google.com/search"
         self.jobs_url = "https://www.google.com/async/callback:550"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes Google for jobs with scraper_input criteria.
+        Scrapes Google for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
@@ -50,12 +61,18 @@ class Google(Scraper):
         self.session = create_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        forward_cursor, jobs = self._get_initial_cursor_and_jobs()
+        page_jobs = trim_page(
+            jobs, 0, scraper_input.offset, scraper_input.results_wanted
+        )
+        job_count = len(jobs)
+        if page_jobs:
+            yield page_jobs
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
             )
-            return JobResponse(jobs=job_list)
+            return
 
         page = 1
 
@@ -74,16 +91,15 @@ class Google(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            page_jobs = trim_page(
+                jobs, job_count, scraper_input.offset, scraper_input.results_wanted
+            )
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
-    def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
+    def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobRecord]]:
         """Gets initial cursor and jobs to paginate through job listings"""
         query = f"{self.scraper_input.search_term} jobs"
 
@@ -123,8 +139,7 @@ class Google(Scraper):
         params = {"q": query, "udm": "8"}
         response = self.session.get(self.url, headers=headers_initial, params=params)
 
-        pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, response.text)
+        match_fc = GOOGLE_INITIAL_CURSOR.search(response.text)
         data_async_fc = match_fc.group(1) if match_fc else None
         jobs_raw = find_job_info_initial_page(response.text)
         jobs = []
@@ -134,12 +149,12 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
+    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobRecord], str]:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
         return self._parse_jobs(response.text)
 
-    def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
+    def _parse_jobs(self, job_data: str) -> Tuple[list[JobRecord], str]:
         """
         Parses jobs on a page with next page cursor
         """
@@ -148,8 +163,7 @@ class Google(Scraper):
         s = job_data[start_idx:end_idx]
         parsed = json.loads(s)[0]
 
-        pattern_fc = r'data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, job_data)
+        match_fc = GOOGLE_CURSOR.search(job_data)
         data_async_fc = match_fc.group(1) if match_fc else None
         jobs_on_page = []
         for array in parsed:
@@ -166,9 +180,11 @@ class Google(Scraper):
 
     def _parse_job(self, job_info: list):
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
-        if job_url in self.seen_urls:
+        # apply links carry per-search tracking parameters
+        seen_key = url_identity(job_url) or job_url
+        if seen_key in self.seen_urls:
             return
-        self.seen_urls.add(job_url)
+        self.seen_urls.add(seen_key)
 
         title = job_info[0]
         company_name = job_info[1]
@@ -179,24 +195,27 @@ class Google(Scraper):
 
         days_ago_str = job_info[12]
         if type(days_ago_str) == str:
-            match = re.search(r"\d+", days_ago_str)
+            match = DIGITS.search(days_ago_str)
             days_ago = int(match.group()) if match else None
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        scan = scan_description(
+            description, remote_keywords=GOOGLE_REMOTE_KEYWORDS, salaries=False
+        )
 
-        job_post = JobPost(
+        job_post = JobRecord(
             id=f"go-{job_info[28]}",
             title=title,
             company_name=company_name,
-            location=Location(
+            location=LocationRecord(
                 city=city, state=state, country=country[0] if country else None
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=scan.is_remote,
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            emails=scan.emails,
+            job_type=scan.job_types or None,
         )
         return job_post
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import re
-
+from jobspy.patterns import GOOGLE_INITIAL_JOBS
 from jobspy.util import create_logger
 
 log = create_logger("Google")
@@ -26,9 +25,8 @@ def find_job_info(jobs_data: list | dict) -> list | None:
 
 
 def find_job_info_initial_page(html_text: str):
-    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
     results = []
-    matches = re.finditer(pattern, html_text)
+    matches = GOOGLE_INITIAL_JOBS.finditer(html_text)
 
     import json
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Tuple
+from typing import AsyncIterator, Iterator, Tuple
 
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
@@ -10,17 +10,17 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
-    JobPost,
-    Location,
-    JobResponse,
+    JobRecord,
+    LocationRecord,
     JobType,
     DescriptionFormat,
 )
 from jobspy.util import (
     extract_emails_from_text,
-    markdown_converter,
     create_session,
     create_logger,
+    trim_page,
+    AsyncClient,
 )
 
 log = create_logger("Indeed")
@@ -47,18 +47,14 @@ class Indeed(Scraper):
         self.base_url = None
         self.api_url = "https://apis.indeed.com/graphql"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes Indeed for jobs with scraper_input criteria
+        Scrapes Indeed for jobs with scraper_input criteria, one search page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
         """
-        self.scraper_input = scraper_input
-        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
-        self.base_url = f"https://{domain}.indeed.com"
-        self.headers = api_headers.copy()
-        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
+        self._prepare(scraper_input)
+        job_count = 0
         page = 1
 
         cursor = None
@@ -71,23 +67,70 @@ class Indeed(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            page_jobs = trim_page(
+                jobs, job_count, scraper_input.offset, scraper_input.results_wanted
+            )
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput, client: AsyncClient
+    ) -> AsyncIterator[list[JobRecord]]:
+        """
+        Async variant of scrape_pages sending the GraphQL requests through client
+        :param scraper_input:
+        :param client: shared async HTTP client
+        :return: async iterator of the jobs on each page
+        """
+        self._prepare(scraper_input)
+        job_count = 0
+        page = 1
+
+        cursor = None
+
+        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+            log.info(
+                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+            )
+            response = await client.post(self.api_url, **self._page_request(cursor))
+            jobs, cursor = self._parse_page(response)
+            if not jobs:
+                log.info(f"found no jobs on page: {page}")
+                break
+            page_jobs = trim_page(
+                jobs, job_count, scraper_input.offset, scraper_input.results_wanted
+            )
+            job_count += len(jobs)
+            if page_jobs:
+                yield page_jobs
+            page += 1
+
+    def _prepare(self, scraper_input: ScraperInput):
+        self.scraper_input = scraper_input
+        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
+        self.base_url = f"https://{domain}.indeed.com"
+        self.headers = api_headers.copy()
+        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+
+    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobRecord], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
         :param cursor:
         :return: jobs found on page, next page cursor
         """
-        jobs = []
-        new_cursor = None
+        response = self.session.post(
+            self.api_url, verify=False, **self._page_request(cursor)
+        )
+        return self._parse_page(response)
+
+    def _page_request(self, cursor: str | None) -> dict:
+        """
+        Builds the GraphQL request for a page of Indeed
+        :param cursor:
+        :return: headers, json payload and timeout for the request
+        """
         filters = self._build_filters()
         search_term = (
             self.scraper_input.search_term.replace('"', '\\"')
@@ -110,14 +153,17 @@ class Indeed(Scraper):
         }
         api_headers_temp = api_headers.copy()
         api_headers_temp["indeed-co"] = self.api_country_code
-        response = self.session.post(
-            self.api_url,
-            headers=api_headers_temp,
-            json=payload,
-            timeout=10,
-            verify=False,
-        )
-        if not response.ok:
+        return {"headers": api_headers_temp, "json": payload, "timeout": 10}
+
+    def _parse_page(self, response) -> Tuple[list[JobRecord], str | None]:
+        """
+        Parses the jobs and next page cursor out of a GraphQL page response
+        :param response:
+        :return: jobs found on page, next page cursor
+        """
+        jobs = []
+        new_cursor = None
+        if response.status_code not in range(200, 400):
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
@@ -192,11 +238,11 @@ class Indeed(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _process_job(self, job: dict) -> JobRecord | None:
         """
-        Parses the job dict into JobPost model
+        Parses the job dict into a JobRecord
         :param job: dict to parse
-        :return: JobPost if it's a new job
+        :return: JobRecord if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
         if job_url in self.seen_urls:
@@ -204,15 +250,15 @@ class Indeed(Scraper):
         self.seen_urls.add(job_url)
         description = job["description"]["html"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            description = self._markdown(description)
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
-        date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
+        date_posted = datetime.fromtimestamp(timestamp_seconds).date()
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        return JobRecord(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
@@ -221,7 +267,7 @@ class Indeed(Scraper):
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
-            location=Location(
+            location=LocationRecord(
                 city=job.get("location", {}).get("city"),
                 state=job.get("location", {}).get("admin1Code"),
                 country=job.get("location", {}).get("countryCode"),
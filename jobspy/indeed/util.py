@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from jobspy.model import CompensationInterval, JobType, Compensation
+from jobspy.model import CompensationInterval, JobType, CompensationRecord
 from jobspy.util import get_enum_from_job_type
 
 
@@ -19,7 +19,7 @@ def get_job_type(attributes: list) -> list[JobType]:
     return job_types
 
 
-def get_compensation(compensation: dict) -> Compensation | None:
+def get_compensation(compensation: dict) -> CompensationRecord | None:
     """
     Parses the job to get compensation
     :param compensation:
@@ -39,7 +39,7 @@ def get_compensation(compensation: dict) -> Compensation | None:
         return None
     min_range = comp["range"].get("min")
     max_range = comp["range"].get("max")
-    return Compensation(
+    return CompensationRecord(
         interval=interval,
         min_amount=int(min_range) if min_range is not None else None,
         max_amount=int(max_range) if max_range is not None else None,
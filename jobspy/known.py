@@ -0,0 +1,106 @@
+"""
+jobspy.known
+~~~~~~~~~~~~
+
+Job ids already stored downstream. Scrapers check them before the per-job detail
+request, so postings a previous run has seen cost only their search-card data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from typing import Callable, Iterable
+
+_HEADER = struct.Struct("<4sQI")
+_MAGIC = b"JSBF"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over job ids, stored as a small binary file. Sized for
+    capacity ids at the given false positive rate; a false positive only means a
+    new job is treated as known.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(round(self.num_bits / capacity * math.log(2)), 1)
+        self.bits = bytearray(math.ceil(self.num_bits / 8))
+
+    def _positions(self, job_id: str) -> Iterable[int]:
+        digest = hashlib.blake2b(str(job_id).encode("utf-8"), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        for i in range(self.num_hashes):
+            yield (first + i * second) % self.num_bits
+
+    def add(self, job_id: str):
+        for position in self._positions(job_id):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, job_ids: Iterable[str]):
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def __contains__(self, job_id: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(job_id)
+        )
+
+    @classmethod
+    def from_ids(
+        cls, job_ids: Iterable[str], error_rate: float = 0.001
+    ) -> "BloomFilter":
+        job_ids = list(job_ids)
+        bloom = cls(capacity=max(len(job_ids), 1000), error_rate=error_rate)
+        bloom.update(job_ids)
+        return bloom
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as f:
+            magic, num_bits, num_hashes = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a jobspy Bloom filter file")
+            bloom = cls.__new__(cls)
+            bloom.num_bits = num_bits
+            bloom.num_hashes = num_hashes
+            bloom.bits = bytearray(f.read())
+        return bloom
+
+    def save(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+
+class KnownIds:
+    """
+    Membership test over job ids (JobPost.id, e.g. "li-3912345678") built from a
+    set of ids, a callable returning True for known ids, a BloomFilter, or the
+    path of a saved Bloom filter file.
+    """
+
+    def __init__(
+        self, source: Iterable[str] | Callable[[str], bool] | BloomFilter | str
+    ):
+        if isinstance(source, str):
+            source = BloomFilter.load(source)
+        if isinstance(source, BloomFilter):
+            self._contains = source.__contains__
+        elif callable(source):
+            self._contains = source
+        else:
+            ids = source if isinstance(source, (set, frozenset)) else set(source)
+            self._contains = ids.__contains__
+
+    def __contains__(self, job_id: str) -> bool:
+        return bool(self._contains(job_id))
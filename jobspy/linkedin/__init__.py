@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import math
-import random
-import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
@@ -21,11 +21,10 @@ from jobspy.linkedin.util import (
     parse_company_industry
 )
 from jobspy.model import (
-    JobPost,
-    Location,
-    JobResponse,
+    JobRecord,
+    LocationRecord,
     Country,
-    Compensation,
+    CompensationRecord,
     DescriptionFormat,
     Scraper,
     ScraperInput,
@@ -34,11 +33,12 @@ from jobspy.model import (
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
-    markdown_converter,
-    plain_converter,
     create_session,
     remove_attributes,
     create_logger,
+    get_rate_controller,
+    get_rate_limiter,
+    retry_after_seconds,
 )
 
 log = create_logger("LinkedIn")
@@ -47,8 +47,11 @@ log = create_logger("LinkedIn")
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
     delay = 3
-    band_delay = 4
     jobs_per_page = 25
+    detail_workers = 4
+    detail_rate = 2
+    detail_burst = 4
+    detail_retries = 3
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -66,18 +69,42 @@ class LinkedIn(Scraper):
             clear_cookies=True,
         )
         self.session.headers.update(headers)
+        # job page sessions, one per detail worker: a session clears its cookies and
+        # picks the next proxy on every request, which must not race with another
+        # worker's request. All of them share the pooled connections
+        self._detail_sessions = threading.local()
+        self.rate_controller = get_rate_controller(
+            urlparse(self.base_url).netloc, initial_delay=self.delay
+        )
+        self.rate_limiter = None
         self.scraper_input = None
         self.country = "worldwide"
         self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes LinkedIn for jobs with scraper_input criteria
+        Scrapes LinkedIn for jobs with scraper_input criteria, one search page at a time.
+        Job pages are fetched by a small worker pool while the next search page is
+        requested, so each page is yielded one search request later than it is read.
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        self.rate_limiter = get_rate_limiter(
+            urlparse(self.base_url).netloc, self.detail_rate, self.detail_burst
+        )
+        pool = ThreadPoolExecutor(
+            max_workers=self.detail_workers, thread_name_prefix="linkedin-detail"
+        )
+        try:
+            yield from self._scrape_pages(scraper_input, pool)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _scrape_pages(
+        self, scraper_input: ScraperInput, pool: ThreadPoolExecutor
+    ) -> Iterator[list[JobRecord]]:
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
@@ -85,8 +112,9 @@ class LinkedIn(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: job_count < scraper_input.results_wanted and start < 1000
         )
+        pending_page: list[Future] = []
         while continue_search():
             request_count += 1
             log.info(
@@ -116,11 +144,13 @@ class LinkedIn(Scraper):
 
             params = {k: v for k, v in params.items() if v is not None}
             try:
+                self.rate_controller.wait()
                 response = self.session.get(
                     f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
                     params=params,
                     timeout=10,
                 )
+                self.rate_controller.record(response)
                 if response.status_code not in range(200, 400):
                     if response.status_code == 429:
                         err = (
@@ -130,21 +160,23 @@ class LinkedIn(Scraper):
                         err = f"LinkedIn response status code {response.status_code}"
                         err += f" - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    break
             except Exception as e:
                 if "Proxy responded with" in str(e):
                     log.error(f"LinkedIn: Bad proxy")
                 else:
                     log.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
+                break
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
+            soup = self._parse_html(response.text)
+            job_cards = soup.select("div.base-search-card")
             if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
+                break
 
+            page: list[Future] = []
+            fetch_desc = scraper_input.linkedin_fetch_description
             for job_card in job_cards:
-                href_tag = job_card.find("a", class_="base-card__full-link")
+                href_tag = job_card.select_one("a.base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
                     href = href_tag.attrs["href"].split("?")[0]
                     job_id = href.split("-")[-1]
@@ -152,28 +184,45 @@ class LinkedIn(Scraper):
                     if job_id in seen_ids:
                         continue
                     seen_ids.add(job_id)
+                    if scraper_input.skip_known and self._is_known(f"li-{job_id}"):
+                        continue
+
+                    page.append(
+                        pool.submit(self._process_job, job_card, job_id, fetch_desc)
+                    )
+                    job_count += 1
+                    if not continue_search():
+                        break
 
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            if pending_page:
+                yield self._collect_page(pending_page)
+            pending_page = page
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+        if pending_page:
+            yield self._collect_page(pending_page)
+
+    @staticmethod
+    def _collect_page(page: list[Future]) -> list[JobRecord]:
+        """
+        Waits for the page's jobs, in search order
+        """
+        page_jobs = []
+        for future in page:
+            try:
+                job_post = future.result()
+            except Exception as e:
+                raise LinkedInException(str(e))
+            if job_post:
+                page_jobs.append(job_post)
+        return page_jobs
 
     def _process_job(
         self, job_card: Tag, job_id: str, full_descr: bool
-    ) -> Optional[JobPost]:
-        salary_tag = job_card.find("span", class_="job-search-card__salary-info")
+    ) -> Optional[JobRecord]:
+        salary_tag = job_card.select_one("span.job-search-card__salary-info")
 
         compensation = description = None
         if salary_tag:
@@ -183,17 +232,16 @@ class LinkedIn(Scraper):
             salary_max = salary_values[1]
             currency = salary_text[0] if salary_text[0] != "$" else "USD"
 
-            compensation = Compensation(
+            compensation = CompensationRecord(
                 min_amount=int(salary_min),
                 max_amount=int(salary_max),
                 currency=currency,
             )
 
-        title_tag = job_card.find("span", class_="sr-only")
+        title_tag = job_card.select_one("span.sr-only")
         title = title_tag.get_text(strip=True) if title_tag else "N/A"
 
-        company_tag = job_card.find("h4", class_="base-search-card__subtitle")
-        company_a_tag = company_tag.find("a") if company_tag else None
+        company_a_tag = job_card.select_one("h4.base-search-card__subtitle a")
         company_url = (
             urlunparse(urlparse(company_a_tag.get("href"))._replace(query=""))
             if company_a_tag and company_a_tag.has_attr("href")
@@ -201,11 +249,11 @@ class LinkedIn(Scraper):
         )
         company = company_a_tag.get_text(strip=True) if company_a_tag else "N/A"
 
-        metadata_card = job_card.find("div", class_="base-search-card__metadata")
+        metadata_card = job_card.select_one("div.base-search-card__metadata")
         location = self._get_location(metadata_card)
 
         datetime_tag = (
-            metadata_card.find("time", class_="job-search-card__listdate")
+            metadata_card.select_one("time.job-search-card__listdate")
             if metadata_card
             else None
         )
@@ -213,16 +261,16 @@ class LinkedIn(Scraper):
         if datetime_tag and "datetime" in datetime_tag.attrs:
             datetime_str = datetime_tag["datetime"]
             try:
-                date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
+                date_posted = datetime.strptime(datetime_str, "%Y-%m-%d").date()
             except:
                 date_posted = None
         job_details = {}
-        if full_descr:
+        if full_descr and not self._is_known(f"li-{job_id}"):
             job_details = self._get_job_details(job_id)
             description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
-        return JobPost(
+        return JobRecord(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -249,8 +297,10 @@ class LinkedIn(Scraper):
         :return: dict
         """
         try:
-            response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
+            response = self._fetch_detail(
+                job_id,
+                lambda: self._get_job_page(job_id),
+                cacheable=lambda res: "linkedin.com/signup" not in str(res.url),
             )
             response.raise_for_status()
         except:
@@ -258,18 +308,16 @@ class LinkedIn(Scraper):
         if "linkedin.com/signup" in response.url:
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find(
-            "div", class_=lambda x: x and "show-more-less-html__markup" in x
-        )
+        soup = self._parse_html(response.text)
+        div_content = soup.select_one('div[class*="show-more-less-html__markup"]')
         description = None
         if div_content is not None:
             div_content = remove_attributes(div_content)
             description = div_content.prettify(formatter="html")
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
+                description = self._markdown(description)
             elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
-                description = plain_converter(description)
+                description = self._plain(description)
         h3_tag = soup.find(
             "h3", text=lambda text: text and "Job function" in text.strip()
         )
@@ -284,7 +332,7 @@ class LinkedIn(Scraper):
 
         company_logo = (
             logo_image.get("data-delayed-url")
-            if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
+            if (logo_image := soup.select_one("img.artdeco-entity-image"))
             else None
         )
         return {
@@ -297,22 +345,59 @@ class LinkedIn(Scraper):
             "job_function": job_function,
         }
 
-    def _get_location(self, metadata_card: Optional[Tag]) -> Location:
+    def _detail_session(self):
+        """
+        The calling detail worker's session, created on its first job page
+        """
+        session = getattr(self._detail_sessions, "session", None)
+        if session is None:
+            session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                clear_cookies=True,
+            )
+            session.headers.update(headers)
+            self._detail_sessions.session = session
+        return session
+
+    def _get_job_page(self, job_id: str):
+        """
+        GETs the job page within the per-host rate limit. A 429 (or 5xx) pauses every
+        detail worker, for Retry-After seconds if given, before the request is retried
+        :param job_id:
+        :return: response
+        """
+        for attempt in range(self.detail_retries + 1):
+            self.rate_limiter.acquire()
+            response = self._detail_session().get(
+                f"{self.base_url}/jobs/view/{job_id}", timeout=5
+            )
+            if response.status_code not in (429, 500, 502, 503, 504):
+                break
+            if attempt < self.detail_retries:
+                wait = retry_after_seconds(response, default=5 * 2**attempt)
+                log.warning(
+                    f"{response.status_code} on job page {job_id},"
+                    f" pausing job page requests for {wait:.0f}s"
+                )
+                self.rate_limiter.pause(wait)
+        return response
+
+    def _get_location(self, metadata_card: Optional[Tag]) -> LocationRecord:
         """
         Extracts the location data from the job metadata card.
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
+        location = LocationRecord(country=Country.from_string(self.country))
         if metadata_card is not None:
-            location_tag = metadata_card.find(
-                "span", class_="job-search-card__location"
-            )
+            location_tag = metadata_card.select_one("span.job-search-card__location")
             location_string = location_tag.text.strip() if location_tag else "N/A"
             parts = location_string.split(", ")
             if len(parts) == 2:
                 city, state = parts
-                location = Location(
+                location = LocationRecord(
                     city=city,
                     state=state,
                     country=Country.from_string(self.country),
@@ -320,7 +405,7 @@ class LinkedIn(Scraper):
             elif len(parts) == 3:
                 city, state, country = parts
                 country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
+                location = LocationRecord(city=city, state=state, country=country)
         return location
 
     def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
@@ -330,7 +415,7 @@ class LinkedIn(Scraper):
         :return: str
         """
         job_url_direct = None
-        job_url_direct_content = soup.find("code", id="applyUrl")
+        job_url_direct_content = soup.select_one("code#applyUrl")
         if job_url_direct_content:
             job_url_direct_match = self.job_url_direct_regex.search(
                 job_url_direct_content.decode_contents().strip()
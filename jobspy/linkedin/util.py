@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from bs4 import BeautifulSoup
 
-from jobspy.model import JobType, Location
+from jobspy.model import JobType, LocationRecord
 from jobspy.util import get_enum_from_job_type
 
 
@@ -87,7 +87,7 @@ def parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
     return industry
 
 
-def is_job_remote(title: dict, description: str, location: Location) -> bool:
+def is_job_remote(title: dict, description: str, location: LocationRecord) -> bool:
     """
     Searches the title, location, and description to check if job is remote
     """
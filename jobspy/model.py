@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Optional
+import asyncio
+from abc import ABC
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+)
 from datetime import date
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from jobspy.cache import ConversionCache, ResponseCache
+from jobspy.converter import markdown_converter, plain_converter
+from jobspy.known import KnownIds
+from jobspy.parser import parse_html
+
+if TYPE_CHECKING:
+    from jobspy.util import AsyncClient
 
 
 class JobType(Enum):
@@ -178,10 +195,12 @@ class Country(Enum):
         )
 
 
-class Location(BaseModel):
-    country: Country | str | None = None
-    city: Optional[str] = None
-    state: Optional[str] = None
+class _LocationDisplay:
+    """
+    display_location() shared by Location and LocationRecord
+    """
+
+    __slots__ = ()
 
     def display_location(self) -> str:
         location_parts = []
@@ -205,6 +224,12 @@ class Location(BaseModel):
         return ", ".join(location_parts)
 
 
+class Location(_LocationDisplay, BaseModel):
+    country: Country | str | None = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+
+
 class CompensationInterval(Enum):
     YEARLY = "yearly"
     MONTHLY = "monthly"
@@ -235,6 +260,8 @@ class DescriptionFormat(Enum):
     MARKDOWN = "markdown"
     HTML = "html"
     PLAIN = "plain"
+    # raw HTML kept for a later convert_descriptions() over the rows worth keeping
+    LAZY = "lazy"
 
 class JobPost(BaseModel):
     id: str | None = None
@@ -284,6 +311,80 @@ class JobResponse(BaseModel):
     jobs: list[JobPost] = []
 
 
+@dataclass(slots=True)
+class LocationRecord(_LocationDisplay):
+    """
+    Location of a JobRecord
+    """
+
+    country: Country | str | None = None
+    city: str | None = None
+    state: str | None = None
+
+
+@dataclass(slots=True)
+class CompensationRecord:
+    """
+    Compensation of a JobRecord
+    """
+
+    interval: CompensationInterval | None = None
+    min_amount: float | None = None
+    max_amount: float | None = None
+    currency: str | None = "USD"
+
+
+@dataclass(slots=True, kw_only=True)
+class JobRecord:
+    """
+    Unvalidated, slotted JobPost that the scrapers build on the hot path; the fields
+    are JobPost's. to_model() validates it into the public JobPost.
+    """
+
+    id: str | None = None
+    title: str
+    company_name: str | None
+    job_url: str
+    job_url_direct: str | None = None
+    location: LocationRecord | None
+
+    description: str | None = None
+    company_url: str | None = None
+    company_url_direct: str | None = None
+
+    job_type: list[JobType] | None = None
+    compensation: CompensationRecord | None = None
+    date_posted: date | None = None
+    emails: list[str] | None = None
+    is_remote: bool | None = None
+    listing_type: str | None = None
+
+    job_level: str | None = None
+    company_industry: str | None = None
+    company_addresses: str | None = None
+    company_num_employees: str | None = None
+    company_revenue: str | None = None
+    company_description: str | None = None
+    company_logo: str | None = None
+    banner_photo_url: str | None = None
+    job_function: str | None = None
+
+    skills: list[str] | None = None
+    experience_range: str | None = None
+    company_rating: float | None = None
+    company_reviews_count: int | None = None
+    vacancy_count: int | None = None
+    work_from_home_type: str | None = None
+
+    def to_model(self) -> JobPost:
+        """
+        Validates the record (and its location and compensation) into a JobPost
+        :return: JobPost
+        :raises pydantic.ValidationError: a field fails JobPost validation
+        """
+        return JobPost.model_validate(self, from_attributes=True)
+
+
 class Site(Enum):
     LINKEDIN = "linkedin"
     INDEED = "indeed"
@@ -301,6 +402,8 @@ class SalarySource(Enum):
 
 
 class ScraperInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     site_type: list[Site]
     search_term: str | None = None
     google_search_term: str | None = None
@@ -321,8 +424,19 @@ class ScraperInput(BaseModel):
     results_wanted: int = 15
     hours_old: int | None = None
 
+    response_cache: ResponseCache | None = None
+    conversion_cache: ConversionCache | None = None
+    known_ids: KnownIds | None = None
+    skip_known: bool = False
+    html_parser: str | None = None
+    description_converter: str | None = None
+
 
 class Scraper(ABC):
+    # whether the board returns description HTML (converted to markdown / plain text)
+    # rather than text
+    html_descriptions = True
+
     def __init__(
         self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
@@ -330,6 +444,133 @@ class Scraper(ABC):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.scraper_input = None
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        """
+        Scrapes all pages for jobs with scraper_input criteria, validated into JobPosts
+        :param scraper_input:
+        :return: job_response
+        """
+        job_list: list[JobPost] = []
+        for jobs in self.scrape_pages(scraper_input):
+            job_list.extend(
+                job.to_model() if isinstance(job, JobRecord) else job for job in jobs
+            )
+        return JobResponse(jobs=job_list)
+
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
+        """
+        Yields the jobs found on each search page as soon as the page is parsed.
+        Scrapers that only implement scrape() yield all of their jobs as one page.
+        :param scraper_input:
+        :return: iterator of job lists
+        """
+        if type(self).scrape is Scraper.scrape:
+            raise NotImplementedError(
+                f"{type(self).__name__} must implement scrape_pages or scrape"
+            )
+        yield self.scrape(scraper_input).jobs
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput, client: AsyncClient
+    ) -> AsyncIterator[list[JobRecord]]:
+        """
+        Async variant of scrape_pages for the asyncio engine. Scrapers without a
+        native implementation run scrape_pages in a worker thread, one page at a time.
+        :param scraper_input:
+        :param client: shared async HTTP client
+        :return: async iterator of job lists
+        """
+        pages = self.scrape_pages(scraper_input)
+        try:
+            while True:
+                jobs = await asyncio.to_thread(next, pages, None)
+                if jobs is None:
+                    break
+                yield jobs
+        finally:
+            try:
+                pages.close()
+            except ValueError:
+                # still running in its worker thread after a cancellation
+                pass
+
+    def _fetch_detail(self, key: str, fetch: Callable, cacheable: Callable = None):
+        """
+        Fetches a job detail response through the run's response cache, if any.
+        Successful responses are stored under (site, key) unless cacheable rejects them.
+        :param key: job id (or url) identifying the detail page
+        :param fetch: performs the request when the cache has no fresh entry
+        :param cacheable: optional check on the response before it is stored
+        :return: response
+        """
+        cache = self.scraper_input.response_cache if self.scraper_input else None
+        if cache is None:
+            return fetch()
+        cached = cache.get(self.site.value, key)
+        if cached is not None:
+            return cached
+        response = fetch()
+        self._store_detail(cache, key, response, cacheable)
+        return response
+
+    async def _fetch_detail_async(
+        self, key: str, fetch: Callable[[], Awaitable], cacheable: Callable = None
+    ):
+        """
+        Async variant of _fetch_detail
+        """
+        cache = self.scraper_input.response_cache if self.scraper_input else None
+        if cache is None:
+            return await fetch()
+        cached = cache.get(self.site.value, key)
+        if cached is not None:
+            return cached
+        response = await fetch()
+        self._store_detail(cache, key, response, cacheable)
+        return response
+
+    def _parse_html(self, html: str):
+        """
+        Parses a page with the run's html_parser backend
+        """
+        parser = self.scraper_input.html_parser if self.scraper_input else None
+        return parse_html(html, parser)
+
+    def _markdown(self, html: str | None) -> str | None:
+        """
+        Converts description HTML to markdown with the run's conversion cache and
+        description_converter backend
+        """
+        scraper_input = self.scraper_input
+        if scraper_input is None:
+            return markdown_converter(html)
+        return markdown_converter(
+            html, scraper_input.conversion_cache, scraper_input.description_converter
+        )
+
+    def _plain(self, html: str | None) -> str | None:
+        """
+        Plain text variant of _markdown
+        """
+        scraper_input = self.scraper_input
+        if scraper_input is None:
+            return plain_converter(html)
+        return plain_converter(
+            html, scraper_input.conversion_cache, scraper_input.description_converter
+        )
 
-    @abstractmethod
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+    def _is_known(self, job_id: str) -> bool:
+        """
+        Whether the job id (JobPost.id) is in the run's known_ids, in which case its
+        detail request is skipped
+        """
+        known_ids = self.scraper_input.known_ids if self.scraper_input else None
+        return known_ids is not None and job_id in known_ids
+
+    def _store_detail(self, cache: ResponseCache, key: str, response, cacheable):
+        if response.status_code not in range(200, 300):
+            return
+        if cacheable is None or cacheable(response):
+            cache.set(self.site.value, key, response)
@@ -1,27 +1,25 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Iterator, Optional
+from urllib.parse import urlparse
 
-import regex as re
 import requests
 
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
+from jobspy.patterns import NAUKRI_DAYS_AGO, NAUKRI_SALARY
 from jobspy.naukri.util import (
     is_job_remote,
     parse_job_type,
     parse_company_industry,
 )
 from jobspy.model import (
-    JobPost,
-    Location,
-    JobResponse,
+    JobRecord,
+    LocationRecord,
     Country,
-    Compensation,
+    CompensationRecord,
     DescriptionFormat,
     Scraper,
     ScraperInput,
@@ -30,9 +28,9 @@ from jobspy.model import (
 from jobspy.util import (
     extract_emails_from_text,
     currency_parser,
-    markdown_converter,
     create_session,
     create_logger,
+    get_rate_controller,
 )
 
 log = create_logger("Naukri")
@@ -40,7 +38,6 @@ log = create_logger("Naukri")
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
     delay = 3
-    band_delay = 4
     jobs_per_page = 20  
 
     def __init__(
@@ -59,18 +56,21 @@ class Naukri(Scraper):
             clear_cookies=True,
         )
         self.session.headers.update(naukri_headers)
+        self.rate_controller = get_rate_controller(
+            urlparse(self.base_url).netloc, initial_delay=self.delay
+        )
         self.scraper_input = None
         self.country = "India"  #naukri is india-focused by default
         log.info("Naukri scraper initialized")
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes Naukri API for jobs with scraper_input criteria
+        Scrapes Naukri API for jobs with scraper_input criteria, one page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
@@ -79,7 +79,8 @@ class Naukri(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: job_count < scraper_input.results_wanted
+            and page <= 50  # Arbitrary limit
         )
 
         while continue_search():
@@ -107,11 +108,13 @@ class Naukri(Scraper):
             params = {k: v for k, v in params.items() if v is not None}
             try:
                 log.debug(f"Sending request to {self.base_url} with params: {params}")
+                self.rate_controller.wait()
                 response = self.session.get(self.base_url, params=params, timeout=10)
+                self.rate_controller.record(response)
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    return
                 data = response.json()
                 job_details = data.get("jobDetails", [])
                 log.info(f"Received {len(job_details)} job entries from API")
@@ -120,8 +123,9 @@ class Naukri(Scraper):
                     break
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
+                return
 
+            page_jobs: list[JobRecord] = []
             for job in job_details:
                 job_id = job.get("jobId")
                 if not job_id or job_id in seen_ids:
@@ -133,27 +137,26 @@ class Naukri(Scraper):
                     fetch_desc = scraper_input.linkedin_fetch_description
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
-                        job_list.append(job_post)
+                        page_jobs.append(job_post)
+                        job_count += 1
                         log.info(f"Added job: {job_post.title} (ID: {job_id})")
                     if not continue_search():
                         break
                 except Exception as e:
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
+            yield page_jobs
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
-        job_list = job_list[:scraper_input.results_wanted]
-        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
-        return JobResponse(jobs=job_list)
+        log.info(f"Scraping completed. Total jobs collected: {job_count}")
 
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
-    ) -> Optional[JobPost]:
+    ) -> Optional[JobRecord]:
         """
-        Processes a single job from API response into a JobPost object
+        Processes a single job from API response into a JobRecord object
         """
         title = job.get("title", "N/A")
         company = job.get("companyName", "N/A")
@@ -166,12 +169,13 @@ class Naukri(Scraper):
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
         raw_description = job.get("jobDescription") if full_descr else None
 
-        job_type = parse_job_type(raw_description) if raw_description else None
-        company_industry = parse_company_industry(raw_description) if raw_description else None
+        soup = self._parse_html(raw_description) if raw_description else None
+        job_type = parse_job_type(soup) if soup else None
+        company_industry = parse_company_industry(soup) if soup else None
 
         description = raw_description
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            description = self._markdown(description)
 
         is_remote = is_job_remote(title, description or "", location)
         company_logo = job.get("logoPathV3") or job.get("logoPath")
@@ -185,7 +189,7 @@ class Naukri(Scraper):
         vacancy_count = job.get("vacancy")
         work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
 
-        job_post = JobPost(
+        job_post = JobRecord(
             id=f"nk-{job_id}",
             title=title,
             company_name=company,
@@ -210,23 +214,23 @@ class Naukri(Scraper):
         log.debug(f"Processed job: {title} at {company}")
         return job_post
 
-    def _get_location(self, placeholders: list[dict]) -> Location:
+    def _get_location(self, placeholders: list[dict]) -> LocationRecord:
         """
         Extracts location data from placeholders
         """
-        location = Location(country=Country.INDIA)
+        location = LocationRecord(country=Country.INDIA)
         for placeholder in placeholders:
             if placeholder.get("type") == "location":
                 location_str = placeholder.get("label", "")
                 parts = location_str.split(", ")
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
-                location = Location(city=city, state=state, country=Country.INDIA)
+                location = LocationRecord(city=city, state=state, country=Country.INDIA)
                 log.debug(f"Parsed location: {location.display_location()}")
                 break
         return location
 
-    def _get_compensation(self, placeholders: list[dict]) -> Optional[Compensation]:
+    def _get_compensation(self, placeholders: list[dict]) -> Optional[CompensationRecord]:
         """
         Extracts compensation data from placeholders, handling Indian salary formats (Lakhs, Crores)
         """
@@ -238,7 +242,7 @@ class Naukri(Scraper):
                     return None
 
                 # Handle Indian salary formats (e.g., "12-16 Lacs P.A.", "1-5 Cr")
-                salary_match = re.match(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?", salary_text, re.IGNORECASE)
+                salary_match = NAUKRI_SALARY.match(salary_text)
                 if salary_match:
                     min_salary, max_salary, unit = salary_match.groups()[:3]
                     min_salary, max_salary = float(min_salary), float(max_salary)
@@ -253,7 +257,7 @@ class Naukri(Scraper):
                         max_salary *= 10000000
 
                     log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
-                    return Compensation(
+                    return CompensationRecord(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
@@ -277,7 +281,7 @@ class Naukri(Scraper):
             log.debug("Date parsed as today")
             return today.date()
         elif "ago" in label:
-            match = re.search(r"(\d+)\s*day", label)
+            match = NAUKRI_DAYS_AGO.search(label)
             if match:
                 days = int(match.group(1))
                 parsed_date = (today - timedelta(days = days)).date()
@@ -301,4 +305,4 @@ class Naukri(Scraper):
             return "Remote"
         elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
             return "Work from office"
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,49 @@
+"""
+jobspy.parser
+~~~~~~~~~~~~~
+
+HTML parser backend shared by the scrapers. BeautifulSoup builds the tree with lxml
+when it is installed (several times faster than the pure-Python html.parser on
+large search pages) unless a backend is chosen per scrape.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+HTML_PARSERS = ("lxml", "html.parser", "html5lib")
+
+
+@lru_cache(maxsize=None)
+def default_html_parser() -> str:
+    """
+    Fastest installed backend: lxml if available, else html.parser
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+def parse_html(html: str | bytes, parser: str | None = None) -> BeautifulSoup:
+    """
+    Parses a page with the given backend, or the default one
+    :param html:
+    :param parser: one of HTML_PARSERS, None for default_html_parser()
+    :return: soup
+    """
+    parser = parser or default_html_parser()
+    if parser not in HTML_PARSERS:
+        raise ValueError(
+            f"Invalid html_parser {parser!r}, must be one of {', '.join(HTML_PARSERS)}"
+        )
+    try:
+        return BeautifulSoup(html, parser)
+    except FeatureNotFound:
+        raise ImportError(
+            f"html_parser={parser!r} is not installed, install it with:"
+            f" pip install {parser}"
+        ) from None
@@ -0,0 +1,103 @@
+"""
+jobspy.patterns
+~~~~~~~~~~~~~~~
+
+Regular expressions used by the text extractors and scrapers, compiled once at
+import, plus a scanner collecting everything the extractors look for in a
+description in one call.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, NamedTuple
+
+from jobspy.model import JobType
+
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+SALARY_RANGE_PATTERN = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+JOB_TYPE_PATTERNS = {
+    JobType.FULL_TIME: r"full\s?time",
+    JobType.PART_TIME: r"part\s?time",
+    JobType.INTERNSHIP: r"internship",
+    JobType.CONTRACT: r"contract",
+}
+REMOTE_KEYWORDS = ["remote", "work from home", "wfh"]
+
+EMAIL = re.compile(EMAIL_PATTERN)
+SALARY_RANGE = re.compile(SALARY_RANGE_PATTERN)
+# literal every match contains, and the pattern to confirm it (None if the literal is
+# the whole pattern); patterns run on lowercased text
+JOB_TYPE_MATCHERS = {
+    JobType.FULL_TIME: ("time", re.compile(JOB_TYPE_PATTERNS[JobType.FULL_TIME])),
+    JobType.PART_TIME: ("time", re.compile(JOB_TYPE_PATTERNS[JobType.PART_TIME])),
+    JobType.INTERNSHIP: ("internship", None),
+    JobType.CONTRACT: ("contract", None),
+}
+WHITESPACE = re.compile(r"\s+")
+DIGITS = re.compile(r"\d+")
+CURRENCY_NON_NUMERIC = re.compile("[^-0-9.,]")
+CURRENCY_SEPARATORS = re.compile("[.,]")
+
+# site specific
+GLASSDOOR_CSRF_TOKEN = re.compile(r'"token":\s*"([^"]+)"')
+GOOGLE_INITIAL_CURSOR = re.compile(r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"')
+GOOGLE_CURSOR = re.compile(r'data-async-fc="([^"]+)"')
+GOOGLE_INITIAL_JOBS = re.compile(
+    '520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
+)
+GOOGLE_REMOTE_KEYWORDS = ("remote", "wfh")
+ZIP_RECRUITER_JOB_URL = re.compile(r"job_url=(.+)")
+NAUKRI_SALARY = re.compile(
+    r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?", re.IGNORECASE
+)
+NAUKRI_DAYS_AGO = re.compile(r"(\d+)\s*day")
+
+
+class DescriptionScan(NamedTuple):
+    emails: list[str]
+    job_types: list[JobType]
+    is_remote: bool
+    salaries: list[str]
+
+
+def scan_description(
+    description: str | None,
+    remote_keywords: Iterable[str] = REMOTE_KEYWORDS,
+    salaries: bool = True,
+) -> DescriptionScan:
+    """
+    Collects emails, job types, remote markers and salary ranges from a description.
+    The text is lowercased once and each compiled pattern only runs when a literal
+    it needs ("@", "$", "time", ...) is present, which skips most of them.
+    :param description:
+    :param remote_keywords: lowercase markers of a remote job
+    :param salaries: whether to look for salary ranges (left empty otherwise)
+    :return: DescriptionScan, job types in JobType order
+    """
+    if not description:
+        return DescriptionScan([], [], False, [])
+    lowered = description.lower()
+    emails = EMAIL.findall(description) if "@" in description else []
+    salary_ranges = (
+        [match.group() for match in SALARY_RANGE.finditer(description)]
+        if salaries and "$" in description
+        else []
+    )
+    return DescriptionScan(
+        emails=emails,
+        job_types=find_job_types(lowered),
+        is_remote=any(keyword in lowered for keyword in remote_keywords),
+        salaries=salary_ranges,
+    )
+
+
+def find_job_types(lowered: str) -> list[JobType]:
+    """
+    Job types mentioned in an already lowercased text, in JobType order
+    """
+    return [
+        job_type
+        for job_type, (literal, pattern) in JOB_TYPE_MATCHERS.items()
+        if literal in lowered and (pattern is None or pattern.search(lowered))
+    ]
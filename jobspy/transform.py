@@ -0,0 +1,370 @@
+"""
+jobspy.transform
+~~~~~~~~~~~~~~~~
+
+Column-wise reshaping of scrape results into the rows of a downstream table, e.g. a
+Supabase schema. A table is described by a list of steps (renames, derived columns,
+value normalization, defaults, slugs, the columns kept), each applied to whole
+columns of the DataFrame, and to_table_rows() serializes the result to JSON-ready
+row dicts in one pass.
+
+Steps that derive a new column keep the dict semantics of a row loop: a row the
+step has no value for leaves the key out instead of sending null.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+import pandas as pd
+
+from jobspy.util import create_logger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+log = create_logger("Transform")
+
+SLUG_PUNCTUATION = re.compile(r"[^\w\s-]")
+SLUG_SEPARATORS = re.compile(r"[-\s]+")
+
+
+def _truthy(values: pd.Series) -> pd.Series:
+    """
+    Cells that are true in a boolean context: not null, empty, False or 0
+    """
+    if values.dtype == object:
+        return values.notna() & values.map(bool, na_action="ignore").eq(True)
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values.fillna(0).astype(bool)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.notna()
+    # strings
+    return (values.notna() & values.ne("")).fillna(False).astype(bool)
+
+
+def _blank(frame: pd.DataFrame) -> pd.Series:
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def slugify(values: pd.Series, max_length: int = 100) -> pd.Series:
+    """
+    URL slugs of text: lowercased, punctuation removed, runs of whitespace and dashes
+    turned into one "-", cut to max_length; computed once per distinct value
+    :param values: text column (nulls give "")
+    :param max_length: max slug length
+    :return: slugs
+    """
+    text = values.astype(object).where(values.notna(), "")
+    slugs = {
+        value: SLUG_SEPARATORS.sub("-", SLUG_PUNCTUATION.sub("", str(value).lower()))[
+            :max_length
+        ]
+        for value in text.unique()
+    }
+    return text.map(slugs)
+
+
+@dataclass
+class Constant:
+    """
+    Sets column to value on every row
+    """
+
+    column: str
+    value: object
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        frame[self.column] = self.value
+        omit.discard(self.column)
+        return frame
+
+
+@dataclass
+class Rename:
+    """
+    Renames columns; a column renamed onto an existing one replaces it
+    """
+
+    mapping: dict[str, str]
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if not self.mapping:
+            return frame
+        frame = frame.rename(columns=self.mapping)
+        for old, new in self.mapping.items():
+            if old in omit:
+                omit.discard(old)
+                omit.add(new)
+        return frame.loc[:, ~frame.columns.duplicated(keep="last")]
+
+
+@dataclass
+class Text:
+    """
+    Sets column to the stripped text of the first of sources the table has, on rows
+    where that is not empty or one of placeholders (compared lowercased). Other rows
+    keep the column's value, or leave it out when the column is new
+    """
+
+    column: str
+    sources: tuple[str, ...]
+    placeholders: frozenset[str] = frozenset()
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        source = next((name for name in self.sources if name in frame.columns), None)
+        if source is None:
+            return frame
+        values = frame[source]
+        text = values.astype(object).where(_truthy(values))
+        text = text.map(lambda value: str(value).strip(), na_action="ignore")
+        valid = text.notna() & text.ne("")
+        valid &= ~text.str.lower().isin(self.placeholders)
+        if self.column in frame.columns:
+            frame[self.column] = text.where(valid, frame[self.column].astype(object))
+        else:
+            frame[self.column] = text.where(valid, None)
+            omit.add(self.column)
+        return frame
+
+
+@dataclass
+class Coalesce:
+    """
+    Where the table has no column, sets it to the first truthy value among sources;
+    rows without one leave it out
+    """
+
+    column: str
+    sources: tuple[str, ...]
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.column in frame.columns:
+            return frame
+        result = _blank(frame)
+        for source in reversed(self.sources):
+            if source in frame.columns:
+                values = frame[source]
+                result = values.astype(object).where(_truthy(values), result)
+        frame[self.column] = result
+        omit.add(self.column)
+        return frame
+
+
+@dataclass
+class Copy:
+    """
+    Where the table has no column, copies source into it, nulls included
+    """
+
+    column: str
+    source: str
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.column not in frame.columns and self.source in frame.columns:
+            frame[self.column] = frame[self.source]
+        return frame
+
+
+@dataclass
+class Integer:
+    """
+    Where the table has no column, sets it to source truncated to an integer, null
+    where source is not a finite number
+    """
+
+    column: str
+    source: str
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.column not in frame.columns and self.source in frame.columns:
+            numbers = pd.to_numeric(frame[self.source], errors="coerce").astype(float)
+            numbers = numbers.where(np.isfinite(numbers))
+            frame[self.column] = np.trunc(numbers).astype("Int64")
+        return frame
+
+
+@dataclass
+class Normalize:
+    """
+    Maps the column's values, stripped and lowercased, through values. Empty cells,
+    values mapped to None and, with unknown=None, unmatched values leave the column
+    out of their row; unmatched values are logged. With a source, the column is
+    derived from source instead, and only where the table has no column
+    """
+
+    column: str
+    values: dict[str, str | None]
+    unknown: str | None = None
+    source: str | None = None
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.source is not None:
+            if self.column in frame.columns or self.source not in frame.columns:
+                return frame
+            values = frame[self.source]
+        elif self.column in frame.columns:
+            values = frame[self.column]
+        else:
+            return frame
+        values = values.astype(object).where(_truthy(values))
+        lookup, unmatched = {}, []
+        for value in values.dropna().unique():
+            key = str(value).lower().strip()
+            if key in self.values:
+                lookup[value] = self.values[key]
+            else:
+                lookup[value] = self.unknown
+                unmatched.append(key)
+        if unmatched:
+            outcome = "left out" if self.unknown is None else f"set to {self.unknown}"
+            log.warning(f"unknown {self.column} values {sorted(unmatched)} {outcome}")
+        frame[self.column] = values.map(lookup).astype(object)
+        omit.add(self.column)
+        return frame
+
+
+@dataclass
+class Flag:
+    """
+    Sets column to True on rows where source is truthy; other rows keep the
+    column's value, or leave it out when the column is new
+    """
+
+    column: str
+    source: str
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.source not in frame.columns:
+            return frame
+        flagged = _truthy(frame[self.source])
+        if self.column in frame.columns:
+            frame[self.column] = frame[self.column].astype(object).mask(flagged, True)
+        else:
+            frame[self.column] = _blank(frame).mask(flagged, True)
+            omit.add(self.column)
+        return frame
+
+
+@dataclass
+class Default:
+    """
+    Sets empty cells of column, or the whole column when the table has none, to value
+    """
+
+    column: str
+    value: object
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.column in frame.columns:
+            values = frame[self.column]
+            values = values.astype(object).where(_truthy(values), self.value)
+            frame[self.column] = values
+        else:
+            frame[self.column] = self.value
+        omit.discard(self.column)
+        return frame
+
+
+@dataclass
+class Slug:
+    """
+    Fills empty cells of column with slugify(source), or fallback where the slug
+    comes out empty
+    """
+
+    column: str
+    source: str
+    max_length: int = 100
+    fallback: str | None = None
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        if self.source not in frame.columns:
+            return frame
+        slugs = slugify(frame[self.source], self.max_length)
+        if self.fallback is not None:
+            slugs = slugs.where(slugs.ne(""), self.fallback)
+        if self.column in frame.columns:
+            values = frame[self.column]
+            slugs = values.astype(object).where(_truthy(values), slugs)
+        frame[self.column] = slugs
+        omit.discard(self.column)
+        return frame
+
+
+@dataclass
+class Keep:
+    """
+    Drops the columns not listed
+    """
+
+    columns: Iterable[str]
+
+    def apply(self, frame: pd.DataFrame, omit: set[str]) -> pd.DataFrame:
+        keep = set(self.columns)
+        return frame[[column for column in frame.columns if column in keep]]
+
+
+def newest_first(frame: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Sorts rows by date, most recent first, reading each row's date from the first
+    of columns with a value; rows without a parseable date go last, and ties keep
+    their order
+    :param frame: rows to sort
+    :param columns: date columns in order of preference
+    :return: sorted frame
+    """
+    dates = None
+    try:
+        for column in reversed(list(columns)):
+            if column in frame.columns:
+                values = frame[column]
+                parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+                if dates is not None:
+                    parsed = parsed.where(_truthy(values), dates)
+                dates = parsed
+        if dates is None:
+            return frame
+        order = dates.sort_values(ascending=False, kind="stable", na_position="last")
+    except (TypeError, ValueError) as e:
+        log.warning(f"could not sort rows by date: {e}")
+        return frame
+    return frame.loc[order.index]
+
+
+def to_table_rows(
+    jobs: pd.DataFrame | pa.Table,
+    steps: Iterable,
+    sort_by: Iterable[str] = (),
+) -> list[dict]:
+    """
+    Applies steps to the jobs column by column and returns the rows as dicts of JSON
+    values (dates as ISO strings), as json.loads(df.to_json(orient="records")) would
+    :param jobs: scrape_jobs DataFrame or output="arrow" Table (left unchanged)
+    :param steps: the table's steps, applied in order
+    :param sort_by: date columns to order the rows by, newest first (default keeps
+        the order)
+    :return: row dicts
+    """
+    if not isinstance(jobs, pd.DataFrame):
+        # pyarrow Table
+        jobs = jobs.to_pandas()
+    frame = jobs.reset_index(drop=True)
+    omit: set[str] = set()
+    for step in steps:
+        frame = step.apply(frame, omit)
+    sort_by = [column for column in sort_by if column in frame.columns]
+    if sort_by:
+        frame = newest_first(frame, sort_by)
+    rows = json.loads(frame.to_json(orient="records", date_format="iso"))
+    omitted = [column for column in frame.columns if column in omit]
+    if omitted:
+        for row in rows:
+            for column in omitted:
+                if row[column] is None:
+                    del row[column]
+    return rows
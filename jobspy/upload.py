@@ -0,0 +1,238 @@
+"""
+jobspy.upload
+~~~~~~~~~~~~~
+
+Chunked upload of job rows to a REST endpoint such as Supabase/PostgREST: rows are
+sent in batches bounded by row count and JSON size, a few batches in flight at a
+time. Transient failures are retried with backoff; a batch the server rejects for
+its rows is split in halves until the rows it cannot take are isolated, so one bad
+row no longer fails the whole upload. Any other error (credentials, a missing
+table or column, row-level security) would fail every row alike, so it stops the
+upload instead.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from jobspy.util import create_logger
+
+log = create_logger("Upload")
+
+# HTTP statuses worth retrying unchanged: timeouts, rate limits, gateway errors
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504, 520, 522, 524}
+
+# Postgres / PostgREST error codes worth retrying: connection errors, serialization
+# failures and deadlocks, out of resources, server shutdown, PostgREST's
+# could-not-connect and connection pool timeouts. A statement timeout (57014) is
+# left out on purpose: the same batch would time out again, halves may not.
+TRANSIENT_CODES = (
+    "08",
+    "40001",
+    "40P01",
+    "53",
+    "57P",
+    "PGRST000",
+    "PGRST001",
+    "PGRST002",
+    "PGRST003",
+)
+
+# Errors some rows of a batch can cause and its other rows not: cardinality
+# violation (the same conflict key twice in one upsert), data exceptions (class 22)
+# and integrity constraint violations (class 23)
+ROW_CODES = ("21000", "22", "23")
+# a body too large for the gateway, which halves fit under
+ROW_STATUSES = {413}
+
+
+def _status_and_code(error: BaseException) -> tuple[int | None, str | None]:
+    """
+    HTTP status and Postgres / PostgREST code of a failed request. postgrest-py
+    APIErrors carry the Postgres code, or the HTTP status when the error body was
+    not JSON (e.g. a gateway 503)
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code if status is None else status, None
+    return status, code if isinstance(code, str) else None
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether a failed request should be retried as is rather than split: network
+    errors (requests / httpx / OSError), TRANSIENT_STATUSES and TRANSIENT_CODES
+    """
+    if isinstance(error, (OSError, TimeoutError)):
+        return True
+    if any(cls.__name__ == "TransportError" for cls in type(error).__mro__):
+        # httpx
+        return True
+    status, code = _status_and_code(error)
+    if status in TRANSIENT_STATUSES:
+        return True
+    return code is not None and code.startswith(TRANSIENT_CODES)
+
+
+def is_row_error(error: BaseException) -> bool:
+    """
+    Whether a rejected batch may hold rows the server would take on their own, so
+    that splitting it isolates the bad rows: ROW_CODES and ROW_STATUSES
+    """
+    status, code = _status_and_code(error)
+    if status in ROW_STATUSES:
+        return True
+    return code is not None and code.startswith(ROW_CODES)
+
+
+def _row_size(row: dict) -> int:
+    # the separating comma of the JSON array included
+    return len(json.dumps(row, default=str).encode("utf-8")) + 1
+
+
+def chunk_rows(
+    rows: Iterable[dict], batch_size: int = 500, max_bytes: int = 1_000_000
+) -> Iterator[list[dict]]:
+    """
+    Splits rows into batches of at most batch_size rows and about max_bytes of JSON;
+    a row bigger than max_bytes goes in a batch of its own
+    :param rows: rows to send
+    :param batch_size: max rows per batch
+    :param max_bytes: max JSON size of a batch
+    :return: batches in row order
+    """
+    batch, size = [], 2
+    for row in rows:
+        row_size = _row_size(row)
+        if batch and (len(batch) >= batch_size or size + row_size > max_bytes):
+            yield batch
+            batch, size = [], 2
+        batch.append(row)
+        size += row_size
+    if batch:
+        yield batch
+
+
+@dataclass
+class UploadReport:
+    """
+    Outcome of upload_batches(): failed holds each row the server would not take on
+    its own, with the error of its last attempt, and the rows of batches an error
+    not caused by rows failed or left unsent; that error is kept as error
+    """
+
+    rows: int = 0
+    uploaded: int = 0
+    batches: int = 0
+    requests: int = 0
+    retries: int = 0
+    splits: int = 0
+    responses: list = field(default_factory=list)
+    failed: list[tuple[dict, BaseException]] = field(default_factory=list)
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def upload_batches(
+    rows: Iterable[dict],
+    send: Callable[[list[dict]], object],
+    batch_size: int = 500,
+    max_bytes: int = 1_000_000,
+    max_in_flight: int = 4,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> UploadReport:
+    """
+    Sends rows in chunk_rows() batches, max_in_flight at a time. A batch failing
+    with an is_transient() error is retried up to retries times, sleeping backoff *
+    2 ** attempt seconds with jitter; an is_row_error() splits it in halves that are
+    sent again, down to single rows, which are then recorded as failed. Any other
+    error (401/403, unknown table or column, row-level security) fails the batch
+    and the batches not sent yet, as it would fail them all alike. send is
+    called from worker threads and may see a batch again after a timeout, so it
+    should be idempotent (an upsert, not a plain insert)
+    :param rows: rows to upload
+    :param send: sends one batch, raising on failure; e.g.
+        lambda batch: client.table(name).upsert(batch, on_conflict=key).execute()
+    :param batch_size: max rows per request
+    :param max_bytes: max JSON size per request
+    :param max_in_flight: requests sent concurrently
+    :param retries: retries of a transient failure before its rows count as failed
+    :param backoff: base delay in seconds between retries
+    :return: UploadReport
+    """
+    report = UploadReport()
+
+    def attempt(batch: list[dict]) -> tuple[object, BaseException | None, int]:
+        for tries in range(retries + 1):
+            try:
+                return send(batch), None, tries
+            except Exception as error:
+                if tries == retries or not is_transient(error):
+                    return None, error, tries
+                delay = backoff * 2**tries
+                time.sleep(delay + random.uniform(0, delay))
+
+    batches = chunk_rows(rows, batch_size, max_bytes)
+    # halves of split batches, sent before the batches not started yet
+    halves = []
+
+    def next_batch() -> list[dict] | None:
+        if halves:
+            return halves.pop()
+        batch = next(batches, None)
+        if batch is not None:
+            report.rows += len(batch)
+            report.batches += 1
+        return batch
+
+    max_in_flight = max(max_in_flight, 1)
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        pending = {}
+        while True:
+            while report.error is None and len(pending) < max_in_flight:
+                batch = next_batch()
+                if batch is None:
+                    break
+                pending[executor.submit(attempt, batch)] = batch
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                response, error, tries = future.result()
+                report.requests += tries + 1
+                report.retries += tries
+                if error is None:
+                    report.uploaded += len(batch)
+                    report.responses.append(response)
+                elif len(batch) > 1 and is_row_error(error):
+                    report.splits += 1
+                    log.debug(f"{len(batch)} rows rejected, splitting: {error}")
+                    middle = len(batch) // 2
+                    halves.extend((batch[middle:], batch[:middle]))
+                else:
+                    log.warning(f"{len(batch)} rows failed to upload: {error}")
+                    report.failed.extend((row, error) for row in batch)
+                    if report.error is None and not (
+                        is_transient(error) or is_row_error(error)
+                    ):
+                        report.error = error
+        if report.error is not None:
+            unsent = [row for half in halves for row in half]
+            for batch in iter(next_batch, None):
+                unsent.extend(batch)
+            log.error(f"upload stopped, {len(unsent)} rows not sent: {report.error}")
+            report.failed.extend((row, report.error) for row in unsent)
+    return report
@@ -0,0 +1,284 @@
+"""
+jobspy.urls
+~~~~~~~~~~~
+
+Canonical forms of job URLs. The same applicant tracking system (ATS) posting
+reaches a run through LinkedIn's apply URL, Indeed's viewJobUrl, ZipRecruiter's
+redirect and Google's apply links, each with its own tracking parameters, host
+spelling and path variant. canonical_url() cleans a URL into a stable, still working
+link; url_identity() goes further for Workday, Greenhouse, iCIMS and Lever, naming
+the posting by its ATS requisition id; UrlIndex is a hash index over identities.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Iterable
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# query parameters that only track where a click came from; generic names (src,
+# source, sid, ...) are left alone, as some sites route postings by them
+TRACKING_PARAMS = frozenset(
+    {
+        "gclid",
+        "fbclid",
+        "msclkid",
+        "dclid",
+        "yclid",
+        "referrer",
+        "sourcetype",
+        "source_type",
+        "trk",
+        "trkinfo",
+        "trackingid",
+        "tracking_id",
+        "campaign",
+        "campaignid",
+        "gh_src",
+        "lever-source",
+        "lever-origin",
+        "iis",
+        "iisn",
+        "ccid",
+        "jobpipeline",
+        "in_iframe",
+        "hashed",
+        "needsredirect",
+        "jobboardid",
+        "clickid",
+        "click_id",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "mc_", "_hs", "pk_", "hsa_")
+HOST_PREFIXES = ("www.", "m.")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+ENCODED_URL = re.compile(r"https?%3a", re.IGNORECASE)
+# fragments single-page careers sites route on ("#/job/123", "#!/jobs/123")
+ROUTE_FRAGMENT = re.compile(r"^[/!]")
+
+# path segments after a Workday requisition that lead to the same posting
+WORKDAY_ACTIONS = frozenset({"apply", "applymanually", "autofillwithresume", "login"})
+GREENHOUSE_JOB = re.compile(r"^/[^/]+/jobs/(\d+)")
+ICIMS_JOB = re.compile(r"^/jobs/(\d+)")
+LEVER_JOB = re.compile(r"^/([^/]+)/([0-9a-f-]{36})")
+ATS_IDENTITIES = ("workday:", "greenhouse:", "icims:", "lever:")
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _host(netloc: str, scheme: str) -> str:
+    host = netloc.rsplit("@", 1)[-1].lower().rstrip(".")
+    name, _, port = host.partition(":")
+    if port and port.isdigit() and int(port) == DEFAULT_PORTS.get(scheme):
+        return name
+    return host
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str | None) -> str | None:
+    """
+    Cleans a job URL into a stable form that still opens the posting: the URL is
+    unquoted when it arrives percent-encoded whole, scheme and host lowercased,
+    default ports, tracking parameters (utm_*, gclid, trk, gh_src, ...) and anchor
+    fragments dropped, the other parameters sorted and a trailing slash removed.
+    Route fragments ("#/job/123", "#!/jobs/123") name the posting and are kept.
+    Meant for comparing URLs: store the URL a site gave, not its canonical form
+    :param url: job URL
+    :return: canonical URL, or None for an empty / non-http(s) value
+    """
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    if ENCODED_URL.match(url):
+        url = unquote(url)
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.netloc:
+        return None
+    path = parts.path
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(name)
+    )
+    fragment = parts.fragment if ROUTE_FRAGMENT.match(parts.fragment) else ""
+    return urlunsplit(
+        (scheme, _host(parts.netloc, scheme), path or "/", urlencode(query), fragment)
+    )
+
+
+def _workday_identity(host: str, path: str) -> str | None:
+    segments = [unquote(segment) for segment in path.split("/") if segment]
+    if host.endswith(".myworkdaysite.com"):
+        # wd5.myworkdaysite.com/en-US/recruiting/{tenant}/{site}/job/...
+        if "recruiting" not in segments:
+            return None
+        tenant_at = segments.index("recruiting") + 1
+        if tenant_at >= len(segments):
+            return None
+        tenant = segments[tenant_at]
+    else:
+        # {tenant}.wd1.myworkdayjobs.com/{site}/job/{location}/{title}_{requisition}
+        tenant = host.split(".", 1)[0]
+    for marker in ("job", "details"):
+        if marker in segments:
+            rest = segments[segments.index(marker) + 1 :]
+            break
+    else:
+        return None
+    while rest and rest[-1].lower() in WORKDAY_ACTIONS:
+        rest.pop()
+    if not rest:
+        return None
+    requisition = rest[-1].rsplit("_", 1)[-1]
+    return f"workday:{tenant.lower()}:{requisition.lower()}"
+
+
+def _ats_identity(host: str, path: str, query: dict[str, str]) -> str | None:
+    if host.endswith((".myworkdayjobs.com", ".myworkdaysite.com")):
+        return _workday_identity(host, path)
+    if query.get("gh_jid", "").isdigit():
+        # Greenhouse job embedded on the employer's careers site
+        return f"greenhouse:{query['gh_jid']}"
+    if host.endswith("greenhouse.io"):
+        if query.get("token", "").isdigit():
+            # boards.greenhouse.io/embed/job_app?for={board}&token={id}
+            return f"greenhouse:{query['token']}"
+        match = GREENHOUSE_JOB.match(path)
+        return f"greenhouse:{match.group(1)}" if match else None
+    if host.endswith(".icims.com"):
+        match = ICIMS_JOB.match(path)
+        if match:
+            return f"icims:{host.split('.', 1)[0]}:{match.group(1)}"
+        return None
+    if host.endswith("lever.co"):
+        match = LEVER_JOB.match(path)
+        if match:
+            return f"lever:{match.group(1).lower()}:{match.group(2).lower()}"
+    return None
+
+
+@lru_cache(maxsize=65536)
+def url_identity(url: str | None) -> str | None:
+    """
+    Name of the posting a job URL points to, equal for every variant of the same
+    posting: "workday:{tenant}:{requisition}", "greenhouse:{id}",
+    "icims:{portal}:{id}" or "lever:{company}:{id}" for ATS postings, else the
+    canonical URL without its scheme and www. / m. host prefix. Bare hosts (a
+    careers home page shared by every posting of a company) have no identity
+    :param url: job URL
+    :return: identity, or None
+    """
+    canonical = canonical_url(url)
+    if canonical is None:
+        return None
+    parts = urlsplit(canonical)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    identity = _ats_identity(parts.netloc, parts.path, query)
+    if identity is not None:
+        return identity
+    if parts.path == "/" and not parts.query and not parts.fragment:
+        return None
+    host = parts.netloc
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix) :]
+            break
+    return urlunsplit(("", host, parts.path, parts.query, parts.fragment))[2:]
+
+
+def ats_identity(url: str | None) -> str | None:
+    """
+    url_identity() of a URL naming one Workday, Greenhouse, iCIMS or Lever posting
+    :param url: job URL
+    :return: identity, or None for any other URL
+    """
+    identity = url_identity(url)
+    if identity is None or not identity.startswith(ATS_IDENTITIES):
+        return None
+    return identity
+
+
+def url_key(url: str | None) -> int | None:
+    """
+    8-byte hash of url_identity()
+    :param url: job URL
+    :return: key, or None for a URL without identity
+    """
+    identity = url_identity(url)
+    if identity is None:
+        return None
+    digest = hashlib.blake2b(identity.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class UrlIndex:
+    """
+    Hash index over job URLs: the 8-byte url_key() of each URL maps to the value
+    it was first added with (True, a job id, a row position), so every variant of a
+    posting finds the same entry. Not thread-safe; callers index from one thread.
+    """
+
+    def __init__(self, urls: Iterable[str | None] = ()):
+        self._values: dict[int, object] = {}
+        for url in urls:
+            self.add(url)
+
+    def add(self, url: str | None, value: object = True) -> object | None:
+        """
+        Indexes the URL unless its posting already is
+        :return: the value stored earlier for the posting, or None when new
+        """
+        key = url_key(url)
+        if key is None:
+            return None
+        if key in self._values:
+            return self._values[key]
+        self._values[key] = value
+        return None
+
+    def claim(self, *urls: str | None, value: object = True) -> bool:
+        """
+        Claims a job by all of its URLs (e.g. job_url_direct and job_url): every URL
+        not indexed yet is added with value
+        :return: whether none of the URLs was indexed before, i.e. the job is new
+        """
+        keys = [key for key in map(url_key, urls) if key is not None]
+        new = not any(key in self._values for key in keys)
+        for key in keys:
+            self._values.setdefault(key, value)
+        return new
+
+    def claim_job(
+        self, job_url: str | None, job_url_direct: str | None, value: object = True
+    ) -> bool:
+        """
+        Claims a job by its board URL and, when it names an ATS posting
+        (ats_identity()), its direct URL. Other direct URLs are often shared by
+        different jobs (a careers search page), so they do not make a job a copy
+        :return: whether the job is new
+        """
+        if ats_identity(job_url_direct) is None:
+            return self.claim(job_url, value=value)
+        return self.claim(job_url, job_url_direct, value=value)
+
+    def get(self, url: str | None, default: object = None) -> object:
+        key = url_key(url)
+        return default if key is None else self._values.get(key, default)
+
+    def __contains__(self, url: str | None) -> bool:
+        key = url_key(url)
+        return key is not None and key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import re
+import threading
+import time
+import uuid
+from dataclasses import fields
 from itertools import cycle
+from operator import attrgetter
 
 import numpy as np
+import pandas as pd
 import requests
 import tls_client
 import urllib3
-from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.converter import markdown_converter, plain_converter
+from jobspy.patterns import (
+    CURRENCY_NON_NUMERIC,
+    CURRENCY_SEPARATORS,
+    EMAIL,
+    SALARY_RANGE,
+    find_job_types,
+)
+from jobspy.model import (
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobRecord,
+    JobType,
+    SalarySource,
+    Site,
+)
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -61,17 +84,9 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         self.setup_session(has_retry, delay)
 
     def setup_session(self, has_retry, delay):
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        adapter = get_http_adapter(has_retry, delay)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
 
     def request(self, method, url, **kwargs):
         if self.clear_cookies:
@@ -87,9 +102,14 @@ class RequestsRotating(RotatingProxySession, requests.Session):
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
+    # TLS fingerprint of every TLSRotating session
+    tls_profile = {"random_tls_extension_order": True}
+
     def __init__(self, proxies=None):
         RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
+        tls_client.Session.__init__(self, **self.tls_profile)
+        # the native session holds the connections; cookies and headers stay here
+        self._session_id = get_tls_session_id(self.tls_profile, proxies)
 
     def execute_request(self, *args, **kwargs):
         if self.proxy_cycle:
@@ -103,6 +123,104 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
         return response
 
 
+# connection pools of the shared sessions, see configure_connection_pools()
+_pool_sizes = {"pool_connections": 32, "pool_maxsize": 16, "pool_block": False}
+_http_adapters: dict[tuple, SharedHTTPAdapter] = {}
+_tls_session_ids: dict[tuple, str] = {}
+_pools_lock = threading.Lock()
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter mounted on every requests session with the same retry
+    settings, so its connection pools (one per host, TLS settings and proxy) outlive
+    the session and the scrape_jobs call. A session closing it leaves the pools open
+    for the other sessions; close_connection_pools() closes them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._proxy_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        with self._proxy_lock:
+            return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def close(self):
+        pass
+
+    def close_pools(self):
+        super().close()
+
+
+def get_http_adapter(has_retry: bool = False, delay: int = 1) -> SharedHTTPAdapter:
+    """
+    Returns the process-wide adapter for the retry settings, sized by
+    configure_connection_pools()
+    """
+    key = (has_retry, delay, *_pool_sizes.values())
+    with _pools_lock:
+        adapter = _http_adapters.get(key)
+        if adapter is None:
+            retries = 0
+            if has_retry:
+                retries = Retry(
+                    total=3,
+                    connect=3,
+                    status=3,
+                    status_forcelist=[500, 502, 503, 504, 429],
+                    backoff_factor=delay,
+                )
+            adapter = SharedHTTPAdapter(max_retries=retries, **_pool_sizes)
+            _http_adapters[key] = adapter
+        return adapter
+
+
+def get_tls_session_id(profile: dict, proxies: list[str] | str | None) -> str:
+    """
+    Returns the process-wide tls_client session id for a TLS profile and proxies.
+    Sessions sharing the id share the native client and its connections
+    """
+    if isinstance(proxies, str):
+        proxies = [proxies]
+    key = (tuple(sorted(profile.items())), tuple(proxies or ()))
+    with _pools_lock:
+        return _tls_session_ids.setdefault(key, str(uuid.uuid4()))
+
+
+def configure_connection_pools(
+    pool_connections: int = 32, pool_maxsize: int = 16, pool_block: bool = False
+):
+    """
+    Sizes the connection pools shared by every session the scrapers create; sessions
+    created earlier keep their pools
+    :param pool_connections: hosts (per proxy) whose connections are kept
+    :param pool_maxsize: connections kept per host; raise it above the number of
+        concurrent requests to one host (e.g. many detail workers)
+    :param pool_block: wait for a free connection instead of opening one beyond
+        pool_maxsize
+    """
+    with _pools_lock:
+        _pool_sizes.update(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+
+def close_connection_pools():
+    """
+    Closes the connections of the shared requests adapters; later sessions open new
+    ones. tls_client sessions created afterwards get new native sessions
+    """
+    with _pools_lock:
+        adapters = list(_http_adapters.values())
+        _http_adapters.clear()
+        _tls_session_ids.clear()
+    for adapter in adapters:
+        adapter.close_pools()
+
+
 def create_session(
     *,
     proxies: dict | str | None = None,
@@ -113,7 +231,9 @@ def create_session(
     clear_cookies: bool = False,
 ) -> requests.Session:
     """
-    Creates a requests session with optional tls, proxy, and retry settings.
+    Creates a requests session with optional tls, proxy, and retry settings. Its
+    connections come from process-wide pools shared with every other session of the
+    same settings, so they stay warm across scrapers and scrape_jobs calls.
     :return: A session object
     """
     if is_tls:
@@ -132,6 +252,250 @@ def create_session(
     return session
 
 
+class AsyncClient(RotatingProxySession):
+    """
+    Shared httpx client for the asyncio engine. Rotates proxies like the sync
+    sessions and caps the number of requests in flight across every scraper.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        max_in_flight: int = 100,
+        timeout: float = 30,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "async scraping requires httpx, install it with: pip install httpx"
+            ) from None
+        super().__init__(proxies=proxies)
+        self.httpx = httpx
+        self.verify = ca_cert if ca_cert else True
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.clients = {}
+
+    def _get_client(self, proxy: str | None):
+        client = self.clients.get(proxy)
+        if client is None:
+            client = self.httpx.AsyncClient(
+                proxy=proxy,
+                verify=self.verify,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=self.httpx.Limits(max_connections=self.max_in_flight),
+            )
+            self.clients[proxy] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs):
+        proxy = None
+        if self.proxy_cycle:
+            next_proxy = next(self.proxy_cycle)
+            if next_proxy["http"] != "http://localhost":
+                proxy = next_proxy["http"]
+        client = self._get_client(proxy)
+        async with self.semaphore:
+            return await client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: callers of acquire() get rate requests per second on
+    average, in bursts of up to capacity. pause() holds every caller back, e.g. when
+    the host answers 429. A rate of 0 disables the limit but still honours pauses.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif not self.rate:
+                    return
+                else:
+                    elapsed = max(now - self.updated, 0)
+                    self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Blocks acquire() for every caller for the next seconds, then refills from empty
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            self.updated = self.paused_until
+
+
+_rate_limiters: dict[tuple, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, rate: float, capacity: int = 1) -> TokenBucket:
+    """
+    Returns the process-wide token bucket for host, so concurrent scrapers (and the
+    worker threads of one scraper) share a single request budget per host
+    """
+    key = (host, rate, capacity)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = TokenBucket(rate, capacity)
+        return limiter
+
+
+def retry_after_seconds(response, default: float) -> float:
+    """
+    Seconds to wait before retrying, from the response's Retry-After header (in
+    seconds) or default when it is missing or an HTTP date
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        return default
+
+
+class RateController:
+    """
+    Adaptive pacing of the requests to one host (AIMD): every successful response
+    adds increase requests per second to the rate, a 429, 5xx or a response slower
+    than slow_response seconds divides it by 1 / decrease. wait() spaces requests
+    by the current delay with some jitter, and honours Retry-After.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 3,
+        min_delay: float = 0.5,
+        max_delay: float = 60,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        slow_response: float = 5,
+        jitter: float = 0.3,
+    ):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay = min(max(initial_delay, min_delay), max_delay)
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_response = slow_response
+        self.jitter = jitter
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Claims the next request slot
+        :return: seconds to wait for it
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            jitter = random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_at = start + self.delay * jitter
+            return start - now
+
+    def wait(self) -> float:
+        """
+        Blocks until the next request to the host may be sent
+        :return: seconds waited
+        """
+        pause = self._reserve()
+        if pause > 0:
+            time.sleep(pause)
+        return pause
+
+    async def wait_async(self) -> float:
+        pause = self._reserve()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        return pause
+
+    def record(self, response, elapsed: float | None = None):
+        """
+        Adjusts the delay from a response (anything with status_code and headers)
+        :param response:
+        :param elapsed: response time in seconds, read from response.elapsed if omitted
+        """
+        if elapsed is None:
+            elapsed = response_seconds(response)
+        status_code = response.status_code
+        with self._lock:
+            now = time.monotonic()
+            if status_code == 429 or status_code >= 500 or (
+                elapsed is not None and elapsed > self.slow_response
+            ):
+                self.delay = min(
+                    max(self.delay / self.decrease, self.min_delay, 1.0), self.max_delay
+                )
+                pause = retry_after_seconds(response, default=self.delay)
+                self._next_at = max(self._next_at, now + pause)
+            elif status_code < 400 and self.delay > 0:
+                self.delay = max(1 / (1 / self.delay + self.increase), self.min_delay)
+
+
+_rate_controllers: dict[str, RateController] = {}
+
+
+def get_rate_controller(host: str, **kwargs) -> RateController:
+    """
+    Returns the process-wide RateController for host, created with kwargs on first
+    use, so every scraper and run in the process paces that host together
+    """
+    with _rate_limiters_lock:
+        controller = _rate_controllers.get(host)
+        if controller is None:
+            controller = _rate_controllers[host] = RateController(**kwargs)
+        return controller
+
+
+def response_seconds(response) -> float | None:
+    """
+    Response time of a requests/httpx response, None if it was not measured
+    """
+    try:
+        return response.elapsed.total_seconds()
+    except (AttributeError, RuntimeError):
+        return None
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
@@ -151,27 +515,21 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
-def markdown_converter(description_html: str):
-    if description_html is None:
-        return None
-    markdown = md(description_html)
-    return markdown.strip()
-
-def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
-    if decription_html is None:
-        return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
-    text = re.sub(r'\s+',' ',text)
-    return text.strip()
-
-
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return EMAIL.findall(text) if "@" in text else []
+
+
+def trim_page(jobs: list, jobs_before: int, offset: int, limit: int) -> list:
+    """
+    Keeps the part of a page that falls inside the [offset, offset + limit) window
+    :param jobs_before: number of jobs found on the earlier pages
+    :return: jobs of the page inside the window
+    """
+    start = max(offset - jobs_before, 0)
+    end = max(offset + limit - jobs_before, 0)
+    return jobs[start:end]
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
@@ -188,9 +546,9 @@ def get_enum_from_job_type(job_type_str: str) -> JobType | None:
 def currency_parser(cur_str):
     # Remove any non-numerical characters
     # except for ',' '.' or '-' (e.g. EUR)
-    cur_str = re.sub("[^-0-9.,]", "", cur_str)
+    cur_str = CURRENCY_NON_NUMERIC.sub("", cur_str)
     # Remove any 000s separators (either , or .)
-    cur_str = re.sub("[.,]", "", cur_str[:-3]) + cur_str[-3:]
+    cur_str = CURRENCY_SEPARATORS.sub("", cur_str[:-3]) + cur_str[-3:]
 
     if "." in list(cur_str[-3:]):
         num = float(cur_str)
@@ -224,7 +582,6 @@ def extract_salary(
         return None, None, None, None
 
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -235,7 +592,7 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
+    match = SALARY_RANGE.search(salary_str)
 
     if match:
         min_salary = to_int(match.group(1))
@@ -278,22 +635,91 @@ def extract_salary(
     return None, None, None, None
 
 
+def extract_salaries(
+    descriptions,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    Batch version of extract_salary over a Series or array of descriptions: one
+    str.extract pass over the descriptions containing a "$", then the interval and
+    limit rules as NumPy masks.
+    :return: DataFrame of interval, min_amount, max_amount and currency aligned with
+        descriptions, null where extract_salary would return Nones
+    """
+    if not isinstance(descriptions, pd.Series):
+        descriptions = pd.Series(descriptions)
+    text = descriptions.astype(object)
+    has_dollar = text.str.contains("$", regex=False, na=False).to_numpy(dtype=bool)
+    positions = np.flatnonzero(has_dollar)
+    parts = text.iloc[positions].str.extract(SALARY_RANGE)
+    matched = parts[0].notna().to_numpy()
+    positions, parts = positions[matched], parts[matched]
+
+    def to_number(group: pd.Series) -> np.ndarray:
+        numbers = group.str.replace(",", "", regex=False).astype(float).to_numpy()
+        return np.trunc(numbers)
+
+    has_k = ((parts[1] != "") | (parts[3] != "")).to_numpy(dtype=bool)
+    scale = np.where(has_k, 1000, 1)
+    min_salary = to_number(parts[0]) * scale
+    max_salary = to_number(parts[2]) * scale
+
+    hourly = min_salary < hourly_threshold
+    monthly = ~hourly & (min_salary < monthly_threshold)
+    yearly = ~hourly & ~monthly
+    multiplier = np.select([hourly, monthly], [2080, 12], 1)
+    annual_min = min_salary * multiplier
+    annual_max = max_salary * multiplier
+    has_annual_max = (
+        yearly
+        | (hourly & (max_salary < hourly_threshold))
+        | (monthly & (max_salary < monthly_threshold))
+    )
+    valid = (
+        has_annual_max
+        & (annual_max != 0)
+        & (lower_limit <= annual_min)
+        & (annual_min <= upper_limit)
+        & (lower_limit <= annual_max)
+        & (annual_max <= upper_limit)
+        & (annual_min < annual_max)
+    )
+    if enforce_annual_salary:
+        min_salary, max_salary = annual_min, annual_max
+
+    rows = positions[valid]
+    interval = np.full(len(text), None, dtype=object)
+    interval[rows] = np.select(
+        [hourly[valid], monthly[valid]],
+        [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+        CompensationInterval.YEARLY.value,
+    )
+    min_amount = np.full(len(text), np.nan)
+    min_amount[rows] = min_salary[valid]
+    max_amount = np.full(len(text), np.nan)
+    max_amount[rows] = max_salary[valid]
+    currency = np.full(len(text), None, dtype=object)
+    currency[rows] = "USD"
+    return pd.DataFrame(
+        {
+            "interval": interval,
+            "min_amount": pd.array(min_amount).astype("Int64"),
+            "max_amount": pd.array(max_amount).astype("Int64"),
+            "currency": currency,
+        },
+        index=descriptions.index,
+    )
+
+
 def extract_job_type(description: str):
     if not description:
         return []
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
-
+    listing_types = find_job_types(description.lower())
     return listing_types if listing_types else None
 
 
@@ -308,22 +734,61 @@ def get_enum_from_value(value_str):
     raise Exception(f"Invalid job type: {value_str}")
 
 
+# pay periods per year for each CompensationInterval value
+ANNUAL_MULTIPLIERS = {
+    CompensationInterval.YEARLY.value: 1,
+    CompensationInterval.MONTHLY.value: 12,
+    CompensationInterval.WEEKLY.value: 52,
+    CompensationInterval.DAILY.value: 260,
+    CompensationInterval.HOURLY.value: 2080,
+}
+
+
 def convert_to_annual(job_data: dict):
-    if job_data["interval"] == "hourly":
-        job_data["min_amount"] *= 2080
-        job_data["max_amount"] *= 2080
-    if job_data["interval"] == "monthly":
-        job_data["min_amount"] *= 12
-        job_data["max_amount"] *= 12
-    if job_data["interval"] == "weekly":
-        job_data["min_amount"] *= 52
-        job_data["max_amount"] *= 52
-    if job_data["interval"] == "daily":
-        job_data["min_amount"] *= 260
-        job_data["max_amount"] *= 260
+    multiplier = ANNUAL_MULTIPLIERS.get(job_data["interval"])
+    if multiplier:
+        job_data["min_amount"] *= multiplier
+        job_data["max_amount"] *= multiplier
     job_data["interval"] = "yearly"
 
 
+def annualize_salaries(
+    jobs: pd.DataFrame, keep_intervals: tuple[str, ...] = ()
+) -> pd.DataFrame:
+    """
+    Column-wise convert_to_annual over a jobs DataFrame: rows with a non-yearly
+    interval and both amounts set get yearly amounts from ANNUAL_MULTIPLIERS.
+    :param jobs: DataFrame with interval, min_amount and max_amount columns
+    :param keep_intervals: intervals left as they are (e.g. ("hourly",))
+    :return: converted copy of jobs
+    """
+    if jobs.empty or "interval" not in jobs.columns:
+        return jobs
+    intervals = jobs["interval"]
+    multipliers = intervals.map(ANNUAL_MULTIPLIERS)
+    min_amount = pd.to_numeric(jobs["min_amount"], errors="coerce")
+    max_amount = pd.to_numeric(jobs["max_amount"], errors="coerce")
+    convert = (
+        multipliers.notna()
+        & (intervals != CompensationInterval.YEARLY.value)
+        & ~intervals.isin(keep_intervals)
+        & min_amount.fillna(0).ne(0)
+        & max_amount.fillna(0).ne(0)
+    )
+    if not convert.any():
+        return jobs
+    multipliers = multipliers.where(convert, 1).astype(int)
+    jobs = jobs.copy()
+    jobs["min_amount"] = min_amount * multipliers
+    jobs["max_amount"] = max_amount * multipliers
+    jobs["interval"] = intervals.where(~convert, CompensationInterval.YEARLY.value)
+    return jobs
+
+
+# attributes of a JobRecord / JobPost copied into a flattened row
+JOB_FIELDS = tuple(field.name for field in fields(JobRecord))
+_job_fields = attrgetter(*JOB_FIELDS)
+
 desired_order = [
     "id",
     "site",
@@ -361,3 +826,133 @@ desired_order = [
     "vacancy_count",
     "work_from_home_type",
 ]
+
+
+def flatten_job_post(
+    job: JobRecord | JobPost,
+    site: str,
+    country: Country,
+    enforce_annual_salary: bool = False,
+) -> dict:
+    """
+    Flattens a JobRecord (or a validated JobPost) into a single result row with the
+    scrape_jobs column names
+    :return: dict of column name to value
+    """
+    job_data = dict(zip(JOB_FIELDS, _job_fields(job)))
+    job_data["site"] = site
+    job_data["company"] = job.company_name
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job.job_type)
+        if job.job_type
+        else None
+    )
+    job_data["emails"] = ", ".join(job.emails) if job.emails else None
+    if job.location is not None:
+        job_data["location"] = job.location.display_location()
+
+    # Handle compensation
+    compensation = job.compensation
+    if compensation is not None:
+        # records carry what the scraper parsed; coerce it as JobPost validation does
+        interval = compensation.interval
+        if isinstance(interval, str):
+            interval = CompensationInterval(interval)
+        min_amount, max_amount = compensation.min_amount, compensation.max_amount
+        job_data["compensation"] = {
+            "interval": interval,
+            "min_amount": float(min_amount) if min_amount is not None else None,
+            "max_amount": float(max_amount) if max_amount is not None else None,
+            "currency": compensation.currency,
+        }
+        job_data["interval"] = interval.value if interval else None
+        job_data["min_amount"] = job_data["compensation"]["min_amount"]
+        job_data["max_amount"] = job_data["compensation"]["max_amount"]
+        job_data["currency"] = compensation.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    else:
+        if country == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job_data["description"],
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
+
+    # naukri-specific fields
+    job_data["skills"] = ", ".join(job.skills) if job.skills else None
+    return job_data
+
+
+class JobFrameBuilder:
+    """
+    Collects flattened job rows into per-column lists and builds one DataFrame at the end.
+    Missing values are stored as None and become NaN in partially filled columns,
+    while columns no job filled stay as all-None object columns.
+    """
+
+    def __init__(self, columns: list[str] | None = None):
+        self.columns = columns or desired_order
+        self._data: dict[str, list] = {column: [] for column in self.columns}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, row: dict):
+        for column, values in self._data.items():
+            values.append(row.get(column))
+        self._rows += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def _build_column(self, values: list) -> pd.Series:
+        if all(value is None for value in values):
+            return pd.Series(values, dtype=object)
+        column = pd.Series(values)
+        if column.dtype == object:
+            column = column.where(column.notna(), np.nan)
+        return column
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Builds the DataFrame in desired_order sorted by site and most recent date
+        :return: Pandas DataFrame containing job data
+        """
+        if not self._rows:
+            return pd.DataFrame()
+        jobs_df = pd.DataFrame(
+            {column: self._build_column(self._data[column]) for column in self.columns}
+        )
+        return jobs_df.sort_values(
+            by=["site", "date_posted"], ascending=[True, False]
+        ).reset_index(drop=True)
+
+    def to_arrow(self):
+        """
+        Builds a pyarrow Table with the fixed jobspy.arrow.job_schema(), in the
+        to_dataframe row order
+        :return: pyarrow Table
+        """
+        from jobspy.arrow import table_from_columns
+
+        return table_from_columns(self._data)
@@ -1,27 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import math
-import re
-import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlencode, urlparse
 
-from bs4 import BeautifulSoup
-
+from jobspy.patterns import ZIP_RECRUITER_JOB_URL
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
     create_session,
-    markdown_converter,
     remove_attributes,
     create_logger,
+    trim_page,
+    get_rate_controller,
+    AsyncClient,
 )
 from jobspy.model import (
-    JobPost,
-    Compensation,
-    Location,
-    JobResponse,
+    JobRecord,
+    CompensationRecord,
+    LocationRecord,
     Country,
     DescriptionFormat,
     Scraper,
@@ -51,90 +52,222 @@ class ZipRecruiter(Scraper):
         self._get_cookies()
 
         self.delay = 5
+        self.rate_controller = get_rate_controller(
+            urlparse(self.api_url).netloc, initial_delay=self.delay
+        )
         self.jobs_per_page = 20
         self.seen_urls = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobRecord]]:
         """
-        Scrapes ZipRecruiter for jobs with scraper_input criteria.
+        Scrapes ZipRecruiter for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if job_count >= scraper_input.results_wanted:
                 break
-            if page > 1:
-                time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
+            if not jobs_on_page:
+                break
+            page_jobs = trim_page(
+                jobs_on_page, job_count, 0, scraper_input.results_wanted
+            )
+            job_count += len(jobs_on_page)
+            if page_jobs:
+                yield page_jobs
+            if not continue_token:
+                break
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput, client: AsyncClient
+    ) -> AsyncIterator[list[JobRecord]]:
+        """
+        Async variant of scrape_pages fetching the descriptions of a page concurrently
+        through client instead of a thread pool.
+        :param scraper_input: Information about job search criteria.
+        :param client: shared async HTTP client
+        :return: async iterator of the jobs on each page
+        """
+        self.scraper_input = scraper_input
+        await client.post(
+            f"{self.api_url}/jobs-app/event",
+            content=urlencode(get_cookie_data),
+            headers={**headers, "content-type": "application/x-www-form-urlencoded"},
+        )
+        job_count = 0
+        continue_token = None
+
+        max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
+        for page in range(1, max_pages + 1):
+            if job_count >= scraper_input.results_wanted:
+                break
+            log.info(f"search page: {page} / {max_pages}")
+            jobs_on_page, continue_token = await self._find_jobs_in_page_async(
+                scraper_input, client, continue_token
+            )
+            if not jobs_on_page:
                 break
+            page_jobs = trim_page(
+                jobs_on_page, job_count, 0, scraper_input.results_wanted
+            )
+            job_count += len(jobs_on_page)
+            if page_jobs:
+                yield page_jobs
             if not continue_token:
                 break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    ) -> tuple[list[JobRecord], str | None]:
         """
         Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
         :param scraper_input:
         :param continue_token:
         :return: jobs found on page
         """
-        jobs_list = []
         params = add_params(scraper_input)
         if continue_token:
             params["continue_from"] = continue_token
         try:
+            self.rate_controller.wait()
             res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
-            if res.status_code not in range(200, 400):
-                if res.status_code == 429:
-                    err = "429 Response - Blocked by ZipRecruiter for too many requests"
-                else:
-                    err = f"ZipRecruiter response status code {res.status_code}"
-                    err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
-                log.error(err)
-                return jobs_list, ""
+            self.rate_controller.record(res)
         except Exception as e:
-            if "Proxy responded with" in str(e):
-                log.error(f"Indeed: Bad proxy")
-            else:
-                log.error(f"Indeed: {str(e)}")
-            return jobs_list, ""
+            self._log_request_error(e)
+            return [], ""
+        jobs_list, next_continue_token = self._parse_jobs_page(res)
+        if not jobs_list:
+            return [], next_continue_token
 
-        res_data = res.json()
-        jobs_list = res_data.get("jobs", [])
-        next_continue_token = res_data.get("continue", None)
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             job_results = [executor.submit(self._process_job, job) for job in jobs_list]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    async def _find_jobs_in_page_async(
+        self,
+        scraper_input: ScraperInput,
+        client: AsyncClient,
+        continue_token: str | None = None,
+    ) -> tuple[list[JobRecord], str | None]:
+        """
+        Async variant of _find_jobs_in_page
+        """
+        params = add_params(scraper_input)
+        if continue_token:
+            params["continue_from"] = continue_token
+        try:
+            await self.rate_controller.wait_async()
+            res = await client.get(
+                f"{self.api_url}/jobs-app/jobs", params=params, headers=headers
+            )
+            self.rate_controller.record(res)
+        except Exception as e:
+            self._log_request_error(e)
+            return [], ""
+        jobs_list, next_continue_token = self._parse_jobs_page(res)
+        if not jobs_list:
+            return [], next_continue_token
+
+        job_results = await asyncio.gather(
+            *(self._process_job_async(job, client) for job in jobs_list)
+        )
+        return list(filter(None, job_results)), next_continue_token
+
+    def _parse_jobs_page(self, res) -> tuple[list[dict], str | None]:
+        """
+        Reads the raw jobs and the continue token out of a jobs-app search response
+        """
+        if res.status_code not in range(200, 400):
+            if res.status_code == 429:
+                err = "429 Response - Blocked by ZipRecruiter for too many requests"
+            else:
+                err = f"ZipRecruiter response status code {res.status_code}"
+                err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
+            log.error(err)
+            return [], ""
+        res_data = res.json()
+        return res_data.get("jobs", []), res_data.get("continue", None)
+
+    @staticmethod
+    def _log_request_error(e: Exception):
+        if "Proxy responded with" in str(e):
+            log.error(f"Indeed: Bad proxy")
+        else:
+            log.error(f"Indeed: {str(e)}")
+
+    def _process_job(self, job: dict) -> JobRecord | None:
         """
         Processes an individual job dict from the response
         """
-        title = job.get("name")
+        job_url = self._claim_job_url(job)
+        if not job_url:
+            return
+        if self._is_known(f"zr-{job['listing_key']}"):
+            return self._known_job(job, job_url)
+        description_full, job_url_direct = self._get_descr(job_url)
+        return self._parse_job(job, job_url, description_full, job_url_direct)
+
+    async def _process_job_async(
+        self, job: dict, client: AsyncClient
+    ) -> JobRecord | None:
+        """
+        Async variant of _process_job
+        """
+        job_url = self._claim_job_url(job)
+        if not job_url:
+            return
+        if self._is_known(f"zr-{job['listing_key']}"):
+            return self._known_job(job, job_url)
+        res = await self._fetch_detail_async(
+            job_url, lambda: client.get(job_url, headers=headers)
+        )
+        description_full, job_url_direct = self._parse_descr(res)
+        return self._parse_job(job, job_url, description_full, job_url_direct)
+
+    def _known_job(self, job: dict, job_url: str) -> JobRecord | None:
+        """
+        Search-card data only for a job in known_ids, or None when skipping those
+        """
+        if self.scraper_input.skip_known:
+            return None
+        return self._parse_job(job, job_url, None, None)
+
+    def _claim_job_url(self, job: dict) -> str | None:
+        """
+        Returns the job url, or None if the job was already seen
+        """
         job_url = f"{self.base_url}/jobs//j?lvk={job['listing_key']}"
         if job_url in self.seen_urls:
-            return
+            return None
         self.seen_urls.add(job_url)
+        return job_url
 
+    def _parse_job(
+        self,
+        job: dict,
+        job_url: str,
+        description_full: str | None,
+        job_url_direct: str | None,
+    ) -> JobRecord:
+        """
+        Builds the JobRecord from the search result and its job page details
+        """
+        title = job.get("name")
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
         description = (
-            markdown_converter(description)
+            self._markdown(description)
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
             else description
         )
@@ -142,7 +275,7 @@ class ZipRecruiter(Scraper):
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
 
-        location = Location(
+        location = LocationRecord(
             city=job.get("job_city"), state=job.get("job_state"), country=country_enum
         )
         job_type = get_job_type_enum(
@@ -154,15 +287,14 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        return JobRecord(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
             location=location,
             job_type=job_type,
-            compensation=Compensation(
+            compensation=CompensationRecord(
                 interval=comp_interval,
                 min_amount=comp_min,
                 max_amount=comp_max,
@@ -177,12 +309,20 @@ class ZipRecruiter(Scraper):
         )
 
     def _get_descr(self, job_url):
-        res = self.session.get(job_url, allow_redirects=True)
+        res = self._fetch_detail(
+            job_url, lambda: self.session.get(job_url, allow_redirects=True)
+        )
+        return self._parse_descr(res)
+
+    def _parse_descr(self, res) -> tuple[str | None, str | None]:
+        """
+        Extracts the full description and direct job url from a job page response
+        """
         description_full = job_url_direct = None
-        if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
+        if res.status_code in range(200, 400):
+            soup = self._parse_html(res.text)
+            job_descr_div = soup.select_one("div.job_description")
+            company_descr_section = soup.select_one("section.company_description")
             job_description_clean = (
                 remove_attributes(job_descr_div).prettify(formatter="html")
                 if job_descr_div
@@ -196,18 +336,18 @@ class ZipRecruiter(Scraper):
             description_full = job_description_clean + company_description_clean
 
             try:
-                script_tag = soup.find("script", type="application/json")
+                script_tag = soup.select_one('script[type="application/json"]')
                 if script_tag:
                     job_json = json.loads(script_tag.string)
                     job_url_val = job_json["model"].get("saveJobURL", "")
-                    m = re.search(r"job_url=(.+)", job_url_val)
+                    m = ZIP_RECRUITER_JOB_URL.search(job_url_val)
                     if m:
                         job_url_direct = m.group(1)
             except:
                 job_url_direct = None
 
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
+                description_full = self._markdown(description_full)
 
         return description_full, job_url_direct
 
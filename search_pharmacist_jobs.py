@@ -12,11 +12,18 @@ import pandas as pd
 # Add the current directory to Python path so we can import jobspy
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from jobspy import scrape_jobs
+from jobspy import scrape_jobs, BloomFilter, JobArchive, upload_batches, write_parquet
+from jobspy.dedupe import drop_near_duplicates, drop_url_duplicates
+from jobspy.transform import (
+    Coalesce, Constant, Copy, Default, Flag, Integer, Keep, Normalize, Rename, Slug, Text,
+    to_table_rows,
+)
+from jobspy.util import annualize_salaries
 
 # Try to import Supabase (optional)
 try:
     from supabase import create_client, Client
+    from postgrest import ReturnMethod
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
@@ -31,6 +38,64 @@ if os.getenv("SUPABASE_FIELD_MAPPING"):
     import json
     FIELD_MAPPING = json.loads(os.getenv("SUPABASE_FIELD_MAPPING"))
 
+# Company values that are placeholders rather than names
+PLACEHOLDER_COMPANIES = frozenset({"", "n/a", "none", "null", "company"})
+
+# Values allowed by the jobs table's job_type / salary_type check constraints;
+# unknown job types are left out (NULL) rather than failing the insert
+JOB_TYPES = {
+    **dict.fromkeys(["fulltime", "full-time", "full time", "ft"], "full-time"),
+    **dict.fromkeys(["parttime", "part-time", "part time", "pt"], "part-time"),
+    **dict.fromkeys(["contract", "contractor", "contractual"], "contract"),
+    **dict.fromkeys(["temporary", "temp"], "temporary"),
+    **dict.fromkeys(["internship", "intern"], "internship"),
+    **dict.fromkeys(["per-diem", "perdiem", "per diem"], "per-diem"),
+}
+# Amounts are annualized before upload, so anything but hourly pay is yearly
+SALARY_TYPES = {
+    **dict.fromkeys(["hourly", "hour", "hr", "hrly"], "hourly"),
+    **dict.fromkeys(["yearly", "annual", "year", "yr"], "yearly"),
+    **dict.fromkeys(["monthly", "month", "mo", "weekly", "week", "wk", "daily", "day"], "yearly"),
+    **dict.fromkeys(["none", "null"], None),
+}
+
+# Columns of the jobs table we fill (the scraper's id is not the table's id)
+JOBS_TABLE_COLUMNS = [
+    "title", "slug", "description", "company_id", "company_name", "requirements",
+    "benefits", "salary_min", "salary_max", "salary_type", "job_type",
+    "experience_level", "schedule_flexibility", "application_url",
+    "application_email", "status", "is_featured", "posted_by", "posted_at",
+    "approved_at", "expires_at", "created_at", "updated_at",
+]
+
+# How scrape results become jobs table rows, applied in order to whole columns
+JOBS_TABLE_STEPS = [
+    Normalize("salary_type", SALARY_TYPES, unknown="yearly", source="interval"),
+    # Prefer job_url_direct (more direct link to the application)
+    Coalesce("application_url", ("job_url_direct", "job_url")),
+    Copy("posted_at", "date_posted"),
+    # Approved so jobs appear immediately
+    Default("status", "approved"),
+    Normalize("job_type", JOB_TYPES),
+    Normalize("salary_type", SALARY_TYPES, unknown="yearly"),
+    Flag("is_featured", "is_remote"),
+    Integer("salary_min", "min_amount"),
+    Integer("salary_max", "max_amount"),
+    # description and title are NOT NULL
+    Default("description", "No description available."),
+    Default("title", "Untitled Job"),
+    Slug("slug", "title", max_length=100, fallback="untitled-job"),
+    Keep(JOBS_TABLE_COLUMNS),
+]
+
+# Optional: Bloom filter file of job ids seen by earlier runs (e.g. JOBSPY_KNOWN_IDS=.cache/known_ids.bloom)
+# Jobs already in it are skipped before their detail pages are fetched
+KNOWN_IDS_PATH = os.getenv("JOBSPY_KNOWN_IDS")
+known_ids = KNOWN_IDS_PATH if KNOWN_IDS_PATH and os.path.exists(KNOWN_IDS_PATH) else None
+
+# Optional: SQLite archive keeping every run's jobs with first/last seen times (e.g. JOBSPY_ARCHIVE=.cache/jobs.sqlite)
+ARCHIVE_PATH = os.getenv("JOBSPY_ARCHIVE")
+
 # Search for remote pharmacist jobs
 print("Searching for remote pharmacist jobs...")
 try:
@@ -41,9 +106,13 @@ try:
         is_remote=True,  # Filter for remote jobs only
         results_wanted=50,  # Get more results per site
         hours_old=720,  # Only jobs from last 30 days (720 hours) - applies to most sites
-        country_indeed='USA',
+        country_indeed="USA",
         linkedin_fetch_description=True,  # Fetch full descriptions from LinkedIn (slower but gets descriptions)
         verbose=1,  # Show progress
+        # Reuse job detail pages fetched by earlier runs (e.g. JOBSPY_RESPONSE_CACHE=.cache/jobspy.sqlite)
+        response_cache=os.getenv("JOBSPY_RESPONSE_CACHE") or None,
+        known_ids=known_ids,
+        skip_known=True,  # Known jobs are already stored, don't re-upload card-only rows
     )
 except Exception as e:
     import traceback
@@ -56,29 +125,29 @@ except Exception as e:
 
 print(f"\nFound {len(jobs)} remote pharmacist jobs")
 
-# Remove duplicates within this scrape (same application_url)
+# Remove duplicates within this scrape: the same posting reached through several sites'
+# URLs (job_url_direct / job_url), compared without tracking parameters
 if len(jobs) > 0:
     try:
-        # Check if application_url column exists
-        if 'application_url' in jobs.columns:
-            initial_count = len(jobs)
-            jobs = jobs.drop_duplicates(subset=['application_url'], keep='first')
-            duplicates_removed = initial_count - len(jobs)
-            if duplicates_removed > 0:
-                print(f"Removed {duplicates_removed} duplicate jobs (same application_url)")
-            print(f"Unique jobs after deduplication: {len(jobs)}")
-        else:
-            # If application_url doesn't exist yet, use job_url for deduplication
-            if 'job_url' in jobs.columns:
-                initial_count = len(jobs)
-                jobs = jobs.drop_duplicates(subset=['job_url'], keep='first')
-                duplicates_removed = initial_count - len(jobs)
-                if duplicates_removed > 0:
-                    print(f"Removed {duplicates_removed} duplicate jobs (same job_url)")
-                print(f"Unique jobs after deduplication: {len(jobs)}")
+        initial_count = len(jobs)
+        jobs = drop_url_duplicates(jobs)
+        duplicates_removed = initial_count - len(jobs)
+        if duplicates_removed > 0:
+            print(f"Removed {duplicates_removed} duplicate jobs (same posting URL)")
+        print(f"Unique jobs after deduplication: {len(jobs)}")
     except Exception as e:
         print(f"Warning: Error during deduplication: {e}")
         print("Continuing with all jobs...")
+
+    # Remove the same posting syndicated across sites under different URLs
+    try:
+        initial_count = len(jobs)
+        jobs = drop_near_duplicates(jobs)
+        duplicates_removed = initial_count - len(jobs)
+        if duplicates_removed > 0:
+            print(f"Removed {duplicates_removed} near-duplicate jobs posted on several sites")
+    except Exception as e:
+        print(f"Warning: Error during near-duplicate detection: {e}")
     
     # Sort by date_posted (most recent first)
     try:
@@ -113,6 +182,7 @@ if len(jobs) > 0:
 if len(jobs) > 0:
     csv_file = "pharmacist_remote_jobs.csv"
     json_file = "pharmacist_remote_jobs.json"
+    parquet_file = "pharmacist_remote_jobs.parquet"
     
     # Save as CSV
     jobs.to_csv(csv_file, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", index=False)
@@ -123,8 +193,25 @@ if len(jobs) > 0:
     with open(json_file, 'w') as f:
         json.dump(json.loads(jobs_json), f, indent=2)
     print(f"Results saved to {json_file}")
+
+    # Save as Parquet (needs pyarrow) - dictionary-encoded and compressed, much
+    # smaller than the CSV and faster to read back for analytics
+    try:
+        write_parquet(jobs, parquet_file)
+        print(f"Results saved to {parquet_file}")
+    except ImportError:
+        pass
+
+    # Merge this run into the archive; the CSV/JSON/Parquet files only hold the latest run
+    if ARCHIVE_PATH:
+        archive = JobArchive(ARCHIVE_PATH)
+        run_id = archive.add_run(jobs)
+        new_jobs = archive.new_jobs(run_id, columns=["key"])
+        print(f"Archived run {run_id} in {ARCHIVE_PATH}: {len(new_jobs)} jobs new since the last run, {len(archive)} in total")
+        archive.close()
     
     # Upload to Supabase if configured
+    upload_failed = False
     supabase_url = os.getenv("SUPABASE_URL")
     supabase_key = os.getenv("SUPABASE_KEY")
     
@@ -132,358 +219,31 @@ if len(jobs) > 0:
         try:
             supabase: Client = create_client(supabase_url, supabase_key)
             
-            # Convert DataFrame to list of dicts for Supabase
-            jobs_list = json.loads(jobs_json)
-            
-            # Add metadata and clean up None values, apply field mapping
-            scraped_time = datetime.utcnow().isoformat()
-            processed_jobs = []
-            for job in jobs_list:
-                # Clean up None/NaN values
-                cleaned_job = {}
-                for key, value in job.items():
-                    if value != value or value is None:  # Check for NaN
-                        cleaned_job[key] = None
-                    else:
-                        cleaned_job[key] = value
-                
-                # Add scraped_at timestamp
-                cleaned_job['scraped_at'] = scraped_time
-                
-                # Apply field mapping if configured
-                if FIELD_MAPPING:
-                    mapped_job = {}
-                    for key, value in cleaned_job.items():
-                        new_key = FIELD_MAPPING.get(key, key)
-                        mapped_job[new_key] = value
-                    processed_jobs.append(mapped_job)
-                else:
-                    processed_jobs.append(cleaned_job)
-            
-            jobs_list = processed_jobs
-            
             # Upsert jobs (insert or update if exists)
             # Table name can be configured via environment variable
             table_name = os.getenv("SUPABASE_TABLE_NAME", "pharmacist_jobs")
-            
-            # Transform jobs for custom schema if needed
-            transformed_jobs = []
-            for job in jobs_list:
-                transformed_job = {}
-
-                # Apply field mapping if configured
-                if FIELD_MAPPING:
-                    for key, value in job.items():
-                        new_key = FIELD_MAPPING.get(key, key)
-                        transformed_job[new_key] = value
-                else:
-                    transformed_job = job.copy()
-
-                # Map company to company_name BEFORE other transformations
-                # The scraper outputs "company" in the DataFrame (mapped from company_name in JobPost)
-                # Check both original job and transformed_job for company field
-                company_name = None
-                if "company" in job:
-                    company_name = job.get("company")
-                elif "company" in transformed_job:
-                    company_name = transformed_job.get("company")
-                elif "company_name" in job:
-                    company_name = job.get("company_name")
-                elif "company_name" in transformed_job:
-                    company_name = transformed_job.get("company_name")
-                
-                # Set company_name if we found a valid company value
-                # Filter out common placeholder values
-                if company_name:
-                    company_str = str(company_name).strip()
-                    if company_str and company_str.lower() not in ["n/a", "none", "null", "", "company"]:
-                        transformed_job["company_name"] = company_str
-                        # Debug: print first few company names to verify
-                        if len(transformed_jobs) < 5:
-                            print(f"   ✓ Mapped company: '{company_str}' -> company_name")
-                    elif len(transformed_jobs) < 5:
-                        print(f"   ⚠ Skipped invalid company value: '{company_str}'")
-                elif len(transformed_jobs) < 5:
-                    print(f"   ⚠ No company field found in job data")
-
-                # Custom transformations for jobs table schema
-                if table_name == "jobs":
-                    # Map interval to salary_type BEFORE other transformations
-                    if "interval" in transformed_job and "salary_type" not in transformed_job:
-                        interval = transformed_job.pop("interval", None)
-                        if interval:
-                            interval_lower = str(interval).lower()
-                            if interval_lower in ["hourly", "hour", "hr"]:
-                                transformed_job["salary_type"] = "hourly"
-                            elif interval_lower in ["yearly", "annual", "year"]:
-                                transformed_job["salary_type"] = "yearly"
-                            elif interval_lower in ["monthly", "month"]:
-                                # Convert to yearly and adjust salary
-                                transformed_job["salary_type"] = "yearly"
-                                if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                    transformed_job["salary_min"] = transformed_job["salary_min"] * 12
-                                if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                    transformed_job["salary_max"] = transformed_job["salary_max"] * 12
-                            elif interval_lower in ["weekly", "week"]:
-                                # Convert to yearly and adjust salary
-                                transformed_job["salary_type"] = "yearly"
-                                if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                    transformed_job["salary_min"] = transformed_job["salary_min"] * 52
-                                if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                    transformed_job["salary_max"] = transformed_job["salary_max"] * 52
-                            elif interval_lower in ["daily", "day"]:
-                                # Convert to yearly and adjust salary (260 working days)
-                                transformed_job["salary_type"] = "yearly"
-                                if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                    transformed_job["salary_min"] = transformed_job["salary_min"] * 260
-                                if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                    transformed_job["salary_max"] = transformed_job["salary_max"] * 260
-                            else:
-                                transformed_job["salary_type"] = "yearly"  # Default
-
-                    # Map job_url or job_url_direct to application_url
-                    # Prefer job_url_direct if available (more direct link to application)
-                    if "application_url" not in transformed_job:
-                        if "job_url_direct" in transformed_job and transformed_job.get("job_url_direct"):
-                            # Use job_url_direct if it has a value
-                            transformed_job["application_url"] = transformed_job["job_url_direct"]
-                        elif "job_url" in transformed_job and transformed_job.get("job_url"):
-                            # Fall back to job_url if job_url_direct is not available
-                            transformed_job["application_url"] = transformed_job["job_url"]
-                    
-                    # Always remove job_url and job_url_direct for jobs table (columns don't exist)
-                    transformed_job.pop("job_url", None)
-                    transformed_job.pop("job_url_direct", None)
 
-                    # Generate slug from title if not present
-                    if "slug" not in transformed_job and "title" in transformed_job:
-                        import re
-                        title = transformed_job.get("title", "")
-                        slug = re.sub(r"[^\w\s-]", "", title.lower())
-                        slug = re.sub(r"[-\s]+", "-", slug)
-                        transformed_job["slug"] = slug[:100]  # Limit length
-
-                    # Map date_posted to posted_at
-                    if "date_posted" in transformed_job and "posted_at" not in transformed_job:
-                        transformed_job["posted_at"] = transformed_job.pop("date_posted", None)
-
-                    # Set default status if not present - set to approved so jobs appear immediately
-                    if "status" not in transformed_job:
-                        transformed_job["status"] = "approved"
-                    
-                    # Ensure description is never null (required field)
-                    if "description" not in transformed_job or not transformed_job.get("description"):
-                        transformed_job["description"] = "No description available."
-
-                    # Normalize job_type - must match database check constraint
-                    # TEMPORARY: If we can't match known values, remove it to avoid constraint errors
-                    # TODO: Update this once we know the exact allowed values from constraint
-                    if "job_type" in transformed_job:
-                        job_type = transformed_job["job_type"]
-                        if job_type:
-                            job_type = str(job_type).lower().strip()
-                            # Normalize common variations - try to match database constraint
-                            # Common allowed values might be: 'full-time', 'part-time', 'contract', etc.
-                            if job_type in ["fulltime", "full-time", "full time", "ft", "fulltime"]:
-                                transformed_job["job_type"] = "full-time"
-                            elif job_type in ["parttime", "part-time", "part time", "pt"]:
-                                transformed_job["job_type"] = "part-time"
-                            elif job_type in ["contract", "contractor", "contractual"]:
-                                transformed_job["job_type"] = "contract"
-                            elif job_type in ["temporary", "temp"]:
-                                transformed_job["job_type"] = "temporary"
-                            elif job_type in ["internship", "intern"]:
-                                transformed_job["job_type"] = "internship"
-                            elif job_type in ["per-diem", "perdiem", "per diem", "perdiem"]:
-                                transformed_job["job_type"] = "per-diem"
-                            else:
-                                # Unknown value - remove it to avoid constraint violation
-                                # Better to have NULL job_type than fail entire insert
-                                print(f"   Warning: Unknown job_type '{job_type}', removing to avoid constraint error")
-                                transformed_job.pop("job_type", None)
-                        else:
-                            # Remove if empty
-                            transformed_job.pop("job_type", None)
-
-                    # Normalize salary_type - database constraint only allows 'hourly' or 'yearly'
-                    # CHECK constraint: salary_type = ANY (ARRAY['hourly'::text, 'yearly'::text])
-                    if "salary_type" in transformed_job:
-                        salary_type = str(transformed_job.get("salary_type", "")).lower().strip()
-                        if salary_type in ["hourly", "hour", "hr", "hrly"]:
-                            transformed_job["salary_type"] = "hourly"
-                        elif salary_type in ["yearly", "annual", "year", "yr"]:
-                            transformed_job["salary_type"] = "yearly"
-                        elif salary_type in ["monthly", "month", "mo"]:
-                            # Convert monthly to yearly (multiply by 12)
-                            transformed_job["salary_type"] = "yearly"
-                            if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                transformed_job["salary_min"] = transformed_job["salary_min"] * 12
-                            if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                transformed_job["salary_max"] = transformed_job["salary_max"] * 12
-                        elif salary_type in ["weekly", "week", "wk"]:
-                            # Convert weekly to yearly (multiply by 52)
-                            transformed_job["salary_type"] = "yearly"
-                            if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                transformed_job["salary_min"] = transformed_job["salary_min"] * 52
-                            if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                transformed_job["salary_max"] = transformed_job["salary_max"] * 52
-                        elif salary_type in ["daily", "day"]:
-                            # Convert daily to yearly (multiply by 260 working days)
-                            transformed_job["salary_type"] = "yearly"
-                            if "salary_min" in transformed_job and transformed_job["salary_min"]:
-                                transformed_job["salary_min"] = transformed_job["salary_min"] * 260
-                            if "salary_max" in transformed_job and transformed_job["salary_max"]:
-                                transformed_job["salary_max"] = transformed_job["salary_max"] * 260
-                        elif not salary_type or salary_type == "none" or salary_type == "null":
-                            # Remove salary_type if invalid/empty (let it be NULL)
-                            transformed_job.pop("salary_type", None)
-                        else:
-                            # Unknown value - default to yearly
-                            print(f"   Warning: Unknown salary_type '{salary_type}', defaulting to yearly")
-                            transformed_job["salary_type"] = "yearly"
-
-                    # Map is_remote to is_featured if needed (or remove if not applicable)
-                    if "is_remote" in transformed_job:
-                        # Only set is_featured if is_remote is True
-                        if transformed_job.get("is_remote"):
-                            transformed_job["is_featured"] = True
-                        # Remove is_remote as it doesn't exist in jobs table
-                        transformed_job.pop("is_remote", None)
-
-                    # Map min_amount/max_amount to salary_min/salary_max and remove originals
-                    if "min_amount" in transformed_job and "salary_min" not in transformed_job:
-                        try:
-                            transformed_job["salary_min"] = int(transformed_job["min_amount"])
-                        except (TypeError, ValueError):
-                            transformed_job["salary_min"] = None
-                    if "max_amount" in transformed_job and "salary_max" not in transformed_job:
-                        try:
-                            transformed_job["salary_max"] = int(transformed_job["max_amount"])
-                        except (TypeError, ValueError):
-                            transformed_job["salary_max"] = None
-                    transformed_job.pop("min_amount", None)
-                    transformed_job.pop("max_amount", None)
-
-                    # Remove fields that don't exist in jobs table (including interval)
-                    # Note: company_name was already mapped above, so we remove "company" here
-                    fields_to_remove = [
-                        "site",
-                        "job_url_direct",
-                        "location",
-                        "salary_source",
-                        "currency",
-                        "job_level",
-                        "job_function",
-                        "listing_type",
-                        "emails",
-                        "company_industry",
-                        "company_url",
-                        "company_logo",
-                        "company_url_direct",
-                        "company_addresses",
-                        "company_num_employees",
-                        "company_revenue",
-                        "company_description",
-                        "skills",
-                        "experience_range",
-                        "company_rating",
-                        "company_reviews_count",
-                        "vacancy_count",
-                        "work_from_home_type",
-                        "company",  # Remove original company field
-                        "id",
-                        "interval",
-                        "scraped_at",
-                    ]  # Added interval and scraped_at
-                    for field in fields_to_remove:
-                        transformed_job.pop(field, None)
+            # Reshape the DataFrame column by column into the table's rows (see
+            # JOBS_TABLE_STEPS), most recent posting first
+            # The jobs table only stores hourly or yearly pay, so monthly/weekly/daily
+            # amounts are annualized for the whole frame up front
+            upload_jobs = jobs
+            steps = [
+                Constant("scraped_at", datetime.utcnow().isoformat()),
+                Rename(FIELD_MAPPING),
+                # The scraper outputs "company" (mapped from company_name in JobPost)
+                Text("company_name", ("company", "company_name"), PLACEHOLDER_COMPANIES),
+            ]
+            if table_name == "jobs":
+                upload_jobs = annualize_salaries(jobs, keep_intervals=("hourly",))
+                steps += JOBS_TABLE_STEPS
+            transformed_jobs = to_table_rows(
+                upload_jobs, steps, sort_by=("posted_at", "date_posted")
+            )
+            with_company = sum(1 for job in transformed_jobs if job.get("company_name"))
+            print(f"   Mapped company -> company_name for {with_company} of {len(transformed_jobs)} jobs")
+            print(f"   Sorted {len(transformed_jobs)} jobs by posted_at (most recent first)")
 
-                    # Ensure all required fields have values before whitelisting
-                    # Description is required (NOT NULL constraint)
-                    if "description" not in transformed_job or not transformed_job.get("description"):
-                        transformed_job["description"] = "No description available."
-                    
-                    # Title is likely required
-                    if "title" not in transformed_job or not transformed_job.get("title"):
-                        transformed_job["title"] = "Untitled Job"
-                    
-                    # Slug should already be generated, but ensure it exists
-                    if "slug" not in transformed_job or not transformed_job.get("slug"):
-                        import re
-                        title = transformed_job.get("title", "untitled-job")
-                        slug = re.sub(r"[^\w\s-]", "", title.lower())
-                        slug = re.sub(r"[-\s]+", "-", slug)
-                        transformed_job["slug"] = slug[:100] if slug else "untitled-job"
-                    
-                    # Whitelist only columns that exist in jobs table
-                    # Note: If your table has a company_name text field, add it here
-                    allowed_fields = {
-                        "id",
-                        "title",
-                        "slug",
-                        "description",
-                        "company_id",
-                        "company_name",  # Add if your jobs table has this field
-                        "requirements",
-                        "benefits",
-                        "salary_min",
-                        "salary_max",
-                        "salary_type",
-                        "job_type",
-                        "experience_level",
-                        "schedule_flexibility",
-                        "application_url",
-                        "application_email",
-                        "status",
-                        "is_featured",
-                        "posted_by",
-                        "posted_at",
-                        "approved_at",
-                        "expires_at",
-                        "created_at",
-                        "updated_at",
-                    }
-                    final_job = {k: v for k, v in transformed_job.items() if k in allowed_fields}
-                    
-                    # Safety: If job_type or salary_type might violate constraints, remove them
-                    # Better to have NULL than fail the entire insert
-                    # (We'll fix the exact values once we know the constraints)
-                    if "job_type" in final_job and final_job["job_type"]:
-                        # Keep it for now, but we'll need to validate against actual constraint
-                        pass
-                    if "salary_type" in final_job and final_job["salary_type"]:
-                        # Already validated above to only be 'hourly' or 'yearly'
-                        pass
-                    
-                    transformed_jobs.append(final_job)
-                else:
-                    transformed_jobs.append(transformed_job)
-            
-            # Sort transformed jobs by posted_at (most recent first) before uploading
-            try:
-                def get_posted_at(job):
-                    """Extract posted_at or date_posted as datetime, return None if not available"""
-                    posted_at = job.get('posted_at') or job.get('date_posted')
-                    if not posted_at:
-                        return None
-                    try:
-                        # Use pandas to parse the date (handles various formats)
-                        parsed = pd.to_datetime(posted_at, errors='coerce')
-                        if pd.isna(parsed):
-                            return None
-                        return parsed.to_pydatetime() if hasattr(parsed, 'to_pydatetime') else parsed
-                    except:
-                        return None
-                
-                # Sort by posted_at descending (most recent first), None values go last
-                transformed_jobs.sort(
-                    key=lambda x: get_posted_at(x) or datetime.min,
-                    reverse=True
-                )
-                print(f"   Sorted {len(transformed_jobs)} jobs by posted_at (most recent first)")
-            except Exception as e:
-                print(f"   Warning: Could not sort jobs by date: {e}")
-            
             # For jobs table, insert without explicit on_conflict
             # (primary key/constraints will handle uniqueness)
             print(f"\n📤 Uploading {len(transformed_jobs)} jobs to Supabase...")
@@ -491,41 +251,41 @@ if len(jobs) > 0:
             if transformed_jobs:
                 print(f"   Sample job keys: {list(transformed_jobs[0].keys())[:10]}")
 
-            if table_name == "jobs":
-                # Use application_url for conflict resolution (prevents duplicates)
-                # Requires unique constraint on application_url - see ADD_UNIQUE_CONSTRAINT.sql
-                try:
-                    response = supabase.table(table_name).upsert(
-                        transformed_jobs,
-                        on_conflict="application_url"
-                    ).execute()
-                except Exception as conflict_error:
-                    # If constraint doesn't exist yet, fall back to regular insert
-                    if "unique" in str(conflict_error).lower() or "constraint" in str(conflict_error).lower():
-                        print(f"   Note: Unique constraint on application_url not found. Run ADD_UNIQUE_CONSTRAINT.sql first.")
-                        print(f"   Inserting without conflict resolution (may create duplicates)...")
-                        response = supabase.table(table_name).insert(transformed_jobs).execute()
-                    else:
-                        raise
-            else:
-                # Determine conflict key for other tables
-                conflict_key = "job_url"
-                response = supabase.table(table_name).upsert(
-                    transformed_jobs,
+            # Upload in batches: bounded requests, a few in flight, transient errors
+            # retried and rejected batches split so only the bad rows are left out
+            # The jobs table resolves conflicts on application_url, which needs the
+            # unique constraint from ADD_UNIQUE_CONSTRAINT.sql. Without it the upsert
+            # fails with 42P10 and the upload stops: plain inserts are not retried,
+            # as a resent batch the server had already stored would be duplicated
+            conflict_key = "application_url" if table_name == "jobs" else "job_url"
+
+            def send_batch(batch):
+                return supabase.table(table_name).upsert(
+                    batch,
                     on_conflict=conflict_key,
+                    returning=ReturnMethod.minimal,
                 ).execute()
 
-            # Check response
-            if hasattr(response, "data"):
-                inserted_count = len(response.data) if response.data else 0
-                print(f"\n✅ Successfully uploaded {inserted_count} jobs to Supabase")
-                print(f"   Table: {table_name}")
-                if response.data and len(response.data) > 0:
-                    print(f"   First job title: {response.data[0].get('title', 'N/A')}")
-            else:
-                print(f"\n✅ Upsert completed (response: {type(response)})")
-                print(f"   Table: {table_name}")
-            
+            report = upload_batches(
+                transformed_jobs,
+                send_batch,
+                batch_size=int(os.getenv("SUPABASE_BATCH_SIZE", "500")),
+                max_in_flight=int(os.getenv("SUPABASE_MAX_IN_FLIGHT", "4")),
+            )
+            print(f"\n✅ Uploaded {report.uploaded} of {report.rows} jobs to Supabase")
+            print(f"   Table: {table_name}")
+            print(f"   Requests: {report.requests} ({report.retries} retries, {report.splits} splits)")
+            if report.error is not None:
+                # e.g. bad credentials, a missing table or column: nothing else was sent
+                print(f"\n❌ Upload stopped: {report.error}")
+                if getattr(report.error, "code", None) == "42P10":
+                    print(f"   No unique constraint on {conflict_key}. Run ADD_UNIQUE_CONSTRAINT.sql first, then run the upload again.")
+            if report.failed:
+                upload_failed = True
+                print(f"\n❌ {len(report.failed)} jobs were rejected:")
+                for row, error in report.failed[:10]:
+                    print(f"   {row.get('title', 'N/A')} ({row.get('application_url') or row.get('job_url')}): {error}")
+
         except Exception as e:
             import traceback
             print(f"\n❌ Error uploading to Supabase:")
@@ -534,10 +294,19 @@ if len(jobs) > 0:
             print(f"\n   Full traceback:")
             traceback.print_exc()
             print("\n   Continuing with local file saves...")
+            upload_failed = True
     elif supabase_url or supabase_key:
         print("\n⚠️  Supabase credentials found but client not installed.")
         print("   Install with: pip install supabase")
     
+    # Remember this run's jobs so the next run skips their detail pages
+    # (only once they are stored, so a failed upload is retried next time)
+    if KNOWN_IDS_PATH and not upload_failed:
+        bloom = BloomFilter.load(KNOWN_IDS_PATH) if known_ids else BloomFilter(capacity=200_000)
+        bloom.update(jobs["id"])
+        bloom.save(KNOWN_IDS_PATH)
+        print(f"Recorded {len(jobs)} job ids in {KNOWN_IDS_PATH}")
+
     # Show summary
     print(f"\nSummary:")
     print(f"  Total jobs found: {len(jobs)}")
@@ -548,4 +317,3 @@ if len(jobs) > 0:
         print("  No jobs found or site column missing.")
 else:
     print("\nNo jobs found. Try adjusting your search parameters.")
-